@@ -1,2 +1,5 @@
 MIN_GRADE: float = 0.0
-MAX_GRADE: float = 5.0
\ No newline at end of file
+MAX_GRADE: float = 5.0
+PASSING_GRADE: float = 3.0
+DEFAULT_OFFERING_CAPACITY: int = 40
+MAX_COURSE_PREFERENCES: int = 10
@@ -0,0 +1,96 @@
+from functools import wraps
+
+from django.core.exceptions import ValidationError
+from drf_yasg import openapi
+from rest_framework import status
+from rest_framework.response import Response
+
+from academics.services.idempotency_services import (
+    IN_PROGRESS,
+    REPLAY,
+    claim_idempotency_key,
+    release_idempotency_key,
+    request_fingerprint,
+    store_idempotent_response,
+)
+
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+IDEMPOTENT_REPLAYED_HEADER = "Idempotent-Replayed"
+MAX_KEY_LENGTH = 255
+
+IDEMPOTENCY_KEY_PARAMETER = openapi.Parameter(
+    IDEMPOTENCY_KEY_HEADER,
+    openapi.IN_HEADER,
+    description=(
+        "Unique key chosen by the client (e.g. a UUID). Retrying with the same key "
+        "returns the first response instead of repeating the operation"
+    ),
+    type=openapi.TYPE_STRING,
+    required=False,
+)
+
+
+def idempotent(view_method):
+    """
+    Make an APIView POST handler honour the `Idempotency-Key` header.
+
+    - Without the header the handler runs as usual.
+    - The first request with a key runs the handler and stores its response
+      for the authenticated user.
+    - A retry with the same key and body gets the stored response, marked with
+      `Idempotent-Replayed: true`, without running the handler again.
+    - A retry while the first request is still running gets 409. Reusing a
+      key with a different body gets 422.
+
+    5xx responses and unhandled errors are not stored, so the client can
+    retry them with the same key.
+    """
+
+    @wraps(view_method)
+    def wrapper(self, request, *args, **kwargs):
+        key = request.headers.get(IDEMPOTENCY_KEY_HEADER)
+        if key is None:
+            return view_method(self, request, *args, **kwargs)
+
+        if not 0 < len(key) <= MAX_KEY_LENGTH:
+            return Response(
+                {
+                    "is_ok": False,
+                    "error": f"{IDEMPOTENCY_KEY_HEADER} must have between 1 and {MAX_KEY_LENGTH} characters.",
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            claim = claim_idempotency_key(
+                request.user, key, request_fingerprint(request.method, request.path, request.data)
+            )
+        except ValidationError as e:
+            return Response(
+                {"is_ok": False, "error": str(e)},
+                status=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            )
+
+        if claim.state == IN_PROGRESS:
+            return Response(
+                {"is_ok": False, "error": "A request with this Idempotency-Key is still being processed."},
+                status=status.HTTP_409_CONFLICT,
+            )
+        if claim.state == REPLAY:
+            response = Response(claim.record.response_body, status=claim.record.status_code)
+            response[IDEMPOTENT_REPLAYED_HEADER] = "true"
+            return response
+
+        try:
+            response = view_method(self, request, *args, **kwargs)
+        except Exception:
+            release_idempotency_key(claim.record)
+            raise
+
+        if response.status_code >= 500:
+            release_idempotency_key(claim.record)
+        else:
+            store_idempotent_response(claim.record, response.status_code, response.data)
+        return response
+
+    return wrapper
@@ -0,0 +1,343 @@
+import random
+import time
+from decimal import Decimal
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from academics.constants import DEFAULT_OFFERING_CAPACITY
+from academics.models import (
+    Course,
+    CourseOffering,
+    Semester,
+    StudentEnrollment,
+    StudentLoadSemester,
+    TeacherLoadSemester,
+)
+from academics.services.catalog_services import bump_catalog_version
+from academics.services.prerequisite_services import rebuild_prerequisite_closure
+from academics.services.seat_services import rebuild_seat_counters
+from core.db import bulk_insert
+from users.models import StudentProfile, TeacherProfile, User
+
+# Courses are grouped in departments of LEVELS x COURSES_PER_LEVEL courses.
+# A course only requires courses of the previous level of its own department,
+# which keeps the prerequisite DAG (and its closure table) realistic in size.
+LEVELS = 10
+COURSES_PER_LEVEL = 5
+COURSES_PER_DEPARTMENT = LEVELS * COURSES_PER_LEVEL
+COURSE_CREDITS = (2, 3, 3, 4)
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate a deterministic synthetic university (users, courses with a "
+        "prerequisite DAG, semesters, loads, offerings and graded enrollments) "
+        "for load testing."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--seed", type=int, default=42, help="Random seed; the same seed produces the same data.")
+        parser.add_argument("--students", type=int, default=50_000)
+        parser.add_argument("--teachers", type=int, default=2_000)
+        parser.add_argument("--courses", type=int, default=5_000)
+        parser.add_argument("--semesters", type=int, default=20)
+        parser.add_argument("--start-year", type=int, default=2016, help="Year of the first generated semester.")
+        parser.add_argument("--semesters-per-student", type=int, default=8)
+        parser.add_argument("--courses-per-load", type=int, default=5, help="Maximum enrollments per student and semester.")
+        parser.add_argument("--offering-ratio", type=float, default=0.4, help="Share of courses offered each semester.")
+        parser.add_argument("--offering-capacity", type=int, default=DEFAULT_OFFERING_CAPACITY, help="Seats per offering.")
+        parser.add_argument("--student-max-credits", type=int, default=20)
+        parser.add_argument("--teacher-max-credits", type=int, default=24)
+        parser.add_argument("--batch-size", type=int, default=5_000)
+        parser.add_argument("--prefix", default="gen", help="Prefix of generated usernames and course codes.")
+        parser.add_argument("--password", default="password", help="Password of every generated user (hashed once).")
+
+    def handle(self, *args, **options):
+        for name in (
+            "students", "teachers", "courses", "semesters",
+            "semesters_per_student", "courses_per_load", "offering_capacity",
+        ):
+            if options[name] < 1:
+                raise CommandError(f"--{name.replace('_', '-')} must be at least 1.")
+        if not 0 < options["offering_ratio"] <= 1:
+            raise CommandError("--offering-ratio must be in (0, 1].")
+
+        prefix = options["prefix"]
+        if (
+            User.objects.filter(username__startswith=f"{prefix}_").exists()
+            or Course.objects.filter(code__startswith=f"{prefix.upper()}-").exists()
+        ):
+            raise CommandError(f"Data with prefix '{prefix}' already exists; use another --prefix.")
+
+        self.options = options
+        self.rng = random.Random(options["seed"])
+        self.stats: list[tuple[str, int, float]] = []
+        started = time.perf_counter()
+
+        with transaction.atomic():
+            semester_ids = self._create_semesters()
+            student_ids, teacher_ids = self._create_users()
+            courses = self._create_courses()
+            offered, sections = self._create_offerings(semester_ids, teacher_ids, courses)
+            self._create_enrollments(semester_ids, student_ids, courses, offered, sections)
+            self._timed("seat counters", rebuild_seat_counters)
+            self._timed("closure", lambda: rebuild_prerequisite_closure({course[0] for course in courses}))
+            bump_catalog_version()
+
+        elapsed = time.perf_counter() - started
+        total = sum(rows for _, rows, _ in self.stats)
+        for label, rows, seconds in self.stats:
+            self.stdout.write(f"  {label:<20} {rows:>10} rows in {seconds:8.2f}s ({rows / max(seconds, 1e-9):,.0f} rows/s)")
+        self.stdout.write(
+            self.style.SUCCESS(f"Generated {total} rows in {elapsed:.2f}s ({total / max(elapsed, 1e-9):,.0f} rows/s).")
+        )
+
+    def _timed(self, label, write):
+        start = time.perf_counter()
+        rows = write()
+        self.stats.append((label, rows, time.perf_counter() - start))
+        return rows
+
+    def _insert(self, label, model, fields, rows):
+        return self._timed(label, lambda: bulk_insert(model, fields, rows, self.options["batch_size"]))
+
+    def _create_semesters(self) -> list[int]:
+        start_year = self.options["start_year"]
+        start = time.perf_counter()
+        semester_ids = []
+        for index in range(self.options["semesters"]):
+            semester, _ = Semester.objects.get_or_create(year=start_year + index // 2, term=index % 2 + 1)
+            semester_ids.append(semester.id)
+        self.stats.append(("semesters", len(semester_ids), time.perf_counter() - start))
+        return semester_ids
+
+    def _create_users(self) -> tuple[list[int], list[int]]:
+        prefix = self.options["prefix"]
+        password = make_password(self.options["password"])
+
+        def create(role, count):
+            label = role.label.lower()
+            users = (
+                User(
+                    username=f"{prefix}_{label}_{index:06d}",
+                    email=f"{prefix}_{label}_{index:06d}@example.edu",
+                    password=password,
+                    role=role,
+                )
+                for index in range(count)
+            )
+            start = time.perf_counter()
+            ids = []
+            batch = []
+            for user in users:
+                batch.append(user)
+                if len(batch) >= self.options["batch_size"]:
+                    ids.extend(user.id for user in User.objects.bulk_create(batch))
+                    batch = []
+            ids.extend(user.id for user in User.objects.bulk_create(batch))
+            self.stats.append((f"{label} users", len(ids), time.perf_counter() - start))
+            return ids
+
+        student_ids = create(User.Role.STUDENT, self.options["students"])
+        teacher_ids = create(User.Role.TEACHER, self.options["teachers"])
+
+        departments = -(-self.options["courses"] // COURSES_PER_DEPARTMENT)
+        self._insert(
+            "student profiles",
+            StudentProfile,
+            ["user_id", "enrollment_number", "program"],
+            (
+                (user_id, f"{prefix.upper()}{index:08d}", f"Program {index % departments:03d}")
+                for index, user_id in enumerate(student_ids)
+            ),
+        )
+        self._insert(
+            "teacher profiles",
+            TeacherProfile,
+            ["user_id", "department"],
+            ((user_id, f"Department {index % departments:03d}") for index, user_id in enumerate(teacher_ids)),
+        )
+        return student_ids, teacher_ids
+
+    def _create_courses(self) -> list[tuple[int, int, int, int]]:
+        """
+        Create the courses and their prerequisite links.
+
+        Returns:
+            list[tuple[int, int, int, int]]: (id, credits, department, level) per course.
+        """
+        prefix = self.options["prefix"].upper()
+        rng = self.rng
+        start = time.perf_counter()
+        specs = []
+        for index in range(self.options["courses"]):
+            department, position = divmod(index, COURSES_PER_DEPARTMENT)
+            level, slot = divmod(position, COURSES_PER_LEVEL)
+            specs.append((department, level, Course(
+                code=f"{prefix}-{index:05d}",
+                name=f"Department {department:03d} - Level {level + 1} #{slot + 1}",
+                credits=rng.choice(COURSE_CREDITS),
+            )))
+
+        created = []
+        objs = [course for _, _, course in specs]
+        for offset in range(0, len(objs), self.options["batch_size"]):
+            created.extend(Course.objects.bulk_create(objs[offset:offset + self.options["batch_size"]]))
+        courses = [
+            (course.id, course.credits, department, level)
+            for (department, level, _), course in zip(specs, created)
+        ]
+        self.stats.append(("courses", len(courses), time.perf_counter() - start))
+
+        links = []
+        for index, (course_id, _, department, level) in enumerate(courses):
+            if level == 0:
+                continue
+            first = index - index % COURSES_PER_LEVEL - COURSES_PER_LEVEL
+            candidates = [courses[i][0] for i in range(first, first + COURSES_PER_LEVEL)]
+            for prerequisite_id in rng.sample(candidates, rng.randint(0, 2)):
+                links.append((course_id, prerequisite_id))
+        self._insert("prerequisite links", Course.prerequisites.through, ["from_course_id", "to_course_id"], links)
+        return courses
+
+    def _create_offerings(self, semester_ids, teacher_ids, courses) -> tuple[list, list]:
+        """
+        Offer a share of the courses each semester and assign them to teachers
+        without exceeding their credit limit.
+
+        Returns:
+            tuple[list, list]: Per semester, the offered course indexes by
+            department and the offering id of each offered course index.
+        """
+        rng = self.rng
+        max_credits = self.options["teacher_max_credits"]
+        offer_count = max(1, round(len(courses) * self.options["offering_ratio"]))
+        offerings = []
+        teacher_rows = []
+        offered = []
+
+        for semester_id in semester_ids:
+            credits_used = [0] * len(teacher_ids)
+            by_department: dict[int, list[int]] = {}
+            cursor = rng.randrange(len(teacher_ids))
+            for index in sorted(rng.sample(range(len(courses)), offer_count)):
+                course_id, credits, department, _ = courses[index]
+                for _ in range(len(teacher_ids)):
+                    cursor = (cursor + 1) % len(teacher_ids)
+                    if credits_used[cursor] + credits <= max_credits:
+                        break
+                else:
+                    continue
+                credits_used[cursor] += credits
+                offerings.append((index, CourseOffering(
+                    course_id=course_id,
+                    teacher_id=teacher_ids[cursor],
+                    semester_id=semester_id,
+                    capacity=self.options["offering_capacity"],
+                )))
+                by_department.setdefault(department, []).append(index)
+            offered.append(by_department)
+            teacher_rows.extend(
+                (teacher_id, semester_id, max_credits, used)
+                for teacher_id, used in zip(teacher_ids, credits_used)
+            )
+
+        start = time.perf_counter()
+        batch_size = self.options["batch_size"]
+        semester_index = {semester_id: position for position, semester_id in enumerate(semester_ids)}
+        sections: list[dict[int, int]] = [{} for _ in semester_ids]
+        for offset in range(0, len(offerings), batch_size):
+            batch = offerings[offset:offset + batch_size]
+            CourseOffering.objects.bulk_create([offering for _, offering in batch])
+            for index, offering in batch:
+                sections[semester_index[offering.semester_id]][index] = offering.id
+        self.stats.append(("course offerings", len(offerings), time.perf_counter() - start))
+        self._insert(
+            "teacher loads",
+            TeacherLoadSemester,
+            ["teacher_id", "semester_id", "max_credits", "credits_used"],
+            teacher_rows,
+        )
+        return offered, sections
+
+    def _create_enrollments(self, semester_ids, student_ids, courses, offered, sections) -> None:
+        """
+        Give every student a run of consecutive semesters in which they take
+        courses of their program around their current level, plus electives.
+        Full offerings are skipped. Every semester but the last one is graded.
+        """
+        rng = self.rng
+        options = self.options
+        batch_size = options["batch_size"]
+        max_credits = options["student_max_credits"]
+        capacity = options["offering_capacity"]
+        seats_taken: dict[int, int] = {}
+        departments = -(-len(courses) // COURSES_PER_DEPARTMENT)
+        current = len(semester_ids) - 1
+        loads: list[tuple] = []
+        enrollments: list[tuple] = []
+        load_count = enrollment_count = 0
+        load_seconds = enrollment_seconds = 0.0
+
+        def flush(force=False):
+            nonlocal loads, enrollments, load_count, enrollment_count, load_seconds, enrollment_seconds
+            if loads and (force or len(loads) >= batch_size):
+                start = time.perf_counter()
+                load_count += bulk_insert(
+                    StudentLoadSemester, ["student_id", "semester_id", "max_credits", "credits_used"], loads, batch_size
+                )
+                load_seconds += time.perf_counter() - start
+                loads = []
+            if enrollments and (force or len(enrollments) >= batch_size):
+                start = time.perf_counter()
+                enrollment_count += bulk_insert(
+                    StudentEnrollment,
+                    ["student_id", "semester_id", "course_id", "offering_id", "grade"],
+                    enrollments,
+                    batch_size,
+                )
+                enrollment_seconds += time.perf_counter() - start
+                enrollments = []
+
+        for index, student_id in enumerate(student_ids):
+            program = index % departments
+            first_semester = rng.randrange(len(semester_ids))
+            last_semester = min(first_semester + options["semesters_per_student"], len(semester_ids))
+            for level, semester_index in enumerate(range(first_semester, last_semester)):
+                semester_id = semester_ids[semester_index]
+                by_department = offered[semester_index]
+                candidates = [
+                    course_index for course_index in by_department.get(program, [])
+                    if level - 1 <= courses[course_index][3] <= level + 1
+                ]
+                rng.shuffle(candidates)
+                elective_department = rng.randrange(departments)
+                candidates += [
+                    course_index for course_index in by_department.get(elective_department, [])
+                    if courses[course_index][3] <= 1 and elective_department != program
+                ][:2]
+
+                credits_used = 0
+                taken = 0
+                for course_index in candidates:
+                    course_id, credits, _, _ = courses[course_index]
+                    if taken == options["courses_per_load"] or credits_used + credits > max_credits:
+                        break
+                    offering_id = sections[semester_index][course_index]
+                    if seats_taken.get(offering_id, 0) == capacity:
+                        continue
+                    seats_taken[offering_id] = seats_taken.get(offering_id, 0) + 1
+                    grade = None
+                    if semester_index != current:
+                        grade = Decimal(str(round(min(5.0, max(0.0, rng.gauss(3.6, 0.8))), 1)))
+                    enrollments.append((student_id, semester_id, course_id, offering_id, grade))
+                    credits_used += credits
+                    taken += 1
+                loads.append((student_id, semester_id, max_credits, credits_used))
+            flush()
+
+        flush(force=True)
+        self.stats.append(("student loads", load_count, load_seconds))
+        self.stats.append(("enrollments", enrollment_count, enrollment_seconds))
@@ -0,0 +1,38 @@
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+
+from academics.services.course_offering_services import get_course_offering_by_id
+from academics.services.grade_student_services import import_grades_from_csv
+
+
+class Command(BaseCommand):
+    help = (
+        "Import the grades of a course offering from a CSV file with "
+        "student_id and grade columns."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("offering_id", type=int, help="ID of the course offering to grade.")
+        parser.add_argument("csv_path", help="Path to the CSV file.")
+
+    def handle(self, *args, **options):
+        try:
+            offering = get_course_offering_by_id(options["offering_id"])
+            with open(options["csv_path"], newline="", encoding="utf-8-sig") as csv_file:
+                result = import_grades_from_csv(
+                    teacher=offering.teacher,
+                    offering=offering,
+                    lines=csv_file,
+                )
+        except (ValidationError, OSError) as e:
+            raise CommandError(str(e))
+
+        for error in result["errors"]:
+            self.stderr.write(f"Row {error['row']} (student_id={error['student_id']}): {error['error']}")
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {result['updated']} grades for {offering.course.code} "
+                f"({offering.semester}) with {len(result['errors'])} errors."
+            )
+        )
@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from academics.services.idempotency_services import purge_idempotency_records
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete stored Idempotency-Key responses older than the IDEMPOTENCY TTL "
+        "(or --older-than seconds). Meant to run periodically, e.g. from cron."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--older-than", type=int, help="Age in seconds (default: the IDEMPOTENCY TTL).")
+
+    def handle(self, *args, **options):
+        if options["older_than"] is not None and options["older_than"] < 0:
+            raise CommandError("--older-than must not be negative.")
+        deleted = purge_idempotency_records(ttl=options["older_than"])
+        self.stdout.write(self.style.SUCCESS(f"Deleted {deleted} idempotency records."))
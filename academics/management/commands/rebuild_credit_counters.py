@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from academics.services.credit_services import rebuild_credit_counters
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild the credits_used counters of StudentLoadSemester and "
+        "TeacherLoadSemester from StudentEnrollment and CourseOffering."
+    )
+
+    def handle(self, *args, **options):
+        updated = rebuild_credit_counters()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Rebuilt credit counters for {updated['students']} student loads "
+                f"and {updated['teachers']} teacher loads."
+            )
+        )
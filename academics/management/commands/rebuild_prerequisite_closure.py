@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from academics.services.prerequisite_services import rebuild_prerequisite_closure
+
+
+class Command(BaseCommand):
+    help = "Rebuild the course prerequisite closure table from Course.prerequisites."
+
+    def handle(self, *args, **options):
+        rows = rebuild_prerequisite_closure()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt prerequisite closure with {rows} rows."))
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from academics.services.seat_services import rebuild_seat_counters
+
+
+class Command(BaseCommand):
+    help = "Rebuild the seats_taken counters of CourseOffering from the enrollments linked to each offering."
+
+    def handle(self, *args, **options):
+        updated = rebuild_seat_counters()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt seat counters for {updated} course offerings."))
@@ -0,0 +1,186 @@
+import asyncio
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from academics.models import CourseOffering, Semester
+from academics.services.credit_services import find_credit_violations
+from academics.services.seat_services import find_seat_violations
+from loadtest.report import summarize
+from loadtest.rush import SCENARIOS, RushPlan, login, run_rush
+from users.models import User
+
+
+def parse_mix(value: str) -> dict[str, int]:
+    """
+    Parse a scenario mix such as "enroll=80,catalog=10,teacher=10".
+    """
+    mix = dict.fromkeys(SCENARIOS, 0)
+    for part in value.split(","):
+        scenario, _, weight = part.partition("=")
+        scenario = scenario.strip()
+        if scenario not in mix or not weight.strip().isdigit():
+            raise CommandError(f"Invalid mix entry '{part}'. Scenarios: {', '.join(SCENARIOS)}.")
+        mix[scenario] = int(weight)
+    return mix
+
+
+class Command(BaseCommand):
+    help = (
+        "Rehearse registration day against a running server: log in students and "
+        "teachers, drive a mix of enrollment, catalog and teacher-course requests "
+        "with asyncio, then report latency, errors and credit-limit and seat violations. "
+        "The post-run check reads the database configured for this command, so it "
+        "must be the one the server uses."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+        parser.add_argument("--semester-id", type=int, help="Semester to enroll in (default: the latest one).")
+        parser.add_argument("--students", type=int, default=200, help="Number of students to log in.")
+        parser.add_argument("--teachers", type=int, default=20, help="Number of teachers to log in.")
+        parser.add_argument("--prefix", default="", help="Only use users whose username starts with this prefix.")
+        parser.add_argument("--password", default="password", help="Password shared by the students and teachers.")
+        parser.add_argument("--admin-username", help="Admin used for the catalog scenario.")
+        parser.add_argument("--admin-password")
+        parser.add_argument("--mix", default="enroll=80,catalog=10,teacher=10", help="Scenario weights.")
+        parser.add_argument("--concurrency", type=int, default=50, help="Number of virtual users.")
+        parser.add_argument("--duration", type=float, default=30.0, help="Seconds to keep sending requests.")
+        parser.add_argument("--requests", type=int, help="Stop after this many requests.")
+        parser.add_argument("--timeout", type=float, default=30.0, help="Per-request timeout in seconds.")
+        parser.add_argument("--seed", type=int, default=1)
+        parser.add_argument(
+            "--async-reads",
+            action="store_true",
+            help="Send the catalog and teacher scenarios to the async (ASGI) endpoints.",
+        )
+        parser.add_argument("--label", default="", help="Name of the configuration under test, stored in the report.")
+        parser.add_argument("--output", help="Write the JSON report to this path.")
+
+    def handle(self, *args, **options):
+        mix = parse_mix(options["mix"])
+        if options["concurrency"] < 1:
+            raise CommandError("--concurrency must be at least 1.")
+
+        if options["semester_id"]:
+            semester = Semester.objects.filter(pk=options["semester_id"]).first()
+        else:
+            semester = Semester.objects.order_by("-year", "-term").first()
+        if semester is None:
+            raise CommandError("Semester not found.")
+
+        course_ids = list(
+            CourseOffering.objects.filter(semester=semester)
+            .values_list("course_id", flat=True).distinct().order_by("course_id")
+        )
+        students = list(
+            User.objects.filter(
+                role=User.Role.STUDENT,
+                username__startswith=options["prefix"],
+                studentloadsemester__semester=semester,
+            ).order_by("id").values_list("id", "username")[: options["students"]]
+        )
+        teachers = list(
+            User.objects.filter(
+                role=User.Role.TEACHER,
+                username__startswith=options["prefix"],
+                course_offerings__semester=semester,
+            ).distinct().order_by("id").values_list("id", "username")[: options["teachers"]]
+        )
+        if mix["enroll"] and not (students and course_ids):
+            raise CommandError(f"No students with a load or no offerings in semester {semester}.")
+        if mix["teacher"] and not teachers:
+            raise CommandError(f"No teachers with offerings in semester {semester}.")
+        if mix["catalog"] and not options["admin_username"]:
+            self.stderr.write("No --admin-username given; the catalog scenario is disabled.")
+            mix["catalog"] = 0
+        if not any(mix.values()):
+            raise CommandError("The scenario mix is empty.")
+
+        report = asyncio.run(self._rush(options, semester, course_ids, students, teachers, mix))
+        report["credit_violations"] = find_credit_violations(semester)
+        report["seat_violations"] = find_seat_violations(semester)
+
+        self._print_report(report)
+        if options["output"]:
+            with open(options["output"], "w") as output:
+                json.dump(report, output, indent=2)
+
+        violations = sum(len(rows) for rows in report["credit_violations"].values())
+        if violations or report["seat_violations"]:
+            raise CommandError(
+                f"Found {violations} credit-limit and {len(report['seat_violations'])} "
+                "seat violations after the rush."
+            )
+        self.stdout.write(self.style.SUCCESS("No credit-limit or seat violations found."))
+
+    async def _rush(self, options, semester, course_ids, students, teachers, mix) -> dict:
+        base_url, timeout = options["base_url"], options["timeout"]
+        try:
+            student_actors, failures = await login(
+                base_url, students if mix["enroll"] else [], options["password"], options["concurrency"], timeout
+            )
+            teacher_actors, teacher_failures = await login(
+                base_url, teachers if mix["teacher"] else [], options["password"], options["concurrency"], timeout
+            )
+            failures += teacher_failures
+            admin = None
+            if mix["catalog"]:
+                admin_actors, admin_failures = await login(
+                    base_url, [(0, options["admin_username"])], options["admin_password"] or "", 1, timeout
+                )
+                failures += admin_failures
+                admin = admin_actors[0] if admin_actors else None
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        for failure in failures[:10]:
+            self.stderr.write(f"Login failed for {failure}")
+        if (mix["enroll"] and not student_actors) or (mix["teacher"] and not teacher_actors) or (
+            mix["catalog"] and admin is None
+        ):
+            raise CommandError(f"Login failed for every user of a scenario ({len(failures)} failures).")
+
+        plan = RushPlan(
+            semester.id, course_ids, student_actors, teacher_actors, admin, mix, options["async_reads"]
+        )
+        samples, elapsed = await run_rush(
+            base_url,
+            plan,
+            concurrency=options["concurrency"],
+            duration=options["duration"],
+            max_requests=options["requests"],
+            seed=options["seed"],
+            timeout=timeout,
+        )
+        report = summarize(samples, elapsed)
+        report["label"] = options["label"]
+        report["semester"] = str(semester)
+        report["concurrency"] = options["concurrency"]
+        report["mix"] = mix
+        report["async_reads"] = options["async_reads"]
+        report["login_failures"] = len(failures)
+        return report
+
+    def _print_report(self, report: dict) -> None:
+        label = f" [{report['label']}]" if report["label"] else ""
+        self.stdout.write(
+            f"Registration rush{label}: {report['requests']} requests in {report['elapsed_s']}s "
+            f"({report['throughput_rps']} req/s) with {report['concurrency']} virtual users"
+        )
+        self.stdout.write(
+            f"  all        p50={report['p50_ms']}ms p95={report['p95_ms']}ms p99={report['p99_ms']}ms"
+        )
+        for scenario, stats in report["scenarios"].items():
+            codes = ", ".join(f"{code}: {count}" for code, count in stats["status_codes"].items())
+            self.stdout.write(
+                f"  {scenario:<10} n={stats['requests']} p50={stats['p50_ms']}ms "
+                f"p95={stats['p95_ms']}ms p99={stats['p99_ms']}ms ({codes})"
+            )
+        for error, count in report["errors"].items():
+            self.stdout.write(f"  {count:>6}x {error}")
+        for kind, rows in report["credit_violations"].items():
+            for row in rows[:20]:
+                self.stderr.write(f"  credit violation ({kind}): {row}")
+        for row in report["seat_violations"][:20]:
+            self.stderr.write(f"  seat violation: {row}")
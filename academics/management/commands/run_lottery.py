@@ -0,0 +1,42 @@
+import time
+
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+
+from academics.models import Semester
+from academics.services.lottery_services import run_lottery
+
+
+class Command(BaseCommand):
+    help = (
+        "Allocate the seats of a lottery semester from the ranked course preferences "
+        "submitted during its window. Runs once per semester; afterwards direct "
+        "enrollment opens for the seats left."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--semester-id", type=int, required=True)
+        parser.add_argument("--seed", type=int, help="Seed of the draw, to make the run reproducible.")
+        parser.add_argument("--dry-run", action="store_true", help="Compute the allocation without saving it.")
+
+    def handle(self, *args, **options):
+        semester = Semester.objects.filter(pk=options["semester_id"]).first()
+        if semester is None:
+            raise CommandError("Semester not found.")
+
+        start = time.perf_counter()
+        try:
+            result = run_lottery(semester, seed=options["seed"], dry_run=options["dry_run"])
+        except ValidationError as e:
+            raise CommandError(" ".join(e.messages))
+        elapsed = time.perf_counter() - start
+
+        self.stdout.write(
+            f"{result.students} students, {result.preferences} preferences: "
+            f"{result.enrollments} seats allocated, {result.first_choices} first choices, "
+            f"{result.students_without_seat} students without a seat ({elapsed:.2f}s)."
+        )
+        if options["dry_run"]:
+            self.stdout.write(self.style.WARNING("Dry run: nothing was saved."))
+        else:
+            self.stdout.write(self.style.SUCCESS(f"Lottery of semester {semester} saved."))
@@ -0,0 +1,48 @@
+# Generated by Django 5.2.7 on 2026-10-18 03:02
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+
+
+def backfill_credits_used(apps, schema_editor):
+    StudentLoadSemester = apps.get_model('academics', 'StudentLoadSemester')
+    TeacherLoadSemester = apps.get_model('academics', 'TeacherLoadSemester')
+    StudentEnrollment = apps.get_model('academics', 'StudentEnrollment')
+    CourseOffering = apps.get_model('academics', 'CourseOffering')
+
+    student_credits = (
+        StudentEnrollment.objects.filter(student=OuterRef('student'), semester=OuterRef('semester'))
+        .values('student')
+        .annotate(total=Sum('course__credits'))
+        .values('total')
+    )
+    teacher_credits = (
+        CourseOffering.objects.filter(teacher=OuterRef('teacher'), semester=OuterRef('semester'))
+        .values('teacher')
+        .annotate(total=Sum('course__credits'))
+        .values('total')
+    )
+    StudentLoadSemester.objects.update(credits_used=Coalesce(Subquery(student_credits), 0))
+    TeacherLoadSemester.objects.update(credits_used=Coalesce(Subquery(teacher_credits), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academics', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='studentloadsemester',
+            name='credits_used',
+            field=models.PositiveIntegerField(default=0, help_text='Credits already taken in the semester, kept in sync by the credit services.'),
+        ),
+        migrations.AddField(
+            model_name='teacherloadsemester',
+            name='credits_used',
+            field=models.PositiveIntegerField(default=0, help_text='Credits already taken in the semester, kept in sync by the credit services.'),
+        ),
+        migrations.RunPython(backfill_credits_used, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,59 @@
+# Generated by Django 5.2.7 on 2026-10-18 03:04
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_prerequisite_closure(apps, schema_editor):
+    Course = apps.get_model('academics', 'Course')
+    CoursePrerequisiteClosure = apps.get_model('academics', 'CoursePrerequisiteClosure')
+
+    prerequisites_of = {}
+    for course_id, prerequisite_id in Course.prerequisites.through.objects.values_list('from_course_id', 'to_course_id'):
+        prerequisites_of.setdefault(course_id, []).append(prerequisite_id)
+
+    rows = []
+    for course_id in prerequisites_of:
+        # Breadth-first search gives the shortest chain length for each ancestor.
+        depths = {}
+        frontier = prerequisites_of[course_id]
+        depth = 1
+        while frontier:
+            next_frontier = []
+            for ancestor_id in frontier:
+                if ancestor_id not in depths and ancestor_id != course_id:
+                    depths[ancestor_id] = depth
+                    next_frontier.extend(prerequisites_of.get(ancestor_id, []))
+            frontier = next_frontier
+            depth += 1
+        rows.extend(
+            CoursePrerequisiteClosure(ancestor_id=ancestor_id, descendant_id=course_id, depth=depth)
+            for ancestor_id, depth in depths.items()
+        )
+    CoursePrerequisiteClosure.objects.bulk_create(rows, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academics', '0002_load_credits_used'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CoursePrerequisiteClosure',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('depth', models.PositiveIntegerField()),
+                ('ancestor', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='descendant_links', to='academics.course')),
+                ('descendant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='ancestor_links', to='academics.course')),
+            ],
+            options={
+                'verbose_name': 'Course Prerequisite Closure',
+                'verbose_name_plural': 'Course Prerequisite Closures',
+                'indexes': [models.Index(fields=['descendant', 'depth'], name='academics_c_descend_7266fe_idx')],
+                'unique_together': {('ancestor', 'descendant')},
+            },
+        ),
+        migrations.RunPython(backfill_prerequisite_closure, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 5.2.7 on 2026-10-18 03:31
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, F, Value
+from django.db.models.functions import Greatest
+
+
+def link_enrollments_to_offerings(apps, schema_editor):
+    CourseOffering = apps.get_model('academics', 'CourseOffering')
+    StudentEnrollment = apps.get_model('academics', 'StudentEnrollment')
+
+    # Enrollments can only be linked when their course has a single offering in the semester.
+    single_offerings = (
+        CourseOffering.objects.values('course_id', 'semester_id')
+        .annotate(offerings=Count('id'))
+        .filter(offerings=1)
+        .values_list('course_id', 'semester_id')
+    )
+    for course_id, semester_id in single_offerings:
+        offering = CourseOffering.objects.get(course_id=course_id, semester_id=semester_id)
+        taken = StudentEnrollment.objects.filter(course_id=course_id, semester_id=semester_id).update(offering=offering)
+        CourseOffering.objects.filter(pk=offering.pk).update(
+            seats_taken=taken, capacity=Greatest(F('capacity'), Value(taken))
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academics', '0003_course_prerequisite_closure'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='courseoffering',
+            name='capacity',
+            field=models.PositiveIntegerField(default=40, help_text='Maximum number of students that can enroll in the offering.'),
+        ),
+        migrations.AddField(
+            model_name='courseoffering',
+            name='seats_taken',
+            field=models.PositiveIntegerField(default=0, help_text='Seats already taken, kept in sync by the seat services.'),
+        ),
+        migrations.AddField(
+            model_name='studentenrollment',
+            name='offering',
+            field=models.ForeignKey(blank=True, help_text='Section the student holds a seat in.', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='enrollments', to='academics.courseoffering'),
+        ),
+        migrations.RunPython(link_enrollments_to_offerings, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='courseoffering',
+            constraint=models.CheckConstraint(condition=models.Q(('seats_taken__lte', models.F('capacity'))), name='offering_seats_within_capacity'),
+        ),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 5.2.7 on 2026-10-18 03:59
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academics', '0005_waitlist_entry'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='semester',
+            name='allocated_at',
+            field=models.DateTimeField(blank=True, help_text='When the lottery allocated the seats of the semester.', null=True),
+        ),
+        migrations.AddField(
+            model_name='semester',
+            name='enrollment_mode',
+            field=models.CharField(choices=[('fcfs', 'First come, first served'), ('lottery', 'Lottery')], default='fcfs', max_length=10),
+        ),
+        migrations.AddField(
+            model_name='semester',
+            name='preferences_close_at',
+            field=models.DateTimeField(blank=True, help_text='End of the window to submit course preferences (lottery mode).', null=True),
+        ),
+        migrations.AddField(
+            model_name='semester',
+            name='preferences_open_at',
+            field=models.DateTimeField(blank=True, help_text='Start of the window to submit course preferences (lottery mode).', null=True),
+        ),
+        migrations.CreateModel(
+            name='CoursePreference',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('rank', models.PositiveSmallIntegerField()),
+                ('course', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='academics.course')),
+                ('semester', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='course_preferences', to='academics.semester')),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='course_preferences', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Course Preference',
+                'verbose_name_plural': 'Course Preferences',
+                'constraints': [models.UniqueConstraint(fields=('semester', 'student', 'rank'), name='unique_preference_rank')],
+                'unique_together': {('student', 'semester', 'course')},
+            },
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.7 on 2026-10-18 04:10
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academics', '0006_lottery_allocation'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='studentenrollment',
+            index=models.Index(fields=['offering', 'id'], name='academics_s_offerin_f70f2e_idx'),
+        ),
+    ]
@@ -4,6 +4,11 @@ from .course_offering import CourseOffering
 from .teacher_load_semester import TeacherLoadSemester
 from .student_load_semester import StudentLoadSemester
 from .student_enrollment import StudentEnrollment
+from .course_prerequisite_closure import CoursePrerequisiteClosure
+from .waitlist_entry import WaitlistEntry
+from .course_preference import CoursePreference
+from .idempotency_record import IdempotencyRecord
+from .catalog_version import CatalogVersion
 
 __all__ = [
     'Semester',
@@ -12,4 +17,9 @@ __all__ = [
     'TeacherLoadSemester',
     'StudentLoadSemester',
     'StudentEnrollment',
+    'CoursePrerequisiteClosure',
+    'WaitlistEntry',
+    'CoursePreference',
+    'IdempotencyRecord',
+    'CatalogVersion',
 ]
\ No newline at end of file
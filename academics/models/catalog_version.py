@@ -0,0 +1,20 @@
+from django.db import models
+
+
+class CatalogVersion(models.Model):
+    """
+    Single row holding the version token of the course catalog.
+
+    Every change to courses or prerequisites writes a new token in the same
+    transaction, so every process (web workers and management commands)
+    sees the new version as soon as the change commits. Pre-serialized
+    catalog snapshots are cached under this token.
+    """
+    token = models.CharField(max_length=32)
+
+    class Meta:
+        verbose_name = "Catalog Version"
+        verbose_name_plural = "Catalog Versions"
+
+    def __str__(self):
+        return self.token
@@ -1,6 +1,8 @@
 from django.db import models
+from django.db.models import F, Q
 from django.conf import settings
 
+from ..constants import DEFAULT_OFFERING_CAPACITY
 from .semester import Semester
 from .course import Course
 
@@ -25,9 +27,23 @@ class CourseOffering(models.Model):
         on_delete=models.CASCADE,
         related_name="course_offerings",
     )
+    capacity = models.PositiveIntegerField(
+        default=DEFAULT_OFFERING_CAPACITY,
+        help_text="Maximum number of students that can enroll in the offering.",
+    )
+    seats_taken = models.PositiveIntegerField(
+        default=0,
+        help_text="Seats already taken, kept in sync by the seat services.",
+    )
 
     class Meta:
         unique_together = ("course", "semester", "teacher")
+        constraints = [
+            models.CheckConstraint(
+                condition=Q(seats_taken__lte=F("capacity")),
+                name="offering_seats_within_capacity",
+            ),
+        ]
         verbose_name = "Course Offering"
         verbose_name_plural = "Course Offerings"
 
@@ -0,0 +1,33 @@
+from django.db import models
+from django.conf import settings
+
+from .semester import Semester
+from .course import Course
+
+
+class CoursePreference(models.Model):
+    """
+    A course a student wants in a lottery semester. Rank 1 is the most wanted.
+    """
+    student = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="course_preferences",
+    )
+    semester = models.ForeignKey(Semester, on_delete=models.CASCADE, related_name="course_preferences")
+    course = models.ForeignKey(Course, on_delete=models.CASCADE, related_name="+")
+    rank = models.PositiveSmallIntegerField()
+
+    class Meta:
+        unique_together = ("student", "semester", "course")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["semester", "student", "rank"],
+                name="unique_preference_rank",
+            ),
+        ]
+        verbose_name = "Course Preference"
+        verbose_name_plural = "Course Preferences"
+
+    def __str__(self):
+        return f"{self.student_id} #{self.rank}: {self.course_id} ({self.semester_id})"
@@ -0,0 +1,36 @@
+from django.db import models
+
+from .course import Course
+
+
+class CoursePrerequisiteClosure(models.Model):
+    """
+    Transitive closure of the Course prerequisite graph.
+
+    There is one row for every pair (ancestor, descendant) where `ancestor`
+    must be completed, directly or through other courses, before taking
+    `descendant`. `depth` is the length of the shortest prerequisite chain
+    between them (1 for a direct prerequisite).
+    """
+    ancestor = models.ForeignKey(
+        Course,
+        on_delete=models.CASCADE,
+        related_name="descendant_links",
+    )
+    descendant = models.ForeignKey(
+        Course,
+        on_delete=models.CASCADE,
+        related_name="ancestor_links",
+    )
+    depth = models.PositiveIntegerField()
+
+    class Meta:
+        unique_together = ("ancestor", "descendant")
+        indexes = [
+            models.Index(fields=["descendant", "depth"]),
+        ]
+        verbose_name = "Course Prerequisite Closure"
+        verbose_name_plural = "Course Prerequisite Closures"
+
+    def __str__(self):
+        return f"{self.ancestor_id} -> {self.descendant_id} ({self.depth})"
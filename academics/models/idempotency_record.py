@@ -0,0 +1,32 @@
+from django.db import models
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+
+
+class IdempotencyRecord(models.Model):
+    """
+    The stored outcome of a POST sent with an `Idempotency-Key` header.
+
+    One row per (user, key). `status_code` stays NULL while the first
+    request is running; afterwards the row holds the response so a retry
+    can be answered without running the operation again. `fingerprint`
+    ties the key to the request it was first used with.
+    """
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="+",
+    )
+    key = models.CharField(max_length=255)
+    fingerprint = models.CharField(max_length=64)
+    status_code = models.PositiveSmallIntegerField(null=True, blank=True)
+    response_body = models.JSONField(null=True, blank=True, encoder=DjangoJSONEncoder)
+    created_at = models.DateTimeField(db_index=True)
+
+    class Meta:
+        unique_together = ("user", "key")
+        verbose_name = "Idempotency Record"
+        verbose_name_plural = "Idempotency Records"
+
+    def __str__(self):
+        return f"{self.user_id}:{self.key} ({self.status_code or 'pending'})"
@@ -1,11 +1,40 @@
 from django.db import models
 
 class Semester(models.Model):
+    class EnrollmentMode(models.TextChoices):
+        FCFS = "fcfs", "First come, first served"
+        LOTTERY = "lottery", "Lottery"
+
     year = models.PositiveIntegerField()
     term = models.PositiveSmallIntegerField(choices=[(1, "First"), (2, "Second")])
+    enrollment_mode = models.CharField(
+        max_length=10,
+        choices=EnrollmentMode.choices,
+        default=EnrollmentMode.FCFS,
+    )
+    preferences_open_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="Start of the window to submit course preferences (lottery mode).",
+    )
+    preferences_close_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="End of the window to submit course preferences (lottery mode).",
+    )
+    allocated_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="When the lottery allocated the seats of the semester.",
+    )
 
     class Meta:
         unique_together = ("year", "term")
 
     def __str__(self):
         return f"{self.year}-{self.term}"
+
+    @property
+    def awaiting_lottery(self) -> bool:
+        """Seats of a lottery semester cannot be taken directly until it has been allocated."""
+        return self.enrollment_mode == self.EnrollmentMode.LOTTERY and self.allocated_at is None
@@ -5,11 +5,20 @@ from django.core.validators import MinValueValidator, MaxValueValidator
 from ..constants import MAX_GRADE, MIN_GRADE
 from .semester import Semester
 from .course import Course
+from .course_offering import CourseOffering
 
 class StudentEnrollment(models.Model):
     student = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
     semester = models.ForeignKey(Semester, on_delete=models.CASCADE)
     course = models.ForeignKey(Course, on_delete=models.CASCADE)
+    offering = models.ForeignKey(
+        CourseOffering,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="enrollments",
+        help_text="Section the student holds a seat in.",
+    )
     grade = models.DecimalField(
         max_digits=2,
         decimal_places=1,
@@ -24,3 +33,6 @@ class StudentEnrollment(models.Model):
 
     class Meta:
         unique_together = ("student", "semester", "course")
+        indexes = [
+            models.Index(fields=["offering", "id"]),
+        ]
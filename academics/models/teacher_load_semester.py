@@ -7,6 +7,10 @@ class TeacherLoadSemester(models.Model):
     teacher = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
     semester = models.ForeignKey(Semester, on_delete=models.CASCADE)
     max_credits = models.PositiveIntegerField()
+    credits_used = models.PositiveIntegerField(
+        default=0,
+        help_text="Credits already taken in the semester, kept in sync by the credit services.",
+    )
 
     class Meta:
         unique_together = ("teacher", "semester")
@@ -0,0 +1,36 @@
+from django.db import models
+from django.conf import settings
+
+from .course_offering import CourseOffering
+
+
+class WaitlistEntry(models.Model):
+    """
+    A student waiting for a seat in a full course offering.
+
+    Entries are served first come, first served by primary key; the
+    (offering, id) index makes the head of the queue a single index lookup
+    and the number of students ahead of an entry an index-only count.
+    """
+    offering = models.ForeignKey(
+        CourseOffering,
+        on_delete=models.CASCADE,
+        related_name="waitlist_entries",
+    )
+    student = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="waitlist_entries",
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        unique_together = ("offering", "student")
+        indexes = [
+            models.Index(fields=["offering", "id"]),
+        ]
+        verbose_name = "Waitlist Entry"
+        verbose_name_plural = "Waitlist Entries"
+
+    def __str__(self):
+        return f"{self.student_id} waiting for offering {self.offering_id}"
@@ -0,0 +1,21 @@
+from django.conf import settings
+from rest_framework import serializers
+
+from academics.services.batch_services import ATOMIC, BATCH_OPERATIONS, PER_OPERATION
+
+
+class BatchOperationSerializer(serializers.Serializer):
+    type = serializers.ChoiceField(choices=sorted(BATCH_OPERATIONS))
+    data = serializers.DictField()
+
+
+class BatchSerializer(serializers.Serializer):
+    mode = serializers.ChoiceField(choices=[PER_OPERATION, ATOMIC], default=PER_OPERATION)
+    operations = BatchOperationSerializer(many=True, allow_empty=False)
+
+    def validate_operations(self, operations):
+        if len(operations) > settings.BATCH_MAX_OPERATIONS:
+            raise serializers.ValidationError(
+                f"A batch can have at most {settings.BATCH_MAX_OPERATIONS} operations."
+            )
+        return operations
@@ -1,9 +1,11 @@
 from rest_framework import serializers
+from academics.constants import DEFAULT_OFFERING_CAPACITY
 from academics.models import CourseOffering
 class CourseOfferingCreateSerializer(serializers.Serializer):
     teacher_id = serializers.IntegerField()
     semester_id = serializers.IntegerField()
     course_id = serializers.IntegerField()
+    capacity = serializers.IntegerField(required=False, min_value=1, default=DEFAULT_OFFERING_CAPACITY)
     
     def to_representation(self, instance):
         """
@@ -14,12 +16,14 @@ class CourseOfferingCreateSerializer(serializers.Serializer):
             "teacher": instance.teacher.username,
             "semester": str(instance.semester),
             "course": instance.course.name,
+            "capacity": instance.capacity,
+            "seats_taken": instance.seats_taken,
         }
 
 class CourseOfferingSerializer(serializers.ModelSerializer):
     course_name = serializers.CharField(source="course.name", read_only=True)
     course_code = serializers.CharField(source="course.code", read_only=True)
-    semester_name = serializers.CharField(source="semester.name", read_only=True)
+    semester_name = serializers.CharField(source="semester", read_only=True)
 
     class Meta:
         model = CourseOffering
@@ -30,4 +34,6 @@ class CourseOfferingSerializer(serializers.ModelSerializer):
             "course_name",
             "semester",
             "semester_name",
+            "capacity",
+            "seats_taken",
         ]
\ No newline at end of file
@@ -0,0 +1,26 @@
+from rest_framework import serializers
+from academics.constants import MAX_COURSE_PREFERENCES
+from academics.models import CoursePreference
+
+
+class CoursePreferenceSubmitSerializer(serializers.Serializer):
+    student_id = serializers.IntegerField(required=False)
+    semester_id = serializers.IntegerField()
+    course_ids = serializers.ListField(
+        child=serializers.IntegerField(),
+        allow_empty=False,
+        max_length=MAX_COURSE_PREFERENCES,
+        help_text="Courses in order of preference, most wanted first.",
+    )
+
+    def to_representation(self, preferences: list[CoursePreference]):
+        """Custom representation for API response."""
+        return [
+            {
+                "rank": preference.rank,
+                "course_id": preference.course_id,
+                "course": preference.course.name,
+                "credits": preference.course.credits,
+            }
+            for preference in preferences
+        ]
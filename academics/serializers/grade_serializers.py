@@ -28,4 +28,14 @@ class GradeResponseSerializer(serializers.Serializer):
     course = serializers.CharField()
     semester = serializers.CharField()
     grade = serializers.FloatField()
-    teacher = serializers.CharField()
\ No newline at end of file
+    teacher = serializers.CharField(source="offering.teacher", default=None)
+
+
+class GradeImportSerializer(serializers.Serializer):
+    """
+    Serializer for importing the grades of a course offering from a CSV file.
+    """
+    offering_id = serializers.IntegerField()
+    file = serializers.FileField(
+        help_text="CSV file with `student_id` and `grade` columns."
+    )
@@ -9,5 +9,13 @@ class SemesterSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Semester
-        fields = ["id", "year", "term"]
-        read_only_fields = ["id"]
+        fields = [
+            "id",
+            "year",
+            "term",
+            "enrollment_mode",
+            "preferences_open_at",
+            "preferences_close_at",
+            "allocated_at",
+        ]
+        read_only_fields = ["id", "allocated_at"]
@@ -6,6 +6,7 @@ class StudentEnrollmentCreateSerializer(serializers.Serializer):
     student_id = serializers.IntegerField()
     semester_id = serializers.IntegerField()
     course_id = serializers.IntegerField()
+    offering_id = serializers.IntegerField(required=False, allow_null=True)
 
     def to_representation(self, enrollment: StudentEnrollment):
         """Custom representation for API response."""
@@ -15,4 +16,55 @@ class StudentEnrollmentCreateSerializer(serializers.Serializer):
             "semester": str(enrollment.semester),
             "course": enrollment.course.name,
             "credits": enrollment.course.credits,
+            "offering": enrollment.offering_id,
         }
+
+
+class StudentBulkEnrollmentSerializer(serializers.Serializer):
+    student_id = serializers.IntegerField()
+    semester_id = serializers.IntegerField()
+    course_ids = serializers.ListField(
+        child=serializers.IntegerField(), allow_empty=False
+    )
+
+    def to_representation(self, enrollments: list[StudentEnrollment]):
+        """Custom representation for API response."""
+        return [
+            {
+                "id": enrollment.id,
+                "student": enrollment.student.username,
+                "semester": str(enrollment.semester),
+                "course": enrollment.course.name,
+                "credits": enrollment.course.credits,
+            }
+            for enrollment in enrollments
+        ]
+
+
+class StudentEnrollmentDropSerializer(serializers.Serializer):
+    student_id = serializers.IntegerField(required=False)
+    semester_id = serializers.IntegerField()
+    course_id = serializers.IntegerField()
+
+    def to_representation(self, promoted: StudentEnrollment | None):
+        """Custom representation for API response."""
+        return {
+            "dropped": True,
+            "promoted": None if promoted is None else {
+                "id": promoted.id,
+                "student": promoted.student.username,
+                "offering": promoted.offering_id,
+            },
+        }
+
+
+class StudentEnrollmentSwapSerializer(serializers.Serializer):
+    student_id = serializers.IntegerField(required=False)
+    semester_id = serializers.IntegerField()
+    drop_course_id = serializers.IntegerField()
+    add_course_id = serializers.IntegerField()
+    offering_id = serializers.IntegerField(required=False, allow_null=True)
+
+    def to_representation(self, enrollment: StudentEnrollment):
+        """Custom representation for API response."""
+        return StudentEnrollmentCreateSerializer().to_representation(enrollment)
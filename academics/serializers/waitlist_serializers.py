@@ -0,0 +1,16 @@
+from rest_framework import serializers
+from academics.models import WaitlistEntry
+
+
+class WaitlistJoinSerializer(serializers.Serializer):
+    student_id = serializers.IntegerField(required=False)
+
+    def to_representation(self, instance: tuple[WaitlistEntry, int]):
+        """Custom representation for API response."""
+        entry, position = instance
+        return {
+            "id": entry.id,
+            "student": entry.student.username,
+            "offering": entry.offering_id,
+            "position": position,
+        }
@@ -0,0 +1,183 @@
+from typing import Callable, NamedTuple
+
+from django.core.exceptions import ObjectDoesNotExist, ValidationError
+from django.db import transaction
+from rest_framework import serializers
+
+from academics.serializers.course_offering_serializer import CourseOfferingCreateSerializer
+from academics.serializers.student_enrollment_serializers import StudentEnrollmentCreateSerializer
+from academics.serializers.student_load_serializers import StudentLoadSemesterSerializer
+from academics.serializers.teacher_load_serializers import TeacherLoadAssignSerializer
+from academics.services.course_offering_services import create_course_offering, get_course_offering_by_id
+from academics.services.course_services import get_course_by_id
+from academics.services.semester_services import get_semester_by_id
+from academics.services.student_enrollment_services import enroll_student_in_course
+from academics.services.student_load_services import assign_semester_to_student
+from academics.services.teacher_load_services import assign_semester_to_teacher
+from core.db import is_retryable_error, retry_on_conflict
+from users.services.user_services import get_user_by_id
+
+PER_OPERATION = "per_operation"
+ATOMIC = "atomic"
+
+
+class BatchOperation(NamedTuple):
+    serializer_class: type[serializers.Serializer]
+    handler: Callable[[dict], dict]
+
+
+def _assign_teacher_load(data: dict) -> dict:
+    teacher_load = assign_semester_to_teacher(
+        teacher=get_user_by_id(user_id=data["teacher_id"]),
+        semester=get_semester_by_id(semester_id=data["semester_id"]),
+        max_credits=data["max_credits"],
+    )
+    return {
+        "teacher": teacher_load.teacher.username,
+        "semester": str(teacher_load.semester),
+        "max_credits": teacher_load.max_credits,
+    }
+
+
+def _assign_student_load(data: dict) -> dict:
+    student_load = assign_semester_to_student(
+        student=get_user_by_id(user_id=data["student_id"]),
+        semester=get_semester_by_id(semester_id=data["semester_id"]),
+        max_credits=data["max_credits"],
+    )
+    return StudentLoadSemesterSerializer(student_load).data
+
+
+def _create_course_offering(data: dict) -> dict:
+    offering = create_course_offering(
+        teacher=get_user_by_id(user_id=data["teacher_id"]),
+        semester=get_semester_by_id(semester_id=data["semester_id"]),
+        course=get_course_by_id(course_id=data["course_id"]),
+        capacity=data["capacity"],
+    )
+    return CourseOfferingCreateSerializer(offering).data
+
+
+def _enroll_student(data: dict) -> dict:
+    offering_id = data.get("offering_id")
+    enrollment = enroll_student_in_course(
+        student=get_user_by_id(data["student_id"]),
+        semester=get_semester_by_id(data["semester_id"]),
+        course=get_course_by_id(data["course_id"]),
+        offering=get_course_offering_by_id(offering_id) if offering_id else None,
+    )
+    return StudentEnrollmentCreateSerializer().to_representation(enrollment)
+
+
+# Operation types accepted by the batch endpoint. Each one validates its data
+# with the serializer of the matching single endpoint and calls the same
+# services, so a batched operation behaves exactly like the individual call:
+#   teacher_load.assign     -> teacher-load/assign/
+#   student_load.assign     -> student-semesters/
+#   course_offering.create  -> courses-offering/
+#   enrollment.create       -> enrollments/
+BATCH_OPERATIONS: dict[str, BatchOperation] = {
+    "teacher_load.assign": BatchOperation(TeacherLoadAssignSerializer, _assign_teacher_load),
+    "student_load.assign": BatchOperation(StudentLoadSemesterSerializer, _assign_student_load),
+    "course_offering.create": BatchOperation(CourseOfferingCreateSerializer, _create_course_offering),
+    "enrollment.create": BatchOperation(StudentEnrollmentCreateSerializer, _enroll_student),
+}
+
+
+class _BatchAborted(Exception):
+    def __init__(self, index: int, result: dict):
+        super().__init__(index, result)
+        self.index = index
+        self.result = result
+
+
+def _validate(operations: list[dict]) -> tuple[list[dict | None], list[dict | None]]:
+    """
+    Validate the data of every operation with its serializer.
+
+    Returns the validated data and, for invalid operations, their error result.
+    """
+    validated, errors = [], []
+    for operation in operations:
+        serializer = BATCH_OPERATIONS[operation["type"]].serializer_class(data=operation["data"])
+        if serializer.is_valid():
+            validated.append(serializer.validated_data)
+            errors.append(None)
+        else:
+            validated.append(None)
+            errors.append({"is_ok": False, "status": 400, "errors": serializer.errors})
+    return validated, errors
+
+
+def _run_operation(operation_type: str, data: dict, in_batch_transaction: bool = False) -> dict:
+    try:
+        return {"is_ok": True, "status": 201, "data": BATCH_OPERATIONS[operation_type].handler(data)}
+    except (ValidationError, ObjectDoesNotExist) as e:
+        return {"is_ok": False, "status": 400, "error": str(e)}
+    except Exception as e:
+        # Inside the batch transaction a conflict must reach retry_on_conflict,
+        # which runs the whole batch again.
+        if in_batch_transaction and is_retryable_error(e):
+            raise
+        return {"is_ok": False, "status": 500, "error": f"Unexpected error: {str(e)}"}
+
+
+@retry_on_conflict()
+@transaction.atomic
+def _run_atomic(operations: list[dict], validated: list[dict]) -> list[dict]:
+    results = []
+    for index, (operation, data) in enumerate(zip(operations, validated)):
+        result = _run_operation(operation["type"], data, in_batch_transaction=True)
+        if not result["is_ok"]:
+            raise _BatchAborted(index, result)
+        results.append(result)
+    return results
+
+
+def _not_applied(failed_index: int) -> dict:
+    return {
+        "is_ok": False,
+        "status": 424,
+        "error": f"Not applied: operation {failed_index} failed, so the batch was not committed.",
+    }
+
+
+def run_batch(operations: list[dict], mode: str = PER_OPERATION) -> list[dict]:
+    """
+    Run a list of typed operations and return one result per operation, in order.
+
+    Each operation is a dict with a `type` from BATCH_OPERATIONS and its `data`.
+    Every operation is validated before any of them runs.
+
+    - PER_OPERATION: each operation runs in its own transaction, as if it had
+      been sent to its endpoint; a failure does not affect the others.
+    - ATOMIC: all operations run in a single transaction. If any of them is
+      invalid or fails, nothing is applied: the failing operation gets its
+      error and the others a 424 "not applied" result.
+
+    Args:
+        operations (list[dict]): Operations with `type` and `data` keys.
+        mode (str): PER_OPERATION or ATOMIC.
+
+    Returns:
+        list[dict]: Results with `is_ok`, the `status` the single endpoint would
+                    have returned, and `data`, `error` or `errors`.
+    """
+    validated, errors = _validate(operations)
+
+    if mode == ATOMIC:
+        first_invalid = next((index for index, error in enumerate(errors) if error), None)
+        if first_invalid is not None:
+            return [error or _not_applied(first_invalid) for error in errors]
+        try:
+            return _run_atomic(operations, validated)
+        except _BatchAborted as aborted:
+            return [
+                aborted.result if index == aborted.index else _not_applied(aborted.index)
+                for index in range(len(operations))
+            ]
+
+    return [
+        error or _run_operation(operation["type"], data)
+        for operation, data, error in zip(operations, validated, errors)
+    ]
@@ -0,0 +1,104 @@
+import hashlib
+import uuid
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.renderers import JSONRenderer
+
+from academics.models import CatalogVersion
+from academics.serializers.course_serializers import CourseSerializer
+from academics.services.course_services import get_all_courses
+from core.db import read_from_primary
+
+CATALOG_VERSION_ID = 1
+CATALOG_SNAPSHOT_KEY = "academics:catalog:snapshot:{version}"
+
+
+def get_catalog_version() -> str:
+    """
+    Return the current catalog version token, creating one if none exists.
+
+    Read from the database on every call rather than cached: it is a primary
+    key lookup on a one-row table (sent to the replica when there is one),
+    and it is what lets a change made by any process, including management
+    commands and bulk writes that bypass signals but call
+    `bump_catalog_version`, take effect on the next request everywhere. A
+    cached token would need cross-process invalidation that cannot be made
+    atomic with the commit of the change.
+    """
+    version = CatalogVersion.objects.filter(pk=CATALOG_VERSION_ID).values_list("token", flat=True).first()
+    if version is None:
+        catalog_version, _ = CatalogVersion.objects.get_or_create(
+            pk=CATALOG_VERSION_ID, defaults={"token": uuid.uuid4().hex}
+        )
+        version = catalog_version.token
+    return version
+
+
+async def aget_catalog_version() -> str:
+    """
+    Async counterpart of `get_catalog_version`.
+    """
+    version = await CatalogVersion.objects.filter(pk=CATALOG_VERSION_ID).values_list("token", flat=True).afirst()
+    if version is None:
+        catalog_version, _ = await CatalogVersion.objects.aget_or_create(
+            pk=CATALOG_VERSION_ID, defaults={"token": uuid.uuid4().hex}
+        )
+        version = catalog_version.token
+    return version
+
+
+def bump_catalog_version() -> None:
+    """
+    Invalidate the catalog snapshot by moving to a new version token.
+
+    The token is written to the database in the transaction of the change
+    that caused it, so every process (web workers and management commands
+    alike) sees the new version exactly when the change commits. A random
+    token (rather than a counter) guarantees that a snapshot cached for an
+    earlier version is never served again, even if the row is recreated.
+    """
+    CatalogVersion.objects.update_or_create(
+        pk=CATALOG_VERSION_ID, defaults={"token": uuid.uuid4().hex}
+    )
+
+
+def get_course_catalog_snapshot() -> tuple[bytes, str]:
+    """
+    Retrieve the pre-serialized course catalog and its strong ETag.
+
+    The snapshot is built once per catalog version from a single prefetched
+    query and stored already rendered to JSON, so serving it costs a primary
+    key lookup of the version and one cache lookup.
+
+    Returns:
+        tuple[bytes, str]: The rendered `{"is_ok": true, "data": [...]}` body
+                           and its quoted ETag.
+    """
+    key = CATALOG_SNAPSHOT_KEY.format(version=get_catalog_version())
+    snapshot = cache.get(key)
+    if snapshot is None:
+        # The snapshot outlives the request, so it is never built from a lagging replica.
+        with read_from_primary():
+            body = JSONRenderer().render(
+                {"is_ok": True, "data": CourseSerializer(get_all_courses(), many=True).data}
+            )
+        snapshot = (body, f'"{hashlib.sha256(body).hexdigest()}"')
+        cache.set(key, snapshot, timeout=settings.COURSE_CATALOG_CACHE_TIMEOUT)
+    return snapshot
+
+
+async def aget_course_catalog_snapshot() -> tuple[bytes, str]:
+    """
+    Async counterpart of `get_course_catalog_snapshot`.
+
+    A hit costs an async version lookup and an async cache read. A miss
+    rebuilds the snapshot with the sync builder in a worker thread, which
+    only happens once per catalog version.
+    """
+    key = CATALOG_SNAPSHOT_KEY.format(version=await aget_catalog_version())
+    snapshot = await cache.aget(key)
+    if snapshot is None:
+        snapshot = await sync_to_async(get_course_catalog_snapshot)()
+    return snapshot
@@ -1,10 +1,25 @@
-from django.db import transaction, models
+from typing import AsyncIterator, Iterator
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import CharField, F, QuerySet, Value
+from django.db.models.functions import Cast, Concat
 from django.core.exceptions import ValidationError, ObjectDoesNotExist
-from academics.models import CourseOffering, Semester, Course, TeacherLoadSemester
+from academics.constants import DEFAULT_OFFERING_CAPACITY
+from academics.models import CourseOffering, Semester, Course, StudentEnrollment, TeacherLoadSemester
+from academics.services.credit_services import reserve_teacher_credits
+from core.db import retry_on_conflict
+from core.pagination import KeysetPage, paginate_by_key
 from users.models import User
 
+@retry_on_conflict()
 @transaction.atomic
-def create_course_offering(teacher: User, semester: Semester, course: Course) -> CourseOffering:
+def create_course_offering(
+    teacher: User,
+    semester: Semester,
+    course: Course,
+    capacity: int = DEFAULT_OFFERING_CAPACITY,
+) -> CourseOffering:
     """
     Create a CourseOffering for a teacher in a given semester,
     ensuring the teacher does not exceed their maximum credit limit.
@@ -13,41 +28,42 @@ def create_course_offering(teacher: User, semester: Semester, course: Course) ->
         teacher (User): The teacher creating the offering.
         semester (Semester): The semester in which the course will be offered.
         course (Course): The course to offer.
+        capacity (int): Number of seats of the offering.
 
     Returns:
         CourseOffering: The newly created offering.
 
     Raises:
         ValidationError: If the teacher has no credit limit configured,
-                         exceeds available credits, or the offering already exists.
+                         exceeds available credits, the offering already exists,
+                         or the capacity is not positive.
     """
+    if capacity < 1:
+        raise ValidationError("Capacity must be a positive integer.")
 
     try:
-        teacher_load = TeacherLoadSemester.objects.get(teacher=teacher, semester=semester)
+        teacher_load = TeacherLoadSemester.objects.select_for_update().get(teacher=teacher, semester=semester)
     except ObjectDoesNotExist:
         raise ValidationError("Teacher has no configured credit limit for this semester.")
 
     if CourseOffering.objects.filter(teacher=teacher, semester=semester, course=course).exists():
         raise ValidationError("This course offering already exists for the given teacher and semester.")
 
-    current_credits = (
-        CourseOffering.objects.filter(teacher=teacher, semester=semester)
-        .select_related("course")
-        .aggregate(total=models.Sum("course__credits"))["total"]
-        or 0
-    )
-
-    if current_credits + course.credits > teacher_load.max_credits:
+    if not reserve_teacher_credits(teacher_load, course.credits):
         raise ValidationError(
             f"Teacher cannot exceed {teacher_load.max_credits} credits in semester "
-            f"(current={current_credits}, new={course.credits})."
+            f"(current={teacher_load.credits_used}, new={course.credits})."
         )
 
-    offering = CourseOffering.objects.create(
-        teacher=teacher,
-        semester=semester,
-        course=course,
-    )
+    try:
+        offering = CourseOffering.objects.create(
+            teacher=teacher,
+            semester=semester,
+            course=course,
+            capacity=capacity,
+        )
+    except IntegrityError:
+        raise ValidationError("This course offering already exists for the given teacher and semester.")
 
     return offering
 
@@ -65,9 +81,139 @@ def get_teacher_courses_by_semester(teacher: User, semester: Semester) -> list[C
     Raises:
         ValidationError: If the user is not a teacher.
     """
+    return list(_teacher_courses(teacher, semester))
+
+
+async def aget_teacher_courses_by_semester(teacher: User, semester: Semester) -> list[CourseOffering]:
+    """
+    Async counterpart of `get_teacher_courses_by_semester`.
+    """
+    return [offering async for offering in _teacher_courses(teacher, semester)]
+
+
+def _teacher_courses(teacher: User, semester: Semester) -> QuerySet:
+    if teacher.role != User.Role.TEACHER:
+        raise ValidationError("Only teachers can have assigned courses.")
+
+    return CourseOffering.objects.filter(teacher=teacher, semester=semester).select_related("course", "semester")
+
+def iter_teacher_courses_by_semester_values(
+    teacher: User,
+    semester: Semester,
+    chunk_size: int | None = None) -> Iterator[dict]:
+    """
+    Stream the course offerings of a teacher in a semester as plain dicts,
+    reading `chunk_size` rows per round trip.
+
+    Raises:
+        ValidationError: If the user is not a teacher.
+    """
+    return _teacher_courses_values(teacher, semester).iterator(chunk_size=chunk_size or settings.EXPORT_CHUNK_SIZE)
+
+
+def aiter_teacher_courses_by_semester_values(
+    teacher: User,
+    semester: Semester,
+    chunk_size: int | None = None) -> AsyncIterator[dict]:
+    """
+    Async counterpart of `iter_teacher_courses_by_semester_values`.
+
+    Raises:
+        ValidationError: If the user is not a teacher.
+    """
+    return _teacher_courses_values(teacher, semester).aiterator(chunk_size=chunk_size or settings.EXPORT_CHUNK_SIZE)
+
+
+def _teacher_courses_values(teacher: User, semester: Semester) -> QuerySet:
     if teacher.role != User.Role.TEACHER:
         raise ValidationError("Only teachers can have assigned courses.")
 
-    return list(
+    return (
         CourseOffering.objects.filter(teacher=teacher, semester=semester)
-        )
\ No newline at end of file
+        .order_by("id")
+        .values(
+            "id",
+            "course",
+            "semester",
+            "capacity",
+            "seats_taken",
+            course_code=F("course__code"),
+            course_name=F("course__name"),
+            semester_name=Concat(
+                Cast("semester__year", CharField()),
+                Value("-"),
+                Cast("semester__term", CharField()),
+                output_field=CharField(),
+            ),
+        )
+    )
+
+def get_course_offering_by_id(offering_id: int) -> CourseOffering:
+    """
+    Retrieve a CourseOffering by its ID, with its course, semester and teacher.
+
+    Args:
+        offering_id (int): The ID of the offering to retrieve.
+
+    Returns:
+        CourseOffering: The retrieved offering.
+
+    Raises:
+        ValidationError: If the offering does not exist.
+    """
+    try:
+        return CourseOffering.objects.select_related("course", "semester", "teacher").get(id=offering_id)
+    except ObjectDoesNotExist:
+        raise ValidationError(f"Course offering with id={offering_id} does not exist.")
+
+
+def _roster_values(offering: CourseOffering) -> QuerySet:
+    """
+    Enrollments of an offering joined with the student and their profile,
+    as plain dicts built by a single query.
+    """
+    return (
+        StudentEnrollment.objects.filter(offering=offering)
+        .values(
+            "id",
+            "grade",
+            "student_id",
+            username=F("student__username"),
+            first_name=F("student__first_name"),
+            last_name=F("student__last_name"),
+            email=F("student__email"),
+            enrollment_number=F("student__studentprofile__enrollment_number"),
+            program=F("student__studentprofile__program"),
+        )
+    )
+
+
+def get_offering_roster_page(
+    offering: CourseOffering,
+    after_id: int | None = None,
+    page_size: int = 100,
+) -> KeysetPage:
+    """
+    Retrieve one page of the students enrolled in an offering, with their
+    profile fields and current grade, ordered by enrollment ID.
+
+    Args:
+        offering (CourseOffering): The offering whose roster is requested.
+        after_id (int | None): Enrollment ID of the last row of the previous page.
+        page_size (int): Maximum number of students to return.
+
+    Returns:
+        KeysetPage: The roster rows and the cursor of the next page, if any.
+    """
+    return paginate_by_key(_roster_values(offering), after_id, page_size)
+
+
+def iter_offering_roster_values(offering: CourseOffering, chunk_size: int | None = None) -> Iterator[dict]:
+    """
+    Stream the whole roster of an offering, reading `chunk_size` rows per round trip.
+    """
+    return (
+        _roster_values(offering)
+        .order_by("id")
+        .iterator(chunk_size=chunk_size or settings.EXPORT_CHUNK_SIZE)
+    )
@@ -1,10 +1,23 @@
+from typing import AsyncIterator, Iterator
+
+from django.conf import settings
 from django.core.exceptions import ValidationError, ObjectDoesNotExist
+from django.db import transaction
+
+from core.cache import ReadThroughCache
+from core.pagination import KeysetPage, apaginate_by_key, paginate_by_key
 from academics.models import Course, Semester
 
+course_cache = ReadThroughCache("course")
+
+@transaction.atomic
 def create_course(code: str, name: str, credits: int, prerequisites=None) -> Course:
     """
     Create a new course with optional prerequisites.
     Ensures prerequisites are valid and no cyclic dependencies exist.
+
+    The course and its prerequisites are committed together, so catalog
+    readers see a single new catalog version.
     """
     if credits <= 0:
         raise ValidationError("Credits must be greater than zero.")
@@ -13,13 +26,12 @@ def create_course(code: str, name: str, credits: int, prerequisites=None) -> Cou
 
     course = Course.objects.create(code=code, name=name, credits=credits)
 
-    for prereq in prerequisites:
-        if prereq == course:
-            raise ValidationError("A course cannot be its own prerequisite.")
-        course.prerequisites.add(prereq)
+    if course in prerequisites:
+        raise ValidationError("A course cannot be its own prerequisite.")
 
-    course.full_clean()
-    course.save()
+    # Cycles are rejected and the prerequisite closure is updated by the
+    # m2m_changed handler in academics.signals.
+    course.prerequisites.add(*prerequisites)
     return course
 
 
@@ -27,10 +39,13 @@ def get_course_by_id(course_id: int) -> Course:
     """
     Retrieve a course by its database ID.
     """
-    try:
-        return Course.objects.get(id=course_id)
-    except Course.DoesNotExist:
-        raise ObjectDoesNotExist(f"No course found with ID {course_id}.")
+    def load() -> Course:
+        try:
+            return Course.objects.get(id=course_id)
+        except Course.DoesNotExist:
+            raise ObjectDoesNotExist(f"No course found with ID {course_id}.")
+
+    return course_cache.get_or_load(course_id, load)
 
 
 def get_course_by_code(code: str) -> Course:
@@ -45,9 +60,49 @@ def get_course_by_code(code: str) -> Course:
 
 def get_all_courses() -> list[Course]:
     """
-    Retrieve all courses available in the system.
+    Retrieve all courses available in the system, with their prerequisites
+    prefetched in a single extra query.
+    """
+    return list(Course.objects.prefetch_related("prerequisites").order_by("id"))
+
+
+def iter_courses_values(chunk_size: int | None = None) -> Iterator[dict]:
+    """
+    Stream every course as a plain dict, reading `chunk_size` rows per round trip.
+    """
+    return _courses_values().iterator(chunk_size=chunk_size or settings.EXPORT_CHUNK_SIZE)
+
+
+def aiter_courses_values(chunk_size: int | None = None) -> AsyncIterator[dict]:
+    """
+    Async counterpart of `iter_courses_values`.
+    """
+    return _courses_values().aiterator(chunk_size=chunk_size or settings.EXPORT_CHUNK_SIZE)
+
+
+def _courses_values():
+    return Course.objects.order_by("id").values("id", "code", "name", "credits")
+
+
+def get_courses_page(after_id: int | None = None, page_size: int = 100) -> KeysetPage:
+    """
+    Retrieve one page of courses ordered by ID, with their prerequisites prefetched.
+
+    Args:
+        after_id (int | None): ID of the last course of the previous page.
+        page_size (int): Maximum number of courses to return.
+
+    Returns:
+        KeysetPage: The courses and the cursor of the next page, if any.
+    """
+    return paginate_by_key(Course.objects.prefetch_related("prerequisites"), after_id, page_size)
+
+
+async def aget_courses_page(after_id: int | None = None, page_size: int = 100) -> KeysetPage:
+    """
+    Async counterpart of `get_courses_page`.
     """
-    return list(Course.objects.all())
+    return await apaginate_by_key(Course.objects.prefetch_related("prerequisites"), after_id, page_size)
 
 
 def get_courses_by_semester(semester: Semester) -> list[Course]:
@@ -0,0 +1,163 @@
+from django.db import models
+from django.db.models import F, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+
+from academics.models import (
+    CourseOffering,
+    Semester,
+    StudentEnrollment,
+    StudentLoadSemester,
+    TeacherLoadSemester,
+)
+
+
+def _reserve_credits(load: StudentLoadSemester | TeacherLoadSemester, credits: int) -> bool:
+    """
+    Atomically add `credits` to the load counter only if the result stays
+    within `max_credits`. Runs as a single conditional UPDATE, so concurrent
+    reservations can never overshoot the limit.
+    """
+    updated = type(load).objects.filter(
+        pk=load.pk,
+        credits_used__lte=F("max_credits") - credits,
+    ).update(credits_used=F("credits_used") + credits)
+
+    if updated:
+        load.credits_used += credits
+        return True
+
+    load.refresh_from_db(fields=["credits_used"])
+    return False
+
+
+def _release_credits(load: StudentLoadSemester | TeacherLoadSemester, credits: int) -> None:
+    """
+    Atomically subtract `credits` from the load counter, never going below zero.
+    """
+    type(load).objects.filter(pk=load.pk, credits_used__gte=credits).update(
+        credits_used=F("credits_used") - credits
+    )
+    load.credits_used = max(load.credits_used - credits, 0)
+
+
+def reserve_student_credits(student_load: StudentLoadSemester, credits: int) -> bool:
+    """
+    Reserve credits in a student's semester load.
+
+    Args:
+        student_load (StudentLoadSemester): The load to reserve credits in.
+        credits (int): Number of credits to reserve.
+
+    Returns:
+        bool: True if the credits were reserved, False if they would exceed
+              `max_credits`. On failure `student_load.credits_used` is
+              refreshed with the current value.
+    """
+    return _reserve_credits(student_load, credits)
+
+
+def release_student_credits(student_load: StudentLoadSemester, credits: int) -> None:
+    """
+    Give back credits previously reserved in a student's semester load.
+    """
+    _release_credits(student_load, credits)
+
+
+def reserve_teacher_credits(teacher_load: TeacherLoadSemester, credits: int) -> bool:
+    """
+    Reserve credits in a teacher's semester load.
+
+    Args:
+        teacher_load (TeacherLoadSemester): The load to reserve credits in.
+        credits (int): Number of credits to reserve.
+
+    Returns:
+        bool: True if the credits were reserved, False if they would exceed
+              `max_credits`. On failure `teacher_load.credits_used` is
+              refreshed with the current value.
+    """
+    return _reserve_credits(teacher_load, credits)
+
+
+def release_teacher_credits(teacher_load: TeacherLoadSemester, credits: int) -> None:
+    """
+    Give back credits previously reserved in a teacher's semester load.
+    """
+    _release_credits(teacher_load, credits)
+
+
+def _enrolled_student_credits() -> Subquery:
+    """
+    Subquery summing the credits a student is enrolled in for the outer load's semester.
+    """
+    return Subquery(
+        StudentEnrollment.objects.filter(
+            student=OuterRef("student"),
+            semester=OuterRef("semester"),
+        )
+        .values("student")
+        .annotate(total=models.Sum("course__credits"))
+        .values("total")
+    )
+
+
+def _offered_teacher_credits() -> Subquery:
+    """
+    Subquery summing the credits a teacher offers in the outer load's semester.
+    """
+    return Subquery(
+        CourseOffering.objects.filter(
+            teacher=OuterRef("teacher"),
+            semester=OuterRef("semester"),
+        )
+        .values("teacher")
+        .annotate(total=models.Sum("course__credits"))
+        .values("total")
+    )
+
+
+def rebuild_credit_counters() -> dict[str, int]:
+    """
+    Recompute every `credits_used` counter from the source tables
+    (StudentEnrollment for students, CourseOffering for teachers).
+
+    Each model is rebuilt with a single UPDATE ... SET credits_used = (subquery).
+
+    Returns:
+        dict[str, int]: Number of student and teacher loads updated.
+    """
+    students = StudentLoadSemester.objects.update(
+        credits_used=Coalesce(_enrolled_student_credits(), 0)
+    )
+    teachers = TeacherLoadSemester.objects.update(
+        credits_used=Coalesce(_offered_teacher_credits(), 0)
+    )
+
+    return {"students": students, "teachers": teachers}
+
+
+def find_credit_violations(semester: Semester | None = None) -> dict[str, list[dict]]:
+    """
+    Find loads whose real credits exceed `max_credits` or disagree with `credits_used`.
+
+    Args:
+        semester (Semester | None): Restrict the check to one semester.
+
+    Returns:
+        dict[str, list[dict]]: Offending student and teacher loads, each with
+                               `max_credits`, `credits_used` and the real `credits`.
+    """
+    violations = {}
+    for key, queryset, owner, credits in (
+        ("students", StudentLoadSemester.objects.all(), "student_id", _enrolled_student_credits()),
+        ("teachers", TeacherLoadSemester.objects.all(), "teacher_id", _offered_teacher_credits()),
+    ):
+        if semester is not None:
+            queryset = queryset.filter(semester=semester)
+        violations[key] = list(
+            queryset.annotate(credits=Coalesce(credits, 0))
+            .filter(Q(credits__gt=F("max_credits")) | ~Q(credits=F("credits_used")))
+            .values(owner, "semester_id", "max_credits", "credits_used", "credits")
+            .order_by("id")
+        )
+    return violations
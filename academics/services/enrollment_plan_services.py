@@ -0,0 +1,120 @@
+from django.db.models import Sum
+from django.core.exceptions import ValidationError
+
+from ..constants import PASSING_GRADE
+
+from users.models import User
+from academics.models import (
+    Course,
+    CourseOffering,
+    Semester,
+    StudentEnrollment,
+    StudentLoadSemester,
+)
+from academics.services.prerequisite_services import PrerequisiteLink
+from core.db import get_read_alias
+
+
+def plan_enrollment(student: User, semester: Semester, course_ids: list[int]) -> dict:
+    """
+    Check whether a student could enroll in a set of courses, without writing anything.
+
+    Runs five queries whatever the number of courses or prerequisites, all on
+    the read replica when one is configured: the courses, the student's load,
+    the student's enrollments, the prerequisite links and the seats per course.
+
+    Args:
+        student (User): The student building a schedule.
+        semester (Semester): The semester to plan.
+        course_ids (list[int]): The candidate courses.
+
+    Returns:
+        dict: Credit totals against `max_credits`, one entry per course with
+              whether it is already taken, its missing prerequisites and its
+              free seats, and an overall `feasible` flag.
+
+    Raises:
+        ValidationError: If no course is given, a course is repeated or does not exist.
+    """
+    if not course_ids:
+        raise ValidationError("At least one course is required.")
+    if len(set(course_ids)) != len(course_ids):
+        raise ValidationError("The same course cannot be requested more than once.")
+
+    alias = get_read_alias()
+
+    courses = {
+        course["id"]: course
+        for course in Course.objects.using(alias).filter(id__in=course_ids).values("id", "code", "name", "credits")
+    }
+    missing_ids = set(course_ids) - courses.keys()
+    if missing_ids:
+        raise ValidationError(f"Courses not found for IDs: {missing_ids}")
+
+    load = (
+        StudentLoadSemester.objects.using(alias)
+        .filter(student=student, semester=semester)
+        .values("max_credits", "credits_used")
+        .first()
+    )
+
+    enrolled, passed = set(), set()
+    for course_id, semester_id, grade in StudentEnrollment.objects.using(alias).filter(
+        student=student
+    ).values_list("course_id", "semester_id", "grade"):
+        if semester_id == semester.id:
+            enrolled.add(course_id)
+        if grade is not None and grade >= PASSING_GRADE:
+            passed.add(course_id)
+
+    prerequisites: dict[int, list[tuple[int, str]]] = {}
+    for course_id, prerequisite_id, prerequisite_code in PrerequisiteLink.objects.using(alias).filter(
+        from_course_id__in=course_ids
+    ).values_list("from_course_id", "to_course_id", "to_course__code"):
+        prerequisites.setdefault(course_id, []).append((prerequisite_id, prerequisite_code))
+
+    seats = {
+        row["course_id"]: max(row["capacity"] - row["seats_taken"], 0)
+        for row in CourseOffering.objects.using(alias)
+        .filter(semester=semester, course_id__in=course_ids)
+        .values("course_id")
+        .annotate(capacity=Sum("capacity"), seats_taken=Sum("seats_taken"))
+    }
+
+    planned = []
+    for course_id in course_ids:
+        course = courses[course_id]
+        missing = sorted(
+            code for prerequisite_id, code in prerequisites.get(course_id, ()) if prerequisite_id not in passed
+        )
+        seats_available = seats.get(course_id)
+        already_enrolled = course_id in enrolled
+        planned.append({
+            "course_id": course_id,
+            "code": course["code"],
+            "name": course["name"],
+            "credits": course["credits"],
+            "already_enrolled": already_enrolled,
+            "already_passed": course_id in passed,
+            "missing_prerequisites": missing,
+            # None: the course has no offering in the semester, so it is not seat-limited.
+            "seats_available": seats_available,
+            "can_enroll": not already_enrolled and not missing and seats_available != 0,
+        })
+
+    requested = sum(course["credits"] for course in planned if not course["already_enrolled"])
+    credits_used = load["credits_used"] if load else 0
+    fits = load is not None and credits_used + requested <= load["max_credits"]
+
+    return {
+        "semester": str(semester),
+        "has_load": load is not None,
+        "max_credits": load["max_credits"] if load else None,
+        "credits_used": credits_used,
+        "requested_credits": requested,
+        "total_credits": credits_used + requested,
+        "fits_credit_limit": fits,
+        "awaiting_lottery": semester.awaiting_lottery,
+        "courses": planned,
+        "feasible": fits and not semester.awaiting_lottery and all(course["can_enroll"] for course in planned),
+    }
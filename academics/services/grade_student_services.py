@@ -1,11 +1,18 @@
+import csv
+from decimal import Decimal, InvalidOperation
+from typing import Iterable
+
 from django.db import transaction
+from django.db.models import Q
 from django.core.exceptions import ValidationError, ObjectDoesNotExist
 
 from ..constants import MAX_GRADE, MIN_GRADE
 
 from users.models import User
 from academics.models import Semester, Course, StudentEnrollment, CourseOffering
+from core.db import retry_on_conflict
 
+@retry_on_conflict()
 @transaction.atomic
 def grade_student_in_course(
     teacher: User, 
@@ -15,7 +22,7 @@ def grade_student_in_course(
     grade: float) -> StudentEnrollment:
     """
     Assign a grade to a student in a specific course and semester, ensuring
-    that the teacher is authorized to teach that course.
+    that the teacher teaches the section the student is enrolled in.
 
     Args:
         teacher (User): The teacher assigning the grade.
@@ -30,7 +37,8 @@ def grade_student_in_course(
     Raises:
         ValidationError: If:
             - The user is not a teacher.
-            - The teacher is not assigned to the course offering.
+            - The teacher is not assigned to the student's course offering
+              (or, for enrollments without one, to any offering of the course).
             - The student is not enrolled in the course.
             - The grade is outside the valid range (0.0–5.0).
     """
@@ -41,9 +49,12 @@ def grade_student_in_course(
     if not (MIN_GRADE <= grade <= MAX_GRADE):
         raise ValidationError(f"Grade must be between {MIN_GRADE} and {MAX_GRADE}.")
 
-    if not CourseOffering.objects.filter(
-        teacher=teacher, semester=semester, course=course
-    ).exists():
+    teacher_offering_ids = set(
+        CourseOffering.objects.filter(
+            teacher=teacher, semester=semester, course=course
+        ).values_list("id", flat=True)
+    )
+    if not teacher_offering_ids:
         raise ValidationError("You are not authorized to grade this course.")
 
     try:
@@ -53,8 +64,153 @@ def grade_student_in_course(
     except ObjectDoesNotExist:
         raise ValidationError("The student is not enrolled in this course.")
 
+    # Teaching another section of the course does not allow grading this one.
+    # Enrollments without a section (courses that had several sections when
+    # seats were introduced, no section at enrollment time, or a deleted
+    # section) can be graded by any teacher of the course.
+    if enrollment.offering_id is not None and enrollment.offering_id not in teacher_offering_ids:
+        raise ValidationError("You are not authorized to grade this course.")
+
     enrollment.grade = grade
-    enrollment.full_clean()
-    enrollment.save()
+    # Only the grade changed; skip the FK and unique checks (one query each).
+    enrollment.full_clean(exclude=["student", "semester", "course", "offering"], validate_unique=False)
+    enrollment.save(update_fields=["grade"])
+
+    return enrollment
+
+
+GRADE_IMPORT_COLUMNS = ("student_id", "grade")
+GRADE_IMPORT_CHUNK_SIZE = 500
+
+
+def _parse_grade_row(row: dict) -> tuple[int, Decimal]:
+    """
+    Parse and validate one CSV row of a grade import.
+
+    Raises:
+        ValidationError: If the student ID or the grade is invalid.
+    """
+    try:
+        student_id = int((row.get("student_id") or "").strip())
+    except ValueError:
+        raise ValidationError("Invalid student_id.")
+
+    try:
+        grade = Decimal((row.get("grade") or "").strip())
+    except InvalidOperation:
+        raise ValidationError("Invalid grade value.")
+
+    if not grade.is_finite() or not (Decimal(str(MIN_GRADE)) <= grade <= Decimal(str(MAX_GRADE))):
+        raise ValidationError(f"Grade must be between {MIN_GRADE} and {MAX_GRADE}.")
+
+    if grade != grade.quantize(Decimal("0.1")):
+        raise ValidationError("Grade must have at most one decimal place.")
+
+    return student_id, grade
+
+
+def _apply_grade_chunk(offering: CourseOffering, chunk: list[tuple[int, int, Decimal]], errors: list[dict]) -> list[int]:
+    """
+    Resolve the enrollments of a chunk of parsed rows with one query and write
+    their grades with one bulk update. Students holding a seat in `offering`
+    are graded, as are enrollments in the course that have no section;
+    students of other sections of the course are reported as not enrolled.
+
+    Returns:
+        list[int]: IDs of the students whose grade was updated.
+    """
+    enrollments = {
+        enrollment.student_id: enrollment
+        for enrollment in StudentEnrollment.objects.filter(
+            Q(offering=offering)
+            | Q(offering__isnull=True, semester_id=offering.semester_id, course_id=offering.course_id),
+            student_id__in=[student_id for _, student_id, _ in chunk],
+        ).only("id", "student_id", "grade")
+    }
+
+    to_update = []
+    for row_number, student_id, grade in chunk:
+        enrollment = enrollments.get(student_id)
+        if enrollment is None:
+            errors.append({
+                "row": row_number,
+                "student_id": student_id,
+                "error": "The student is not enrolled in this offering.",
+            })
+            continue
+        enrollment.grade = grade
+        to_update.append(enrollment)
+
+    StudentEnrollment.objects.bulk_update(to_update, ["grade"])
+    return [enrollment.student_id for enrollment in to_update]
+
+
+@transaction.atomic
+def import_grades_from_csv(
+    teacher: User,
+    offering: CourseOffering,
+    lines: Iterable[str],
+    chunk_size: int = GRADE_IMPORT_CHUNK_SIZE) -> dict:
+    """
+    Import the grades of a whole course offering from a CSV stream.
+
+    The CSV must have a `student_id` and a `grade` column. Rows are read
+    incrementally and processed in chunks: authorization runs once, each
+    chunk resolves its enrollments with a single query and is written with
+    a single bulk update. Invalid rows are skipped and reported.
+
+    Args:
+        teacher (User): The teacher importing the grades.
+        offering (CourseOffering): The offering whose students are graded.
+        lines (Iterable[str]): Text lines of the CSV file, header included.
+        chunk_size (int): Number of rows resolved and written per query.
+
+    Returns:
+        dict: `updated` with the number of grades written and `errors` with
+              one entry (`row`, `student_id`, `error`) per rejected row.
+
+    Raises:
+        ValidationError: If:
+            - The user is not a teacher.
+            - The teacher is not assigned to the course offering.
+            - The CSV does not have the required columns.
+    """
+    if teacher.role != teacher.Role.TEACHER:
+        raise ValidationError("Only teachers can assign grades.")
+
+    if offering.teacher_id != teacher.id:
+        raise ValidationError("You are not authorized to grade this course.")
+
+    reader = csv.DictReader(lines)
+    missing_columns = set(GRADE_IMPORT_COLUMNS) - set(reader.fieldnames or [])
+    if missing_columns:
+        raise ValidationError(f"CSV is missing required columns: {sorted(missing_columns)}.")
+
+    errors: list[dict] = []
+    graded_students: list[int] = []
+    seen_students: set[int] = set()
+    chunk: list[tuple[int, int, Decimal]] = []
+
+    # Row 1 is the header, so data rows start at 2 like in a spreadsheet.
+    for row_number, row in enumerate(reader, start=2):
+        try:
+            student_id, grade = _parse_grade_row(row)
+        except ValidationError as e:
+            errors.append({"row": row_number, "student_id": row.get("student_id"), "error": e.messages[0]})
+            continue
+
+        if student_id in seen_students:
+            errors.append({"row": row_number, "student_id": student_id, "error": "Duplicate student_id in file."})
+            continue
+        seen_students.add(student_id)
+
+        chunk.append((row_number, student_id, grade))
+        if len(chunk) >= chunk_size:
+            graded_students += _apply_grade_chunk(offering, chunk, errors)
+            chunk = []
+
+    if chunk:
+        graded_students += _apply_grade_chunk(offering, chunk, errors)
 
-    return enrollment
\ No newline at end of file
+    errors.sort(key=lambda error: error["row"])
+    return {"updated": len(graded_students), "errors": errors}
@@ -0,0 +1,131 @@
+import hashlib
+import json
+from datetime import timedelta
+from typing import NamedTuple
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import DEFAULT_DB_ALIAS, IntegrityError, transaction
+from django.utils import timezone
+
+from academics.models import IdempotencyRecord
+from users.models import User
+
+DEFAULT_IDEMPOTENCY_SETTINGS = {
+    "TTL": 60 * 60 * 24,
+    "PENDING_TIMEOUT": 60,
+}
+
+CLAIMED = "claimed"
+IN_PROGRESS = "in_progress"
+REPLAY = "replay"
+
+
+class IdempotencyClaim(NamedTuple):
+    record: IdempotencyRecord
+    state: str
+
+
+def get_idempotency_settings() -> dict:
+    """
+    Return the IDEMPOTENCY setting merged over the defaults.
+    """
+    return {**DEFAULT_IDEMPOTENCY_SETTINGS, **getattr(settings, "IDEMPOTENCY", {})}
+
+
+def request_fingerprint(method: str, path: str, data) -> str:
+    """
+    Hash the parts of a request that must match for a key to be replayed.
+    """
+    payload = json.dumps([method, path, data], sort_keys=True, separators=(",", ":"), cls=DjangoJSONEncoder)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _records():
+    # Always the primary: a replica that has not caught up would miss the
+    # claim of a request sent a moment ago.
+    return IdempotencyRecord.objects.using(DEFAULT_DB_ALIAS)
+
+
+def _reclaimable(record: IdempotencyRecord, now, config: dict) -> bool:
+    if record.created_at <= now - timedelta(seconds=config["TTL"]):
+        return True
+    return record.status_code is None and record.created_at <= now - timedelta(seconds=config["PENDING_TIMEOUT"])
+
+
+def claim_idempotency_key(user: User, key: str, fingerprint: str) -> IdempotencyClaim:
+    """
+    Claim `key` for a request of `user`, or find the request that already holds it.
+
+    A replay costs a single indexed lookup. The first request inserts a
+    pending row, and the (user, key) unique constraint guarantees that only
+    one of several concurrent retries gets to run. Expired rows and rows
+    left pending past `PENDING_TIMEOUT` (e.g. by a killed worker) are taken
+    over with a conditional update.
+
+    Returns:
+        IdempotencyClaim: The record and whether this request must run the
+                          operation (CLAIMED), wait for it (IN_PROGRESS) or
+                          answer with the stored response (REPLAY).
+
+    Raises:
+        ValidationError: If the key was already used with a different request.
+    """
+    config = get_idempotency_settings()
+    now = timezone.now()
+
+    record = _records().filter(user=user, key=key).first()
+    if record is None:
+        try:
+            with transaction.atomic(using=DEFAULT_DB_ALIAS):
+                record = _records().create(user=user, key=key, fingerprint=fingerprint, created_at=now)
+            return IdempotencyClaim(record, CLAIMED)
+        except IntegrityError:
+            record = _records().get(user=user, key=key)
+
+    if _reclaimable(record, now, config):
+        taken = _records().filter(pk=record.pk, created_at=record.created_at).update(
+            fingerprint=fingerprint, status_code=None, response_body=None, created_at=now
+        )
+        if taken:
+            record.fingerprint, record.status_code, record.response_body, record.created_at = (
+                fingerprint, None, None, now
+            )
+            return IdempotencyClaim(record, CLAIMED)
+        record.refresh_from_db()
+
+    if record.fingerprint != fingerprint:
+        raise ValidationError("This Idempotency-Key was already used with a different request.")
+    if record.status_code is None:
+        return IdempotencyClaim(record, IN_PROGRESS)
+    return IdempotencyClaim(record, REPLAY)
+
+
+def store_idempotent_response(record: IdempotencyRecord, status_code: int, body) -> None:
+    """
+    Save the response of a claimed request so retries can replay it.
+    """
+    _records().filter(pk=record.pk).update(status_code=status_code, response_body=body)
+    record.status_code, record.response_body = status_code, body
+
+
+def release_idempotency_key(record: IdempotencyRecord) -> None:
+    """
+    Drop a pending claim so the request can be retried with the same key.
+    """
+    _records().filter(pk=record.pk, status_code__isnull=True).delete()
+
+
+def purge_idempotency_records(ttl: int | None = None) -> int:
+    """
+    Delete the records older than `ttl` seconds (the IDEMPOTENCY TTL by default).
+
+    Returns:
+        int: Number of records deleted.
+    """
+    if ttl is None:
+        ttl = get_idempotency_settings()["TTL"]
+    cutoff = timezone.now() - timedelta(seconds=ttl)
+    deleted, _ = _records().filter(created_at__lt=cutoff).delete()
+    return deleted
@@ -0,0 +1,390 @@
+import random
+from array import array
+from typing import NamedTuple
+
+from django.db import transaction
+from django.core.exceptions import ValidationError
+from django.db.models import F
+from django.utils import timezone
+
+from ..constants import MAX_COURSE_PREFERENCES, PASSING_GRADE
+
+from users.models import User
+from academics.models import (
+    Course,
+    CourseOffering,
+    CoursePreference,
+    Semester,
+    StudentEnrollment,
+    StudentLoadSemester,
+)
+from academics.services.prerequisite_services import PrerequisiteLink
+from academics.services.seat_services import lock_offerings
+from academics.services.semester_services import semester_cache
+from core.db import bulk_insert
+
+
+class LotteryDemand(NamedTuple):
+    """
+    A semester's demand and supply packed into flat arrays indexed by dense
+    positions instead of model instances.
+
+    Preferences use a CSR layout: the ranked courses of student `s` are
+    `pref_courses[pref_offsets[s]:pref_offsets[s + 1]]`, with -1 for a
+    preference the student cannot take. Sections are laid out the same way
+    per course, in id order.
+    """
+    student_ids: array
+    load_ids: array
+    max_credits: array
+    credits_used: array
+    pref_offsets: array
+    pref_courses: array
+    course_ids: array
+    course_credits: array
+    section_offsets: array
+    section_ids: array
+    section_capacity: array
+    section_taken: array
+
+
+class LotteryAllocation(NamedTuple):
+    students: array
+    courses: array
+    sections: array
+    first_choices: int
+
+
+class LotteryResult(NamedTuple):
+    students: int
+    preferences: int
+    enrollments: int
+    first_choices: int
+    students_without_seat: int
+
+
+def _check_lottery_semester(semester: Semester) -> None:
+    if semester.enrollment_mode != Semester.EnrollmentMode.LOTTERY:
+        raise ValidationError(f"Seats of semester {semester} are not allocated by lottery.")
+    if semester.allocated_at is not None:
+        raise ValidationError(f"Seats of semester {semester} were already allocated.")
+
+
+@transaction.atomic
+def submit_course_preferences(student: User, semester: Semester, courses: list[Course]) -> list[CoursePreference]:
+    """
+    Replace a student's ranked course preferences for a lottery semester.
+
+    Args:
+        student (User): The student user instance.
+        semester (Semester): A semester in lottery mode.
+        courses (list[Course]): Wanted courses, most wanted first.
+
+    Returns:
+        list[CoursePreference]: The stored preferences, ordered by rank.
+
+    Raises:
+        ValidationError: If the user is not a student, the semester is not in
+                         lottery mode, was already allocated or its preference
+                         window is closed, the student lacks a semester load,
+                         or the list is empty, too long, repeats a course or
+                         contains courses not offered in the semester.
+    """
+    if student.role != User.Role.STUDENT:
+        raise ValidationError("Only users with the STUDENT role can submit course preferences.")
+
+    _check_lottery_semester(semester)
+
+    now = timezone.now()
+    if not (
+        semester.preferences_open_at and semester.preferences_close_at
+        and semester.preferences_open_at <= now < semester.preferences_close_at
+    ):
+        raise ValidationError(f"The preference window of semester {semester} is closed.")
+
+    if not courses:
+        raise ValidationError("At least one course is required.")
+    if len(courses) > MAX_COURSE_PREFERENCES:
+        raise ValidationError(f"At most {MAX_COURSE_PREFERENCES} course preferences are allowed.")
+
+    course_ids = [course.id for course in courses]
+    if len(set(course_ids)) != len(course_ids):
+        raise ValidationError("The same course cannot be ranked more than once.")
+
+    if not StudentLoadSemester.objects.filter(student=student, semester=semester).exists():
+        raise ValidationError("Student has no configured semester load.")
+
+    offered = set(
+        CourseOffering.objects.filter(semester=semester, course_id__in=course_ids)
+        .values_list("course_id", flat=True)
+    )
+    not_offered = sorted(course.code for course in courses if course.id not in offered)
+    if not_offered:
+        raise ValidationError(f"Courses not offered in semester {semester}: {not_offered}.")
+
+    CoursePreference.objects.filter(student=student, semester=semester).delete()
+    return CoursePreference.objects.bulk_create(
+        [
+            CoursePreference(student=student, semester=semester, course=course, rank=rank)
+            for rank, course in enumerate(courses, start=1)
+        ]
+    )
+
+
+def get_course_preferences(student: User, semester: Semester) -> list[CoursePreference]:
+    """
+    Retrieve a student's course preferences for a semester, ordered by rank.
+    """
+    return list(
+        CoursePreference.objects.filter(student=student, semester=semester)
+        .select_related("course")
+        .order_by("rank")
+    )
+
+
+def load_lottery_demand(semester: Semester) -> LotteryDemand:
+    """
+    Load every preference, load, section and prerequisite the lottery needs
+    with a fixed number of queries, streaming the large ones.
+
+    Preferences the student cannot take (course no longer offered, already
+    enrolled, or missing prerequisites) are kept as -1 so ranks stay aligned;
+    students without a semester load are left out.
+
+    Must run inside a transaction: the semester's loads and sections are
+    locked (loads first, like every enrollment path) until it commits, so
+    the counters written back from this snapshot by `_save_allocation`
+    cannot overwrite a concurrent enrollment, drop or swap.
+    """
+    loads = {
+        student_id: (load_id, max_credits, credits_used)
+        for student_id, load_id, max_credits, credits_used in StudentLoadSemester.objects.select_for_update()
+        .filter(semester=semester)
+        .order_by("id")
+        .values_list("student_id", "id", "max_credits", "credits_used")
+    }
+
+    lock_offerings(CourseOffering.objects.filter(semester=semester).values("id"))
+
+    course_index: dict[int, int] = {}
+    course_ids = array("q")
+    section_offsets = array("l")
+    section_ids = array("q")
+    section_capacity = array("l")
+    section_taken = array("l")
+    for course_id, offering_id, capacity, seats_taken in (
+        CourseOffering.objects.filter(semester=semester)
+        .order_by("course_id", "id")
+        .values_list("course_id", "id", "capacity", "seats_taken")
+    ):
+        if course_id not in course_index:
+            course_index[course_id] = len(course_ids)
+            course_ids.append(course_id)
+            section_offsets.append(len(section_ids))
+        section_ids.append(offering_id)
+        section_capacity.append(capacity)
+        section_taken.append(seats_taken)
+    section_offsets.append(len(section_ids))
+
+    credits_by_id = dict(Course.objects.filter(id__in=course_index).values_list("id", "credits"))
+    course_credits = array("l", (credits_by_id[course_id] for course_id in course_ids))
+
+    required: dict[int, list[int]] = {}
+    for course_id, prerequisite_id in PrerequisiteLink.objects.filter(
+        from_course_id__in=course_index
+    ).values_list("from_course_id", "to_course_id"):
+        required.setdefault(course_id, []).append(prerequisite_id)
+
+    applicants = CoursePreference.objects.filter(semester=semester).values("student_id")
+    passed = set()
+    if required:
+        passed = set(
+            StudentEnrollment.objects.filter(
+                student_id__in=applicants,
+                grade__gte=PASSING_GRADE,
+                course_id__in={p for prerequisites in required.values() for p in prerequisites},
+            ).values_list("student_id", "course_id")
+        )
+    enrolled = set(
+        StudentEnrollment.objects.filter(semester=semester).values_list("student_id", "course_id")
+    )
+
+    student_ids = array("q")
+    load_ids = array("q")
+    max_credits = array("l")
+    credits_used = array("l")
+    pref_offsets = array("l")
+    pref_courses = array("l")
+    current = None
+    for student_id, course_id in (
+        CoursePreference.objects.filter(semester=semester)
+        .order_by("student_id", "rank")
+        .values_list("student_id", "course_id")
+        .iterator(chunk_size=10000)
+    ):
+        load = loads.get(student_id)
+        if load is None:
+            continue
+        if student_id != current:
+            current = student_id
+            student_ids.append(student_id)
+            load_ids.append(load[0])
+            max_credits.append(load[1])
+            credits_used.append(load[2])
+            pref_offsets.append(len(pref_courses))
+
+        index = course_index.get(course_id, -1)
+        if index >= 0 and (
+            (student_id, course_id) in enrolled
+            or any((student_id, p) not in passed for p in required.get(course_id, ()))
+        ):
+            index = -1
+        pref_courses.append(index)
+    pref_offsets.append(len(pref_courses))
+
+    return LotteryDemand(
+        student_ids, load_ids, max_credits, credits_used, pref_offsets, pref_courses,
+        course_ids, course_credits, section_offsets, section_ids, section_capacity, section_taken,
+    )
+
+
+def allocate_seats(demand: LotteryDemand, rng: random.Random) -> LotteryAllocation:
+    """
+    Assign seats with a random priority order drawn once per run.
+
+    Allocation goes in rounds: in each round every student, in lottery
+    order, gets their best remaining preference that still has a seat and
+    fits their remaining credits. The order is reversed on every other
+    round so a good draw does not win every round. Each preference is
+    examined at most once, so the run is linear in the number of preferences.
+    """
+    student_count = len(demand.student_ids)
+    pref_offsets, pref_courses = demand.pref_offsets, demand.pref_courses
+    course_credits, section_offsets = demand.course_credits, demand.section_offsets
+
+    remaining = array("l", (m - u for m, u in zip(demand.max_credits, demand.credits_used)))
+    section_free = array("l", (c - t for c, t in zip(demand.section_capacity, demand.section_taken)))
+    course_free = array(
+        "l",
+        (
+            sum(section_free[section_offsets[c]:section_offsets[c + 1]])
+            for c in range(len(demand.course_ids))
+        ),
+    )
+    next_section = array("l", section_offsets[:-1])
+    cursor = array("l", pref_offsets[:-1])
+
+    students, courses, sections = array("l"), array("l"), array("l")
+    first_choices = 0
+
+    active = list(range(student_count))
+    rng.shuffle(active)
+    round_number = 0
+    while active:
+        for s in (active if round_number % 2 == 0 else reversed(active)):
+            i, end = cursor[s], pref_offsets[s + 1]
+            while i < end:
+                c = pref_courses[i]
+                i += 1
+                if c < 0 or not course_free[c] or course_credits[c] > remaining[s]:
+                    continue
+                k = next_section[c]
+                while not section_free[k]:
+                    k += 1
+                next_section[c] = k
+                section_free[k] -= 1
+                course_free[c] -= 1
+                remaining[s] -= course_credits[c]
+                students.append(s)
+                courses.append(c)
+                sections.append(k)
+                if i - 1 == pref_offsets[s]:
+                    first_choices += 1
+                break
+            cursor[s] = i
+        active = [s for s in active if cursor[s] < pref_offsets[s + 1]]
+        round_number += 1
+
+    return LotteryAllocation(students, courses, sections, first_choices)
+
+
+def _save_allocation(semester: Semester, demand: LotteryDemand, allocation: LotteryAllocation) -> None:
+    bulk_insert(
+        StudentEnrollment,
+        ["student_id", "semester_id", "course_id", "offering_id"],
+        (
+            (demand.student_ids[s], semester.id, demand.course_ids[c], demand.section_ids[k])
+            for s, c, k in zip(allocation.students, allocation.courses, allocation.sections)
+        ),
+    )
+
+    credits = dict.fromkeys(allocation.students, 0)
+    seats = dict.fromkeys(allocation.sections, 0)
+    for s, c, k in zip(allocation.students, allocation.courses, allocation.sections):
+        credits[s] += demand.course_credits[c]
+        seats[k] += 1
+
+    # Counters are incremented rather than overwritten with the snapshot values,
+    # so they stay right even if a row changed after the demand was loaded.
+    StudentLoadSemester.objects.bulk_update(
+        [
+            StudentLoadSemester(id=demand.load_ids[s], credits_used=F("credits_used") + added)
+            for s, added in credits.items()
+        ],
+        ["credits_used"],
+        batch_size=1000,
+    )
+    CourseOffering.objects.bulk_update(
+        [
+            CourseOffering(id=demand.section_ids[k], seats_taken=F("seats_taken") + added)
+            for k, added in seats.items()
+        ],
+        ["seats_taken"],
+        batch_size=1000,
+    )
+
+
+@transaction.atomic
+def run_lottery(semester: Semester, seed: int | None = None, dry_run: bool = False) -> LotteryResult:
+    """
+    Allocate the seats of a lottery semester from the submitted preferences.
+
+    The whole demand is loaded into memory, allocated by `allocate_seats`
+    and written back with bulk inserts and updates in one transaction. The
+    semester row, its student loads and its sections are locked for the run,
+    and the semester is marked as allocated, after which direct enrollment
+    opens for the remaining seats.
+
+    Args:
+        semester (Semester): A semester in lottery mode.
+        seed (int | None): Seed of the draw, to make a run reproducible.
+        dry_run (bool): Compute the allocation without writing it.
+
+    Returns:
+        LotteryResult: Counts describing the allocation.
+
+    Raises:
+        ValidationError: If the semester is not in lottery mode, was already
+                         allocated, or its preference window is still open.
+    """
+    semester = Semester.objects.select_for_update().get(pk=semester.pk)
+    _check_lottery_semester(semester)
+    if semester.preferences_close_at and timezone.now() < semester.preferences_close_at:
+        raise ValidationError(f"The preference window of semester {semester} is still open.")
+
+    demand = load_lottery_demand(semester)
+    allocation = allocate_seats(demand, random.Random(seed))
+
+    if not dry_run:
+        _save_allocation(semester, demand, allocation)
+        semester.allocated_at = timezone.now()
+        semester.save(update_fields=["allocated_at"])
+        semester_cache.invalidate(semester.id)
+
+    return LotteryResult(
+        students=len(demand.student_ids),
+        preferences=len(demand.pref_courses),
+        enrollments=len(allocation.students),
+        first_choices=allocation.first_choices,
+        students_without_seat=len(demand.student_ids) - len(set(allocation.students)),
+    )
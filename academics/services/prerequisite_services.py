@@ -0,0 +1,266 @@
+from django.db import transaction
+from django.core.exceptions import ValidationError
+
+from ..constants import PASSING_GRADE
+
+from users.models import User
+from academics.models import Course, CoursePrerequisiteClosure, StudentEnrollment
+
+PrerequisiteLink = Course.prerequisites.through
+
+
+def get_course_ancestors(course: Course) -> list[Course]:
+    """
+    Retrieve every course that must be completed, directly or transitively,
+    before taking the given course.
+
+    Args:
+        course (Course): The course whose prerequisites will be retrieved.
+
+    Returns:
+        list[Course]: Prerequisite courses ordered from the closest to the farthest.
+    """
+    return list(
+        Course.objects.filter(descendant_links__descendant=course)
+        .order_by("descendant_links__depth", "code")
+    )
+
+
+def get_course_descendants(course: Course) -> list[Course]:
+    """
+    Retrieve every course that requires the given course, directly or transitively.
+
+    Args:
+        course (Course): The prerequisite course.
+
+    Returns:
+        list[Course]: Dependent courses ordered from the closest to the farthest.
+    """
+    return list(
+        Course.objects.filter(ancestor_links__ancestor=course)
+        .order_by("ancestor_links__depth", "code")
+    )
+
+
+def is_prerequisite_of(ancestor: Course, descendant: Course) -> bool:
+    """
+    Check whether `ancestor` is a direct or transitive prerequisite of `descendant`.
+    """
+    return CoursePrerequisiteClosure.objects.filter(
+        ancestor=ancestor, descendant=descendant
+    ).exists()
+
+
+def would_create_cycle(course: Course, prerequisite: Course) -> bool:
+    """
+    Check whether making `prerequisite` a prerequisite of `course` would
+    introduce a cycle in the prerequisite graph.
+    """
+    return course.pk == prerequisite.pk or is_prerequisite_of(course, prerequisite)
+
+
+def find_cycle_prerequisites(course_id: int, prerequisite_ids: set[int]) -> set[int]:
+    """
+    Return the subset of `prerequisite_ids` that would close a cycle if added
+    as prerequisites of the course with id `course_id`.
+    """
+    cyclic = {course_id} & prerequisite_ids
+    cyclic |= set(
+        CoursePrerequisiteClosure.objects.filter(
+            ancestor_id=course_id, descendant_id__in=prerequisite_ids
+        ).values_list("descendant_id", flat=True)
+    )
+    return cyclic
+
+
+@transaction.atomic
+def add_prerequisite_links(course_id: int, prerequisite_ids: set[int]) -> None:
+    """
+    Incrementally extend the closure table after `prerequisite_ids` were
+    added as direct prerequisites of the course with id `course_id`.
+
+    Every ancestor of the new prerequisites (themselves included) becomes an
+    ancestor of the course and of everything that already depends on it.
+    """
+    ancestors: dict[int, int] = {prerequisite_id: 0 for prerequisite_id in prerequisite_ids}
+    for ancestor_id, depth in CoursePrerequisiteClosure.objects.filter(
+        descendant_id__in=prerequisite_ids
+    ).values_list("ancestor_id", "depth"):
+        ancestors[ancestor_id] = min(depth, ancestors.get(ancestor_id, depth))
+
+    descendants: dict[int, int] = {course_id: 0}
+    descendants.update(
+        CoursePrerequisiteClosure.objects.filter(ancestor_id=course_id)
+        .values_list("descendant_id", "depth")
+    )
+
+    wanted = {
+        (ancestor_id, descendant_id): ancestor_depth + descendant_depth + 1
+        for ancestor_id, ancestor_depth in ancestors.items()
+        for descendant_id, descendant_depth in descendants.items()
+    }
+
+    existing = CoursePrerequisiteClosure.objects.filter(
+        ancestor_id__in=ancestors.keys(), descendant_id__in=descendants.keys()
+    )
+    to_update = []
+    for row in existing:
+        depth = wanted.pop((row.ancestor_id, row.descendant_id))
+        if depth < row.depth:
+            row.depth = depth
+            to_update.append(row)
+
+    CoursePrerequisiteClosure.objects.bulk_update(to_update, ["depth"], batch_size=1000)
+    CoursePrerequisiteClosure.objects.bulk_create(
+        [
+            CoursePrerequisiteClosure(ancestor_id=ancestor_id, descendant_id=descendant_id, depth=depth)
+            for (ancestor_id, descendant_id), depth in wanted.items()
+        ],
+        batch_size=1000,
+    )
+
+
+@transaction.atomic
+def rebuild_prerequisite_closure(course_ids: set[int] | None = None) -> int:
+    """
+    Recompute closure rows from the direct prerequisite links.
+
+    When `course_ids` is given only those courses and everything that depends
+    on them are recomputed (used after prerequisite links are removed);
+    otherwise the whole table is rebuilt.
+
+    Args:
+        course_ids (set[int] | None): Courses whose prerequisites changed.
+
+    Returns:
+        int: Number of closure rows written.
+    """
+    if course_ids is None:
+        affected = set(Course.objects.values_list("id", flat=True))
+        CoursePrerequisiteClosure.objects.all().delete()
+    else:
+        affected = set(course_ids) | set(
+            CoursePrerequisiteClosure.objects.filter(ancestor_id__in=course_ids)
+            .values_list("descendant_id", flat=True)
+        )
+        CoursePrerequisiteClosure.objects.filter(descendant_id__in=affected).delete()
+
+    prerequisites_of: dict[int, list[int]] = {course_id: [] for course_id in affected}
+    for course_id, prerequisite_id in PrerequisiteLink.objects.filter(
+        from_course_id__in=affected
+    ).values_list("from_course_id", "to_course_id"):
+        prerequisites_of[course_id].append(prerequisite_id)
+
+    # Ancestors of unaffected prerequisites are still valid in the table.
+    external = {
+        prerequisite_id
+        for prerequisite_ids in prerequisites_of.values()
+        for prerequisite_id in prerequisite_ids
+    } - affected
+    ancestors_of: dict[int, dict[int, int]] = {course_id: {} for course_id in external}
+    for descendant_id, ancestor_id, depth in CoursePrerequisiteClosure.objects.filter(
+        descendant_id__in=external
+    ).values_list("descendant_id", "ancestor_id", "depth"):
+        ancestors_of[descendant_id][ancestor_id] = depth
+
+    # Iterative post-order walk so long prerequisite chains do not hit the recursion limit.
+    for root in affected:
+        stack = [root]
+        visiting = set()
+        while stack:
+            node = stack[-1]
+            if node in ancestors_of:
+                stack.pop()
+                continue
+            pending = [p for p in prerequisites_of[node] if p not in ancestors_of]
+            if pending and node not in visiting:
+                if visiting.intersection(pending):
+                    raise ValidationError(f"Prerequisite cycle detected involving course id={node}.")
+                visiting.add(node)
+                stack.extend(pending)
+                continue
+            stack.pop()
+            visiting.discard(node)
+            ancestors: dict[int, int] = {}
+            for prerequisite_id in prerequisites_of[node]:
+                ancestors[prerequisite_id] = 1
+                for ancestor_id, depth in ancestors_of[prerequisite_id].items():
+                    if depth + 1 < ancestors.get(ancestor_id, depth + 2):
+                        ancestors[ancestor_id] = depth + 1
+            ancestors_of[node] = ancestors
+
+    rows = [
+        CoursePrerequisiteClosure(ancestor_id=ancestor_id, descendant_id=course_id, depth=depth)
+        for course_id in affected
+        for ancestor_id, depth in ancestors_of[course_id].items()
+    ]
+    CoursePrerequisiteClosure.objects.bulk_create(rows, batch_size=1000)
+    return len(rows)
+
+
+def get_passed_course_ids(student: User, course_ids: set[int] | None = None) -> frozenset[int]:
+    """
+    Retrieve the IDs of the courses the student has passed, with a single query.
+
+    The set is read from the database on every call rather than cached, so a
+    grade written by any process is seen by the next prerequisite check.
+
+    Args:
+        student (User): The student whose passed courses will be retrieved.
+        course_ids (set[int] | None): Only look at these courses, when given.
+
+    Returns:
+        frozenset[int]: IDs of the courses graded at or above PASSING_GRADE.
+    """
+    enrollments = StudentEnrollment.objects.filter(student=student, grade__gte=PASSING_GRADE)
+    if course_ids is not None:
+        enrollments = enrollments.filter(course_id__in=course_ids)
+    return frozenset(enrollments.values_list("course_id", flat=True))
+
+
+def get_missing_prerequisites(student: User, courses: list[Course]) -> dict[Course, list[str]]:
+    """
+    Find the direct prerequisites the student has not passed yet for each course.
+
+    Runs a constant number of queries regardless of how many prerequisites
+    the courses have: one for the prerequisite links and one for the
+    prerequisites the student has passed.
+
+    Args:
+        student (User): The student to check.
+        courses (list[Course]): The courses the student wants to take.
+
+    Returns:
+        dict[Course, list[str]]: Codes of the missing prerequisites, keyed by
+                                 course. Courses with nothing missing are omitted.
+    """
+    courses_by_id = {course.id: course for course in courses}
+    links = list(
+        PrerequisiteLink.objects.filter(from_course_id__in=courses_by_id)
+        .values_list("from_course_id", "to_course_id", "to_course__code")
+    )
+    if not links:
+        return {}
+
+    passed = get_passed_course_ids(student, {prerequisite_id for _, prerequisite_id, _ in links})
+    missing: dict[Course, list[str]] = {}
+    for course_id, prerequisite_id, prerequisite_code in links:
+        if prerequisite_id not in passed:
+            missing.setdefault(courses_by_id[course_id], []).append(prerequisite_code)
+    return missing
+
+
+def check_prerequisites(student: User, courses: list[Course]) -> None:
+    """
+    Ensure the student has passed every direct prerequisite of the given courses.
+
+    Raises:
+        ValidationError: If any prerequisite is missing.
+    """
+    missing = get_missing_prerequisites(student, courses)
+    if missing:
+        details = "; ".join(
+            f"{course.code} requires {', '.join(sorted(codes))}"
+            for course, codes in missing.items()
+        )
+        raise ValidationError(f"Missing prerequisites: {details}.")
@@ -0,0 +1,126 @@
+from django.db.models import Count, F, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+from django.core.exceptions import ValidationError
+
+from academics.models import Course, CourseOffering, Semester, StudentEnrollment
+
+
+def reserve_seat(offering: CourseOffering) -> bool:
+    """
+    Atomically take one seat of the offering if any is left.
+
+    Runs as a single conditional UPDATE (seats_taken + 1 WHERE seats_taken <
+    capacity), so concurrent reservations only lock the offering row for the
+    rest of their transaction and can never overbook it.
+
+    Returns:
+        bool: True if the seat was taken, False if the offering is full.
+    """
+    updated = CourseOffering.objects.filter(
+        pk=offering.pk,
+        seats_taken__lt=F("capacity"),
+    ).update(seats_taken=F("seats_taken") + 1)
+
+    if updated:
+        offering.seats_taken += 1
+    else:
+        offering.refresh_from_db(fields=["seats_taken", "capacity"])
+    return bool(updated)
+
+
+def release_seat(offering: CourseOffering) -> None:
+    """
+    Give back one seat of the offering.
+    """
+    CourseOffering.objects.filter(pk=offering.pk, seats_taken__gt=0).update(
+        seats_taken=F("seats_taken") - 1
+    )
+    offering.seats_taken = max(offering.seats_taken - 1, 0)
+
+
+def take_seat(semester: Semester, course: Course, offering: CourseOffering | None = None) -> CourseOffering | None:
+    """
+    Take a seat for `course` in `semester`.
+
+    With an explicit `offering` only that section is tried. Otherwise the
+    sections of the course are tried in id order until one has a free seat.
+    Courses without any offering in the semester are not seat-limited and
+    return None.
+
+    Raises:
+        ValidationError: If the offering does not match the course and
+                         semester, or every section is full.
+    """
+    if offering is not None:
+        if offering.course_id != course.id or offering.semester_id != semester.id:
+            raise ValidationError("The offering does not belong to this course and semester.")
+        if not reserve_seat(offering):
+            raise ValidationError(
+                f"Offering {offering.id} of {course.code} is full ({offering.capacity} seats)."
+            )
+        return offering
+
+    offerings = list(
+        CourseOffering.objects.filter(course=course, semester=semester).order_by("id")
+    )
+    if not offerings:
+        return None
+
+    for candidate in offerings:
+        if candidate.seats_taken < candidate.capacity and reserve_seat(candidate):
+            return candidate
+    raise ValidationError(f"{course.code} has no seats left in {semester}.")
+
+
+def lock_offerings(offering_ids) -> None:
+    """
+    Lock the given offering rows (SELECT ... FOR UPDATE) in id order.
+
+    Operations that touch several offerings call this first so every
+    transaction acquires the row locks in the same order and two of them
+    can never wait on each other.
+    """
+    list(
+        CourseOffering.objects.select_for_update()
+        .filter(id__in=offering_ids)
+        .order_by("id")
+        .values_list("id", flat=True)
+    )
+
+
+def rebuild_seat_counters() -> int:
+    """
+    Recompute every `seats_taken` counter from the enrollments linked to the offering.
+
+    Returns:
+        int: Number of offerings updated.
+    """
+    taken = (
+        StudentEnrollment.objects.filter(offering=OuterRef("pk"))
+        .values("offering")
+        .annotate(total=Count("id"))
+        .values("total")
+    )
+    return CourseOffering.objects.update(seats_taken=Coalesce(Subquery(taken), 0))
+
+
+def find_seat_violations(semester: Semester | None = None) -> list[dict]:
+    """
+    Find offerings that are overbooked or whose `seats_taken` disagrees
+    with the number of linked enrollments.
+
+    Args:
+        semester (Semester | None): Restrict the check to one semester.
+
+    Returns:
+        list[dict]: Offending offerings with `capacity`, `seats_taken` and the real `enrolled`.
+    """
+    queryset = CourseOffering.objects.all()
+    if semester is not None:
+        queryset = queryset.filter(semester=semester)
+    return list(
+        queryset.annotate(enrolled=Count("enrollments"))
+        .filter(Q(enrolled__gt=F("capacity")) | ~Q(enrolled=F("seats_taken")))
+        .values("id", "course_id", "semester_id", "capacity", "seats_taken", "enrolled")
+        .order_by("id")
+    )
@@ -1,25 +1,53 @@
+from datetime import datetime
+
 from django.core.exceptions import ValidationError, ObjectDoesNotExist
 
+from core.cache import ReadThroughCache
+from core.pagination import KeysetPage, apaginate_by_key, paginate_by_key
 from academics.models import Semester
 
-def create_semester(year: int, term: int) -> Semester:
+semester_cache = ReadThroughCache("semester")
+
+def create_semester(
+    year: int,
+    term: int,
+    enrollment_mode: str = Semester.EnrollmentMode.FCFS,
+    preferences_open_at: datetime | None = None,
+    preferences_close_at: datetime | None = None,
+) -> Semester:
     """
     Create a new academic semester if it does not already exist.
 
     Args:
         year (int): The year of the semester (e.g., 2025).
         term (int): The term number (1 for first, 2 for second).
+        enrollment_mode (str): "fcfs" to enroll directly, or "lottery" to
+            allocate seats from ranked course preferences.
+        preferences_open_at (datetime | None): Start of the preference window (lottery only).
+        preferences_close_at (datetime | None): End of the preference window (lottery only).
 
     Returns:
         Semester: The created or existing Semester instance.
 
     Raises:
-        ValidationError: If a semester with the same year and term already exists.
+        ValidationError: If a semester with the same year and term already exists,
+                         or a lottery semester lacks a valid preference window.
     """
     if Semester.objects.filter(year=year, term=term).exists():
         raise ValidationError(f"Semester {year}-{term} already exists.")
 
-    semester = Semester.objects.create(year=year, term=term)
+    if enrollment_mode == Semester.EnrollmentMode.LOTTERY and not (
+        preferences_open_at and preferences_close_at and preferences_open_at < preferences_close_at
+    ):
+        raise ValidationError("Lottery semesters require a preference window that closes after it opens.")
+
+    semester = Semester.objects.create(
+        year=year,
+        term=term,
+        enrollment_mode=enrollment_mode,
+        preferences_open_at=preferences_open_at,
+        preferences_close_at=preferences_close_at,
+    )
     return semester
 
 
@@ -32,6 +60,35 @@ def list_semesters() -> list[Semester]:
     """
     return Semester.objects.all().order_by("year", "term")
 
+
+def list_semesters_page(after_id: int | None = None, page_size: int = 100) -> KeysetPage:
+    """
+    Retrieve one page of semesters ordered by ID.
+
+    Args:
+        after_id (int | None): ID of the last semester of the previous page.
+        page_size (int): Maximum number of semesters to return.
+
+    Returns:
+        KeysetPage: The semesters and the cursor of the next page, if any.
+    """
+    return paginate_by_key(Semester.objects.all(), after_id, page_size)
+
+
+async def alist_semesters() -> list[Semester]:
+    """
+    Async counterpart of `list_semesters`.
+    """
+    return [semester async for semester in Semester.objects.all().order_by("year", "term")]
+
+
+async def alist_semesters_page(after_id: int | None = None, page_size: int = 100) -> KeysetPage:
+    """
+    Async counterpart of `list_semesters_page`.
+    """
+    return await apaginate_by_key(Semester.objects.all(), after_id, page_size)
+
+
 def get_semester_by_id(semester_id: int) -> Semester:
     """
     Retrieve a Semester instance by its ID.
@@ -48,9 +105,29 @@ def get_semester_by_id(semester_id: int) -> Semester:
     if not isinstance(semester_id, int) or semester_id <= 0:
         raise ValidationError("Invalid semester ID provided.")
 
-    try:
-        semester = Semester.objects.get(id=semester_id)
-    except ObjectDoesNotExist:
-        raise ValidationError(f"Semester with id={semester_id} does not exist.")
+    def load() -> Semester:
+        try:
+            return Semester.objects.get(id=semester_id)
+        except ObjectDoesNotExist:
+            raise ValidationError(f"Semester with id={semester_id} does not exist.")
+
+    return semester_cache.get_or_load(semester_id, load)
+
+
+async def aget_semester_by_id(semester_id: int) -> Semester:
+    """
+    Async counterpart of `get_semester_by_id`, sharing its cache.
+
+    Raises:
+        ValidationError: If the semester_id is invalid or the semester does not exist.
+    """
+    if not isinstance(semester_id, int) or semester_id <= 0:
+        raise ValidationError("Invalid semester ID provided.")
+
+    async def load() -> Semester:
+        try:
+            return await Semester.objects.aget(id=semester_id)
+        except ObjectDoesNotExist:
+            raise ValidationError(f"Semester with id={semester_id} does not exist.")
 
-    return semester
\ No newline at end of file
+    return await semester_cache.aget_or_load(semester_id, load)
@@ -1,61 +1,330 @@
-from django.db import transaction, models
+from django.db import IntegrityError, transaction
 from django.core.exceptions import ValidationError, ObjectDoesNotExist
 
 from users.models import User
 from academics.models import (
     Course, 
+    CourseOffering,
     Semester, 
     StudentEnrollment, 
     StudentLoadSemester,
     )
+from academics.services.credit_services import release_student_credits, reserve_student_credits
+from academics.services.prerequisite_services import check_prerequisites
+from academics.services.seat_services import lock_offerings, release_seat, take_seat
+from academics.services.waitlist_services import prepare_waitlist_promotion, promote_from_waitlist
+from core.db import retry_on_conflict
 
 
+def _lock_student_load(student: User, semester: Semester) -> StudentLoadSemester:
+    """
+    Fetch the student's load for the semester with a row lock (SELECT ... FOR UPDATE).
+
+    Enrollments of the same student in the same semester queue on this row
+    until the holder commits, so their duplicate and credit checks see each
+    other's writes. Other students are never blocked.
+
+    Raises:
+        ValidationError: If the student has no load for the semester.
+    """
+    try:
+        return StudentLoadSemester.objects.select_for_update().get(student=student, semester=semester)
+    except ObjectDoesNotExist:
+        raise ValidationError("Student has no configured semester load.")
+
+
+@retry_on_conflict()
 @transaction.atomic
-def enroll_student_in_course(student: User, semester: Semester, course: Course) -> StudentEnrollment:
+def enroll_student_in_course(
+    student: User,
+    semester: Semester,
+    course: Course,
+    offering: CourseOffering | None = None,
+) -> StudentEnrollment:
     """
     Enroll a student in a course for a specific semester,
-    validating credit limits and preventing duplicates.
+    validating prerequisites, credit limits and seats and preventing duplicates.
 
     Args:
         student (User): The student user instance.
         semester (Semester): The semester instance.
         course (Course): The course to enroll in.
+        offering (CourseOffering | None): Section to take a seat in. When
+            omitted, the first section of the course with free seats is used.
 
     Returns:
         StudentEnrollment: The created enrollment instance.
 
     Raises:
         ValidationError: If the user is not a student, already enrolled,
-                         lacks a semester load, or exceeds their credit limit.
+                         lacks a semester load, has not passed the course
+                         prerequisites, exceeds their credit limit, no
+                         seat is left, or the semester is awaiting its lottery.
     """
     if student.role != User.Role.STUDENT:
         raise ValidationError("Only users with the STUDENT role can enroll in courses.")
 
-    try:
-        student_load = StudentLoadSemester.objects.get(student=student, semester=semester)
-    except ObjectDoesNotExist:
-        raise ValidationError("Student has no configured semester load.")
+    if semester.awaiting_lottery:
+        raise ValidationError(f"Seats of semester {semester} are allocated by lottery.")
+
+    student_load = _lock_student_load(student, semester)
 
     if StudentEnrollment.objects.filter(student=student, semester=semester, course=course).exists():
         raise ValidationError("Student is already enrolled in this course for the given semester.")
 
-    current_credits = (
-        StudentEnrollment.objects.filter(student=student, semester=semester)
-        .select_related("course")
-        .aggregate(total=models.Sum("course__credits"))["total"]
-        or 0
-    )
+    check_prerequisites(student, [course])
 
-    if current_credits + course.credits > student_load.max_credits:
+    if not reserve_student_credits(student_load, course.credits):
         raise ValidationError(
             f"Enrollment would exceed credit limit ({student_load.max_credits}). "
-            f"Current: {current_credits}, New Course: {course.credits}."
+            f"Current: {student_load.credits_used}, New Course: {course.credits}."
         )
 
-    enrollment = StudentEnrollment.objects.create(
-        student=student,
-        semester=semester,
-        course=course
-    )
+    # Taken last so the offering row stays locked for as short as possible.
+    offering = take_seat(semester, course, offering)
+
+    # No savepoint needed: the ValidationError rolls back the whole atomic block.
+    try:
+        enrollment = StudentEnrollment.objects.create(
+            student=student,
+            semester=semester,
+            course=course,
+            offering=offering,
+        )
+    except IntegrityError:
+        raise ValidationError("Student is already enrolled in this course for the given semester.")
 
     return enrollment
+
+@retry_on_conflict()
+@transaction.atomic
+def enroll_student_in_courses(student: User, semester: Semester, courses: list[Course]) -> list[StudentEnrollment]:
+    """
+    Enroll a student in several courses for a semester in a single
+    all-or-nothing operation.
+
+    Duplicate and credit-limit checks run once over the whole batch using
+    set-based queries, and every enrollment is written with one bulk insert.
+
+    Args:
+        student (User): The student user instance.
+        semester (Semester): The semester instance.
+        courses (list[Course]): The courses to enroll in.
+
+    Returns:
+        list[StudentEnrollment]: The created enrollment instances.
+
+    Raises:
+        ValidationError: If the user is not a student, the batch is empty or
+                         repeats a course, the student is already enrolled in
+                         any of the courses, lacks a semester load, has not
+                         passed their prerequisites, the batch would
+                         exceed their credit limit, a course has no
+                         seat left, or the semester is awaiting its lottery.
+    """
+    if student.role != User.Role.STUDENT:
+        raise ValidationError("Only users with the STUDENT role can enroll in courses.")
+
+    if semester.awaiting_lottery:
+        raise ValidationError(f"Seats of semester {semester} are allocated by lottery.")
+
+    if not courses:
+        raise ValidationError("At least one course is required.")
+
+    course_ids = [course.id for course in courses]
+    if len(set(course_ids)) != len(course_ids):
+        raise ValidationError("The same course cannot be requested more than once.")
+
+    student_load = _lock_student_load(student, semester)
+
+    already_enrolled = set(
+        StudentEnrollment.objects.filter(
+            student=student, semester=semester, course_id__in=course_ids
+        ).values_list("course__code", flat=True)
+    )
+    if already_enrolled:
+        raise ValidationError(
+            f"Student is already enrolled in {sorted(already_enrolled)} for the given semester."
+        )
+
+    check_prerequisites(student, courses)
+
+    new_credits = sum(course.credits for course in courses)
+
+    if not reserve_student_credits(student_load, new_credits):
+        raise ValidationError(
+            f"Enrollment would exceed credit limit ({student_load.max_credits}). "
+            f"Current: {student_load.credits_used}, New Courses: {new_credits}."
+        )
+
+    # Seats are taken in course id order so concurrent batches lock offerings in the same order.
+    offerings = {
+        course.id: take_seat(semester, course)
+        for course in sorted(courses, key=lambda course: course.id)
+    }
+
+    try:
+        return StudentEnrollment.objects.bulk_create(
+            [
+                StudentEnrollment(
+                    student=student,
+                    semester=semester,
+                    course=course,
+                    offering=offerings[course.id],
+                )
+                for course in courses
+            ]
+        )
+    except IntegrityError:
+        raise ValidationError("Student is already enrolled in one of these courses for the given semester.")
+
+
+@retry_on_conflict()
+@transaction.atomic
+def drop_student_enrollment(student: User, semester: Semester, course: Course) -> StudentEnrollment | None:
+    """
+    Drop a student's enrollment in a course and, in the same transaction,
+    give the freed seat to the first eligible student on the offering's waitlist.
+
+    The student's load is locked first, then the loads of the waitlisted
+    students considered for the seat; the offering row is only touched last.
+
+    Args:
+        student (User): The student user instance.
+        semester (Semester): The semester instance.
+        course (Course): The course to drop.
+
+    Returns:
+        StudentEnrollment | None: The enrollment of the student promoted from
+        the waitlist, or None if nobody was promoted.
+
+    Raises:
+        ValidationError: If the student lacks a semester load, is not enrolled
+                         in the course, or the enrollment is already graded.
+    """
+    student_load = _lock_student_load(student, semester)
+
+    enrollment = StudentEnrollment.objects.filter(
+        student=student, semester=semester, course=course
+    ).select_related("offering").first()
+    if enrollment is None:
+        raise ValidationError("Student is not enrolled in this course for the given semester.")
+    if enrollment.grade is not None:
+        raise ValidationError("Graded enrollments cannot be dropped.")
+
+    offering = enrollment.offering
+    enrollment.delete()
+    release_student_credits(student_load, course.credits)
+
+    if offering is None:
+        return None
+
+    return promote_from_waitlist(offering)
+
+
+@retry_on_conflict()
+@transaction.atomic
+def swap_student_enrollment(
+    student: User,
+    semester: Semester,
+    drop_course: Course,
+    add_course: Course,
+    offering: CourseOffering | None = None,
+) -> StudentEnrollment:
+    """
+    Replace one enrollment of a student with another in a single transaction,
+    so the student never loses the old seat unless the new one is granted.
+
+    Also used to move to another section of the same course by passing the
+    same course twice and the target `offering`. The credit check only
+    reserves the difference between both courses.
+
+    Load rows are locked before offering rows, as in every enrollment path:
+    the student's load, then the loads of the waitlisted students considered
+    for the freed seat of the old offering, then every offering involved in
+    id order. Two transactions can still wait on each other's loads when
+    each frees a seat the other's student is waiting for; the database then
+    aborts one of them and `retry_on_conflict` runs it again.
+
+    Args:
+        student (User): The student user instance.
+        semester (Semester): The semester instance.
+        drop_course (Course): The course to give up.
+        add_course (Course): The course to take instead.
+        offering (CourseOffering | None): Section of `add_course` to take a
+            seat in. When omitted, the first section with free seats is used.
+
+    Returns:
+        StudentEnrollment: The new enrollment.
+
+    Raises:
+        ValidationError: If the student is not enrolled in `drop_course`, the
+                         enrollment is graded, the student is already enrolled
+                         in `add_course`, has not passed its prerequisites,
+                         would exceed their credit limit, or no seat is left.
+    """
+    if student.role != User.Role.STUDENT:
+        raise ValidationError("Only users with the STUDENT role can enroll in courses.")
+
+    if semester.awaiting_lottery:
+        raise ValidationError(f"Seats of semester {semester} are allocated by lottery.")
+
+    student_load = _lock_student_load(student, semester)
+
+    enrollment = StudentEnrollment.objects.filter(
+        student=student, semester=semester, course=drop_course
+    ).select_related("offering").first()
+    if enrollment is None:
+        raise ValidationError("Student is not enrolled in this course for the given semester.")
+    if enrollment.grade is not None:
+        raise ValidationError("Graded enrollments cannot be dropped.")
+
+    if drop_course.id == add_course.id:
+        if offering is None or offering.id == enrollment.offering_id:
+            raise ValidationError("Choose a different section of the course to switch to.")
+    else:
+        if StudentEnrollment.objects.filter(student=student, semester=semester, course=add_course).exists():
+            raise ValidationError("Student is already enrolled in this course for the given semester.")
+        check_prerequisites(student, [add_course])
+
+    extra_credits = add_course.credits - drop_course.credits
+    if extra_credits > 0 and not reserve_student_credits(student_load, extra_credits):
+        raise ValidationError(
+            f"Swap would exceed credit limit ({student_load.max_credits}). "
+            f"Current: {student_load.credits_used}, Difference: {extra_credits}."
+        )
+    if extra_credits < 0:
+        release_student_credits(student_load, -extra_credits)
+
+    old_offering = enrollment.offering
+    enrollment.delete()
+    # Picking who gets the old seat locks the loads of waitlisted students,
+    # so it runs before any offering row is locked.
+    promoted = prepare_waitlist_promotion(old_offering) if old_offering is not None else None
+
+    offering_ids = {old_offering.id} if old_offering else set()
+    if offering is not None:
+        offering_ids.add(offering.id)
+    else:
+        offering_ids.update(
+            CourseOffering.objects.filter(course=add_course, semester=semester).values_list("id", flat=True)
+        )
+    lock_offerings(offering_ids)
+
+    if promoted is not None:
+        promoted.save()
+    elif old_offering is not None:
+        release_seat(old_offering)
+    new_offering = take_seat(semester, add_course, offering)
+
+    try:
+        new_enrollment = StudentEnrollment.objects.create(
+            student=student,
+            semester=semester,
+            course=add_course,
+            offering=new_offering,
+        )
+    except IntegrityError:
+        raise ValidationError("Student is already enrolled in this course for the given semester.")
+
+    return new_enrollment
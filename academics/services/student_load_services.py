@@ -1,9 +1,11 @@
 from django.core.exceptions import ValidationError
-from django.db import transaction
+from django.db import IntegrityError, transaction
 
 from academics.models import StudentLoadSemester, Semester
+from core.db import retry_on_conflict
 from users.models import User
 
+@retry_on_conflict()
 @transaction.atomic
 def assign_semester_to_student(student: User, semester: Semester, max_credits: int) -> StudentLoadSemester:
     """
@@ -29,10 +31,13 @@ def assign_semester_to_student(student: User, semester: Semester, max_credits: i
     if StudentLoadSemester.objects.filter(student=student, semester=semester).exists():
         raise ValidationError("This student already has a load assigned for the given semester.")
 
-    student_semester = StudentLoadSemester.objects.create(
-        student=student,
-        semester=semester,
-        max_credits=max_credits,
-    )
+    try:
+        student_semester = StudentLoadSemester.objects.create(
+            student=student,
+            semester=semester,
+            max_credits=max_credits,
+        )
+    except IntegrityError:
+        raise ValidationError("This student already has a load assigned for the given semester.")
 
     return student_semester
@@ -1,10 +1,12 @@
-from django.db import transaction
+from django.db import IntegrityError, transaction
 from django.core.exceptions import ValidationError, ObjectDoesNotExist
 
 from academics.models import Semester, TeacherLoadSemester
 
+from core.db import retry_on_conflict
 from users.models import User
 
+@retry_on_conflict()
 @transaction.atomic
 def assign_semester_to_teacher(teacher: User, semester: Semester, max_credits: int) -> TeacherLoadSemester:
     """
@@ -30,11 +32,14 @@ def assign_semester_to_teacher(teacher: User, semester: Semester, max_credits: i
     if max_credits <= 0:
         raise ValidationError("max_credits must be greater than 0.")
 
-    teacher_load = TeacherLoadSemester.objects.create(
-        teacher=teacher,
-        semester=semester,
-        max_credits=max_credits,
-    )
+    try:
+        teacher_load = TeacherLoadSemester.objects.create(
+            teacher=teacher,
+            semester=semester,
+            max_credits=max_credits,
+        )
+    except IntegrityError:
+        raise ValidationError(f"Teacher {teacher.username} already has a load for {semester}.")
     return teacher_load
 
 
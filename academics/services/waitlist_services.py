@@ -0,0 +1,210 @@
+from django.db import IntegrityError, transaction
+from django.core.exceptions import ValidationError, ObjectDoesNotExist
+
+from users.models import User
+from academics.models import (
+    CourseOffering,
+    StudentEnrollment,
+    StudentLoadSemester,
+    WaitlistEntry,
+)
+from academics.services.credit_services import reserve_student_credits
+from academics.services.prerequisite_services import check_prerequisites
+from academics.services.seat_services import release_seat
+from core.db import retry_on_conflict
+
+
+def get_waitlist_position(entry: WaitlistEntry) -> int:
+    """
+    Return the 1-based position of an entry in its offering's waitlist.
+
+    Counts the entries ahead of it over the (offering, id) index: finding
+    the range is O(log n), but counting it is O(position), since students
+    can leave from the middle of the queue and no stored rank would stay
+    valid. Taking the head of the queue for a promotion stays O(log n).
+    """
+    return WaitlistEntry.objects.filter(offering_id=entry.offering_id, id__lt=entry.id).count() + 1
+
+
+def get_waitlist_entry(student: User, offering: CourseOffering) -> WaitlistEntry:
+    """
+    Retrieve the waitlist entry of a student for an offering.
+
+    Raises:
+        ValidationError: If the student is not on the offering's waitlist.
+    """
+    try:
+        return WaitlistEntry.objects.get(student=student, offering=offering)
+    except ObjectDoesNotExist:
+        raise ValidationError("Student is not on the waitlist of this offering.")
+
+
+@retry_on_conflict()
+@transaction.atomic
+def join_waitlist(student: User, offering: CourseOffering) -> tuple[WaitlistEntry, int]:
+    """
+    Put a student at the end of the waitlist of a full offering.
+
+    The offering row is locked while checking that it is full. A drop picks
+    who gets its seat before it touches the offering row, so an entry
+    created while a drop is running may miss that seat: if nobody else was
+    waiting the seat is released, and the student can enroll directly.
+
+    Args:
+        student (User): The student user instance.
+        offering (CourseOffering): The full offering to wait for.
+
+    Returns:
+        tuple[WaitlistEntry, int]: The entry and its 1-based position.
+
+    Raises:
+        ValidationError: If the user is not a student, lacks a semester load,
+                         is already enrolled in the course or on the waitlist,
+                         has not passed the course prerequisites, the
+                         offering still has free seats, or the semester is
+                         awaiting its lottery.
+    """
+    if student.role != User.Role.STUDENT:
+        raise ValidationError("Only users with the STUDENT role can join a waitlist.")
+
+    offering = CourseOffering.objects.select_for_update().select_related("course", "semester").get(pk=offering.pk)
+
+    if offering.semester.awaiting_lottery:
+        raise ValidationError(f"Seats of semester {offering.semester} are allocated by lottery.")
+
+    if not StudentLoadSemester.objects.filter(student=student, semester=offering.semester).exists():
+        raise ValidationError("Student has no configured semester load.")
+
+    if StudentEnrollment.objects.filter(
+        student=student, semester=offering.semester, course=offering.course
+    ).exists():
+        raise ValidationError("Student is already enrolled in this course for the given semester.")
+
+    if offering.seats_taken < offering.capacity:
+        raise ValidationError("The offering still has free seats; enroll directly instead.")
+
+    check_prerequisites(student, [offering.course])
+
+    try:
+        entry = WaitlistEntry.objects.create(student=student, offering=offering)
+    except IntegrityError:
+        raise ValidationError("Student is already on the waitlist of this offering.")
+
+    return entry, get_waitlist_position(entry)
+
+
+def leave_waitlist(student: User, offering: CourseOffering) -> None:
+    """
+    Remove a student from the waitlist of an offering.
+
+    Raises:
+        ValidationError: If the student is not on the offering's waitlist.
+    """
+    deleted, _ = WaitlistEntry.objects.filter(student=student, offering=offering).delete()
+    if not deleted:
+        raise ValidationError("Student is not on the waitlist of this offering.")
+
+
+def _enroll_from_waitlist(entry: WaitlistEntry, offering: CourseOffering) -> StudentEnrollment | None:
+    """
+    Try to turn a waitlist entry into an enrollment, taking the student's
+    credits and the seat with the same conditional updates as a direct
+    enrollment.
+
+    Returns:
+        StudentEnrollment | None: The enrollment, or None if the student is
+        no longer eligible (no load, already enrolled, prerequisites or
+        credit limit).
+    """
+    student = entry.student
+    student_load = (
+        StudentLoadSemester.objects.select_for_update()
+        .filter(student=student, semester_id=offering.semester_id)
+        .first()
+    )
+    if student_load is None:
+        return None
+
+    if StudentEnrollment.objects.filter(
+        student=student, semester_id=offering.semester_id, course_id=offering.course_id
+    ).exists():
+        return None
+
+    try:
+        check_prerequisites(student, [offering.course])
+    except ValidationError:
+        return None
+
+    if not reserve_student_credits(student_load, offering.course.credits):
+        return None
+
+    return StudentEnrollment(
+        student=student,
+        semester_id=offering.semester_id,
+        course_id=offering.course_id,
+        offering=offering,
+    )
+
+
+def prepare_waitlist_promotion(offering: CourseOffering) -> StudentEnrollment | None:
+    """
+    Pick the student who gets the seat the caller is giving up in `offering`.
+
+    Entries are taken in FIFO order from the (offering, id) index. Each
+    candidate's load is locked while checking it; students who can no longer
+    take the course (for example because it would exceed their
+    `max_credits`) are removed from the waitlist and the next one is tried.
+    The chosen student's credits are reserved and their entry removed.
+
+    Only load rows are locked here, so callers run it before locking any
+    offering row (loads are always locked first), then save the returned
+    enrollment, which moves the seat without changing `seats_taken`, or
+    release the seat if nobody was eligible.
+
+    Args:
+        offering (CourseOffering): The offering whose seat is given up.
+
+    Returns:
+        StudentEnrollment | None: The unsaved enrollment of the promoted
+        student, or None if nobody on the waitlist can take the seat.
+    """
+    offering = CourseOffering.objects.select_related("course").get(pk=offering.pk)
+
+    while True:
+        entry = (
+            WaitlistEntry.objects.select_related("student")
+            .filter(offering=offering)
+            .order_by("id")
+            .first()
+        )
+        if entry is None:
+            return None
+
+        enrollment = _enroll_from_waitlist(entry, offering)
+        entry.delete()
+        if enrollment is not None:
+            return enrollment
+
+
+def promote_from_waitlist(offering: CourseOffering) -> StudentEnrollment | None:
+    """
+    Give the seat the caller is giving up in `offering` to the first eligible
+    student on its waitlist, or release it if there is none.
+
+    Must run inside the transaction that gives up the seat, in place of
+    `release_seat` and before any offering row is locked.
+
+    Args:
+        offering (CourseOffering): The offering whose seat is given up.
+
+    Returns:
+        StudentEnrollment | None: The enrollment of the promoted student, or
+        None if the seat was released.
+    """
+    enrollment = prepare_waitlist_promotion(offering)
+    if enrollment is None:
+        release_seat(offering)
+        return None
+
+    enrollment.save()
+    return enrollment
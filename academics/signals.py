@@ -0,0 +1,68 @@
+from django.core.exceptions import ValidationError
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from academics.models import Course, Semester
+from academics.services.catalog_services import bump_catalog_version
+from academics.services.course_services import course_cache
+from academics.services.semester_services import semester_cache
+from academics.services.prerequisite_services import (
+    add_prerequisite_links,
+    find_cycle_prerequisites,
+    rebuild_prerequisite_closure,
+)
+
+
+@receiver([post_save, post_delete], sender=Semester)
+def invalidate_semester_cache(sender, instance, **kwargs):
+    semester_cache.invalidate(instance.pk)
+
+
+@receiver([post_save, post_delete], sender=Course)
+def invalidate_course_cache(sender, instance, **kwargs):
+    course_cache.invalidate(instance.pk)
+    bump_catalog_version()
+
+
+@receiver(m2m_changed, sender=Course.prerequisites.through)
+def sync_prerequisite_closure(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Keep CoursePrerequisiteClosure in sync with Course.prerequisites and
+    reject links that would create a cycle.
+
+    With `reverse=False` the change was made through `course.prerequisites`
+    (`instance` is the dependent course); with `reverse=True` it was made
+    through `course.dependent_courses` (`instance` is the prerequisite).
+    """
+    if action == "pre_add":
+        edges = [(instance.pk, pk_set)] if not reverse else [(pk, {instance.pk}) for pk in pk_set]
+        for course_id, prerequisite_ids in edges:
+            if find_cycle_prerequisites(course_id, prerequisite_ids):
+                raise ValidationError("Adding this prerequisite would create a cyclic dependency.")
+
+    elif action == "post_add":
+        if not reverse:
+            add_prerequisite_links(instance.pk, pk_set)
+        else:
+            for course_id in pk_set:
+                add_prerequisite_links(course_id, {instance.pk})
+
+    elif action == "post_remove":
+        rebuild_prerequisite_closure({instance.pk} if not reverse else pk_set)
+
+    elif action == "pre_clear" and reverse:
+        instance._cleared_dependent_ids = set(
+            instance.dependent_courses.values_list("id", flat=True)
+        )
+
+    elif action == "post_clear":
+        if not reverse:
+            rebuild_prerequisite_closure({instance.pk})
+        else:
+            rebuild_prerequisite_closure(getattr(instance, "_cleared_dependent_ids", set()))
+
+
+@receiver(m2m_changed, sender=Course.prerequisites.through)
+def invalidate_catalog_on_prerequisite_change(sender, action, **kwargs):
+    if action in ("post_add", "post_remove", "post_clear"):
+        bump_catalog_version()
@@ -0,0 +1,209 @@
+import pytest
+from django.db import OperationalError
+from rest_framework.test import APIClient
+
+from academics.models import (
+    Course,
+    CourseOffering,
+    Semester,
+    StudentEnrollment,
+    StudentLoadSemester,
+    TeacherLoadSemester,
+)
+from academics.services.batch_services import ATOMIC, PER_OPERATION, run_batch
+from users.models import User
+
+BATCH_URL = "/academics/batch/"
+
+
+@pytest.fixture
+def semester():
+    return Semester.objects.create(year=2025, term=1)
+
+
+@pytest.fixture
+def course():
+    return Course.objects.create(code="CS101", name="Intro to CS", credits=3)
+
+
+@pytest.fixture
+def teacher():
+    return User.objects.create_user(username="teacher1", password="pass", role=User.Role.TEACHER)
+
+
+@pytest.fixture
+def student():
+    return User.objects.create_user(username="student1", password="pass", role=User.Role.STUDENT)
+
+
+@pytest.fixture
+def admin_client():
+    admin = User.objects.create_user(username="admin1", password="pass", role=User.Role.ADMIN)
+    client = APIClient()
+    client.force_authenticate(admin)
+    return client
+
+
+def setup_operations(teacher, student, semester, course) -> list[dict]:
+    """The calls that configure a semester, in the order they depend on each other."""
+    return [
+        {"type": "teacher_load.assign",
+         "data": {"teacher_id": teacher.id, "semester_id": semester.id, "max_credits": 20}},
+        {"type": "student_load.assign",
+         "data": {"student_id": student.id, "semester_id": semester.id, "max_credits": 10}},
+        {"type": "course_offering.create",
+         "data": {"teacher_id": teacher.id, "semester_id": semester.id, "course_id": course.id, "capacity": 30}},
+        {"type": "enrollment.create",
+         "data": {"student_id": student.id, "semester_id": semester.id, "course_id": course.id}},
+    ]
+
+
+@pytest.mark.django_db
+class TestBatchServices:
+
+    def test_runs_operations_in_order(self, teacher, student, semester, course):
+        """✅ Later operations should see the rows created by earlier ones."""
+        results = run_batch(setup_operations(teacher, student, semester, course))
+
+        assert [result["status"] for result in results] == [201, 201, 201, 201]
+        assert results[0]["data"] == {"teacher": "teacher1", "semester": str(semester), "max_credits": 20}
+        assert results[2]["data"]["seats_taken"] == 0
+        assert results[3]["data"]["offering"] == CourseOffering.objects.get().id
+        assert StudentLoadSemester.objects.get(student=student).credits_used == 3
+
+    def test_per_operation_failures_are_isolated(self, teacher, student, semester, course):
+        """❌ A failing operation should not undo or stop the others."""
+        operations = setup_operations(teacher, student, semester, course)
+        operations.insert(1, operations[0])
+
+        results = run_batch(operations, mode=PER_OPERATION)
+
+        assert [result["is_ok"] for result in results] == [True, False, True, True, True]
+        assert results[1]["status"] == 400
+        assert "already has a load" in results[1]["error"]
+        assert StudentEnrollment.objects.count() == 1
+
+    def test_invalid_data_is_reported_per_operation(self, teacher, semester):
+        """❌ Data rejected by the endpoint serializer should give its field errors."""
+        results = run_batch([
+            {"type": "teacher_load.assign", "data": {"teacher_id": teacher.id, "semester_id": semester.id}},
+            {"type": "teacher_load.assign",
+             "data": {"teacher_id": teacher.id, "semester_id": semester.id, "max_credits": 12}},
+        ])
+
+        assert results[0]["status"] == 400
+        assert "max_credits" in results[0]["errors"]
+        assert results[1]["is_ok"] is True
+
+    def test_atomic_rolls_back_everything(self, teacher, student, semester, course):
+        """❌ In atomic mode a failure should leave no trace of the batch."""
+        operations = setup_operations(teacher, student, semester, course)
+        operations.append({"type": "enrollment.create", "data": {**operations[3]["data"], "course_id": 999}})
+
+        results = run_batch(operations, mode=ATOMIC)
+
+        assert [result["status"] for result in results] == [424, 424, 424, 424, 400]
+        assert "operation 4 failed" in results[0]["error"]
+        assert not TeacherLoadSemester.objects.exists()
+        assert not StudentLoadSemester.objects.exists()
+        assert not CourseOffering.objects.exists()
+        assert not StudentEnrollment.objects.exists()
+
+    def test_atomic_validates_before_running(self, teacher, student, semester, course):
+        """❌ In atomic mode invalid data should stop the batch before anything runs."""
+        operations = setup_operations(teacher, student, semester, course)
+        operations[2]["data"]["capacity"] = 0
+
+        results = run_batch(operations, mode=ATOMIC)
+
+        assert [result["status"] for result in results] == [424, 424, 400, 424]
+        assert "capacity" in results[2]["errors"]
+        assert not TeacherLoadSemester.objects.exists()
+
+
+@pytest.mark.django_db
+class TestBatchView:
+
+    def test_per_operation_batch(self, admin_client, teacher, student, semester, course):
+        """✅ The endpoint should return one result per operation, in order."""
+        response = admin_client.post(
+            BATCH_URL, {"operations": setup_operations(teacher, student, semester, course)}, format="json"
+        )
+
+        assert response.status_code == 200
+        assert response.json()["is_ok"] is True
+        assert response.json()["mode"] == PER_OPERATION
+        assert [result["status"] for result in response.json()["data"]] == [201, 201, 201, 201]
+
+    def test_failed_atomic_batch(self, admin_client, teacher, student, semester, course):
+        """❌ A rolled back atomic batch should return 400 with every result."""
+        operations = setup_operations(teacher, student, semester, course)
+        operations[3]["data"]["semester_id"] = 999
+
+        response = admin_client.post(BATCH_URL, {"mode": ATOMIC, "operations": operations}, format="json")
+
+        assert response.status_code == 400
+        assert response.json()["is_ok"] is False
+        assert len(response.json()["data"]) == 4
+        assert not CourseOffering.objects.exists()
+
+    def test_unknown_operation_type(self, admin_client):
+        """❌ Operation types outside the registry should be rejected."""
+        response = admin_client.post(
+            BATCH_URL, {"operations": [{"type": "user.delete", "data": {}}]}, format="json"
+        )
+
+        assert response.status_code == 400
+        assert "operations" in response.json()["errors"]
+
+    def test_too_many_operations(self, admin_client, teacher, semester, settings):
+        """❌ Batches over BATCH_MAX_OPERATIONS should be rejected."""
+        settings.BATCH_MAX_OPERATIONS = 1
+        operation = {"type": "teacher_load.assign",
+                     "data": {"teacher_id": teacher.id, "semester_id": semester.id, "max_credits": 10}}
+
+        response = admin_client.post(BATCH_URL, {"operations": [operation, operation]}, format="json")
+
+        assert response.status_code == 400
+        assert not TeacherLoadSemester.objects.exists()
+
+    def test_only_admins(self, student, semester):
+        """❌ Non-admin users should not be able to run batches."""
+        client = APIClient()
+        client.force_authenticate(student)
+
+        response = client.post(BATCH_URL, {"operations": []}, format="json")
+
+        assert response.status_code == 403
+
+
+# retry_on_conflict only retries the outermost transaction, so the test must
+# not run inside the per-test transaction.
+@pytest.mark.django_db(transaction=True)
+class TestAtomicBatchRetry:
+
+    def test_atomic_batch_is_retried_on_conflict(self, teacher, student, semester, course, monkeypatch):
+        """✅ A lock conflict should run the whole atomic batch again."""
+        from academics.services import batch_services
+
+        handler = batch_services.BATCH_OPERATIONS["enrollment.create"].handler
+        calls = []
+
+        def flaky(data):
+            calls.append(1)
+            if len(calls) == 1:
+                raise OperationalError("database is locked")
+            return handler(data)
+
+        monkeypatch.setitem(
+            batch_services.BATCH_OPERATIONS,
+            "enrollment.create",
+            batch_services.BATCH_OPERATIONS["enrollment.create"]._replace(handler=flaky),
+        )
+        monkeypatch.setattr("core.db.time.sleep", lambda seconds: None)
+
+        results = run_batch(setup_operations(teacher, student, semester, course), mode=ATOMIC)
+
+        assert all(result["is_ok"] for result in results)
+        assert len(calls) == 2
+        assert TeacherLoadSemester.objects.count() == 1
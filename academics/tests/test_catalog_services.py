@@ -0,0 +1,141 @@
+import json
+import uuid
+
+import pytest
+from rest_framework.test import APIClient
+
+from academics.models import CatalogVersion, Course
+from academics.services.catalog_services import get_course_catalog_snapshot
+from academics.services.course_services import create_course
+from core.db import end_pin_scope, is_pinned_to_primary, start_pin_scope
+from users.models import User
+
+
+@pytest.mark.django_db
+class TestCourseCatalogSnapshot:
+
+    @pytest.fixture
+    def courses(self):
+        basics = Course.objects.create(code="CS101", name="Intro to CS", credits=3)
+        algorithms = Course.objects.create(code="CS102", name="Algorithms", credits=4)
+        algorithms.prerequisites.add(basics)
+        return basics, algorithms
+
+    def test_snapshot_contains_prerequisites(self, courses):
+        """✅ The snapshot should serialize every course with its prerequisites."""
+        body, etag = get_course_catalog_snapshot()
+        data = json.loads(body)["data"]
+
+        assert [course["code"] for course in data] == ["CS101", "CS102"]
+        assert data[1]["prerequisites_detail"] == [{"id": courses[0].id, "code": "CS101", "name": "Intro to CS"}]
+        assert etag.startswith('"') and etag.endswith('"')
+
+    def test_build_does_not_depend_on_catalog_size(self, courses, django_assert_num_queries):
+        """✅ Building the snapshot costs two queries (plus the version lookup) no matter how many courses exist."""
+        for i in range(10):
+            Course.objects.create(code=f"EXTRA{i}", name=f"Extra {i}", credits=2).prerequisites.add(courses[0])
+
+        with django_assert_num_queries(3):
+            get_course_catalog_snapshot()
+
+    def test_snapshot_is_served_from_cache(self, courses, django_assert_num_queries):
+        """✅ A second read should only look up the catalog version."""
+        first = get_course_catalog_snapshot()
+
+        with django_assert_num_queries(1):
+            assert get_course_catalog_snapshot() == first
+
+    def test_course_change_rebuilds_snapshot(self, courses):
+        """✅ Creating a course should produce a new snapshot and ETag."""
+        _, etag = get_course_catalog_snapshot()
+
+        Course.objects.create(code="CS103", name="AI Fundamentals", credits=2)
+
+        body, new_etag = get_course_catalog_snapshot()
+        assert new_etag != etag
+        assert len(json.loads(body)["data"]) == 3
+
+    def test_create_course_bumps_version_once(self, monkeypatch):
+        """✅ Creating a course through the service should bump the catalog version once."""
+        from academics import signals
+
+        bumps = []
+        monkeypatch.setattr(signals, "bump_catalog_version", lambda: bumps.append(1))
+
+        create_course(code="CS201", name="Databases", credits=3)
+
+        assert len(bumps) == 1
+
+    def test_prerequisite_change_rebuilds_snapshot(self, courses):
+        """✅ Removing a prerequisite link should produce a new snapshot."""
+        _, etag = get_course_catalog_snapshot()
+
+        courses[1].prerequisites.remove(courses[0])
+
+        body, new_etag = get_course_catalog_snapshot()
+        assert new_etag != etag
+        assert json.loads(body)["data"][1]["prerequisites_detail"] == []
+
+    def test_snapshot_is_built_from_primary(self, courses, monkeypatch):
+        """✅ The snapshot outlives the request, so its queries should be pinned to the primary."""
+        from academics.services import catalog_services
+
+        pinned = []
+
+        def get_all_courses():
+            pinned.append(is_pinned_to_primary())
+            return Course.objects.prefetch_related("prerequisites")
+
+        monkeypatch.setattr(catalog_services, "get_all_courses", get_all_courses)
+        token = start_pin_scope()
+        try:
+            get_course_catalog_snapshot()
+            assert not is_pinned_to_primary()
+        finally:
+            end_pin_scope(token)
+
+        assert pinned == [True]
+
+    def test_version_bumped_by_another_process_is_seen(self, courses):
+        """✅ A version written by another process should stop serving the cached snapshot."""
+        _, etag = get_course_catalog_snapshot()
+
+        # Another worker or a management command changes a course and its
+        # version; nothing in this process's cache is touched.
+        Course.objects.filter(pk=courses[0].pk).update(name="Programming I")
+        CatalogVersion.objects.update(token=uuid.uuid4().hex)
+
+        body, new_etag = get_course_catalog_snapshot()
+        assert new_etag != etag
+        assert json.loads(body)["data"][0]["name"] == "Programming I"
+
+
+@pytest.mark.django_db
+class TestCourseCatalogView:
+
+    @pytest.fixture
+    def client(self):
+        client = APIClient()
+        admin = User.objects.create_user(username="admin1", password="pass", role=User.Role.ADMIN)
+        client.force_authenticate(admin)
+        return client
+
+    def test_catalog_returns_etag(self, client):
+        """✅ The catalog response should carry a strong ETag."""
+        Course.objects.create(code="CS101", name="Intro to CS", credits=3)
+
+        response = client.get("/academics/courses/")
+
+        assert response.status_code == 200
+        assert response["ETag"] == get_course_catalog_snapshot()[1]
+        assert json.loads(response.content)["is_ok"] is True
+
+    def test_matching_etag_returns_not_modified(self, client):
+        """✅ A matching If-None-Match should return 304 without a body."""
+        Course.objects.create(code="CS101", name="Intro to CS", credits=3)
+        etag = client.get("/academics/courses/")["ETag"]
+
+        response = client.get("/academics/courses/", HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 304
+        assert response.content == b""
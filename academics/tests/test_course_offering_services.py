@@ -1,14 +1,18 @@
 import pytest
 from django.core.exceptions import ValidationError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
 
 from academics.models import (
     Course,
     Semester,
     CourseOffering,
+    StudentEnrollment,
     TeacherLoadSemester,
 )
-from academics.services.course_offering_services import create_course_offering
-from users.models import User
+from academics.services.course_offering_services import create_course_offering, get_offering_roster_page
+from users.models import StudentProfile, User
 
 
 @pytest.mark.django_db
@@ -81,4 +85,55 @@ class TestCreateCourseOfferingService:
 
         total_credits = sum(o.course.credits for o in CourseOffering.objects.filter(teacher=teacher))
         assert total_credits == 9
-        assert CourseOffering.objects.count() == 3
\ No newline at end of file
+        assert CourseOffering.objects.count() == 3
+
+
+@pytest.mark.django_db
+class TestOfferingRoster:
+
+    @pytest.fixture
+    def teacher(self):
+        return User.objects.create_user(username="prof_john", password="password123", role=User.Role.TEACHER)
+
+    @pytest.fixture
+    def offering(self, teacher):
+        semester = Semester.objects.create(year=2025, term=1)
+        course = Course.objects.create(code="CS101", name="Intro to CS", credits=3)
+        offering = CourseOffering.objects.create(teacher=teacher, semester=semester, course=course)
+        for i in range(5):
+            student = User.objects.create_user(
+                username=f"student{i}", password="pass", first_name=f"Name{i}", role=User.Role.STUDENT
+            )
+            StudentProfile.objects.create(user=student, enrollment_number=f"2025{i:03d}", program="CS")
+            StudentEnrollment.objects.create(
+                student=student, semester=semester, course=course, offering=offering, grade=3 if i == 0 else None
+            )
+        return offering
+
+    def test_roster_pages_in_one_query_each(self, offering):
+        """✅ Each roster page should be loaded with a single joined query."""
+        with CaptureQueriesContext(connection) as queries:
+            first = get_offering_roster_page(offering, page_size=3)
+        assert len(queries) == 1
+        assert [row["username"] for row in first.items] == ["student0", "student1", "student2"]
+        assert first.items[0]["enrollment_number"] == "2025000"
+        assert first.items[0]["grade"] == 3
+
+        second = get_offering_roster_page(offering, after_id=first.items[-1]["id"], page_size=3)
+        assert [row["username"] for row in second.items] == ["student3", "student4"]
+        assert second.next_cursor is None
+
+    def test_roster_endpoint_is_limited_to_own_offerings(self, offering, teacher):
+        """❌ Teachers should only see the roster of their own offerings."""
+        client = APIClient()
+        url = f"/academics/courses-offering/{offering.id}/roster/"
+
+        client.force_authenticate(teacher)
+        response = client.get(url, {"page_size": 2})
+        assert response.status_code == 200
+        assert len(response.data["data"]) == 2
+        assert response.data["next_cursor"]
+
+        other = User.objects.create_user(username="prof_jane", password="pass", role=User.Role.TEACHER)
+        client.force_authenticate(other)
+        assert client.get(url).status_code == 403
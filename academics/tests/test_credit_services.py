@@ -0,0 +1,113 @@
+import pytest
+
+from academics.models import (
+    Course,
+    Semester,
+    CourseOffering,
+    StudentEnrollment,
+    StudentLoadSemester,
+    TeacherLoadSemester,
+)
+from academics.services.credit_services import (
+    reserve_student_credits,
+    release_student_credits,
+    reserve_teacher_credits,
+    rebuild_credit_counters,
+    find_credit_violations,
+)
+from users.models import User
+
+
+@pytest.mark.django_db
+class TestCreditServices:
+
+    @pytest.fixture
+    def student(self):
+        return User.objects.create_user(username="student1", password="pass", role=User.Role.STUDENT)
+
+    @pytest.fixture
+    def teacher(self):
+        return User.objects.create_user(username="teacher1", password="pass", role=User.Role.TEACHER)
+
+    @pytest.fixture
+    def semester(self):
+        return Semester.objects.create(year=2025, term=1)
+
+    def test_reserve_within_limit(self, student, semester):
+        """✅ Should add credits to the counter while under max_credits."""
+        load = StudentLoadSemester.objects.create(student=student, semester=semester, max_credits=10)
+
+        assert reserve_student_credits(load, 6) is True
+        assert reserve_student_credits(load, 4) is True
+
+        load.refresh_from_db()
+        assert load.credits_used == 10
+
+    def test_reserve_over_limit_is_rejected(self, student, semester):
+        """❌ Should not touch the counter if the reservation exceeds max_credits."""
+        load = StudentLoadSemester.objects.create(student=student, semester=semester, max_credits=10)
+        reserve_student_credits(load, 8)
+
+        assert reserve_student_credits(load, 3) is False
+
+        load.refresh_from_db()
+        assert load.credits_used == 8
+
+    def test_reserve_uses_database_value(self, teacher, semester):
+        """❌ A stale in-memory instance must not allow overshooting the limit."""
+        load = TeacherLoadSemester.objects.create(teacher=teacher, semester=semester, max_credits=6)
+        stale = TeacherLoadSemester.objects.get(pk=load.pk)
+
+        assert reserve_teacher_credits(load, 4) is True
+        assert reserve_teacher_credits(stale, 4) is False
+        assert stale.credits_used == 4
+
+    def test_release_never_goes_below_zero(self, student, semester):
+        """✅ Releasing credits should decrease the counter without going negative."""
+        load = StudentLoadSemester.objects.create(student=student, semester=semester, max_credits=10)
+        reserve_student_credits(load, 3)
+
+        release_student_credits(load, 3)
+        release_student_credits(load, 3)
+
+        load.refresh_from_db()
+        assert load.credits_used == 0
+
+    def test_rebuild_credit_counters(self, student, teacher, semester):
+        """✅ Should recompute the counters from enrollments and offerings."""
+        course1 = Course.objects.create(code="CS101", name="Intro to CS", credits=3)
+        course2 = Course.objects.create(code="CS102", name="Algorithms", credits=4)
+        student_load = StudentLoadSemester.objects.create(
+            student=student, semester=semester, max_credits=10, credits_used=9
+        )
+        teacher_load = TeacherLoadSemester.objects.create(teacher=teacher, semester=semester, max_credits=10)
+        StudentEnrollment.objects.create(student=student, semester=semester, course=course1)
+        StudentEnrollment.objects.create(student=student, semester=semester, course=course2)
+        CourseOffering.objects.create(teacher=teacher, semester=semester, course=course2)
+
+        updated = rebuild_credit_counters()
+
+        assert updated == {"students": 1, "teachers": 1}
+        student_load.refresh_from_db()
+        teacher_load.refresh_from_db()
+        assert student_load.credits_used == 7
+        assert teacher_load.credits_used == 4
+
+    def test_find_credit_violations(self, student, teacher, semester):
+        """❌ Loads over their limit or with a stale counter should be reported."""
+        course = Course.objects.create(code="CS101", name="Intro to CS", credits=4)
+        StudentLoadSemester.objects.create(student=student, semester=semester, max_credits=3, credits_used=4)
+        TeacherLoadSemester.objects.create(teacher=teacher, semester=semester, max_credits=10, credits_used=4)
+        StudentEnrollment.objects.create(student=student, semester=semester, course=course)
+        CourseOffering.objects.create(teacher=teacher, semester=semester, course=course)
+
+        violations = find_credit_violations(semester)
+
+        assert violations["teachers"] == []
+        assert violations["students"] == [{
+            "student_id": student.id,
+            "semester_id": semester.id,
+            "max_credits": 3,
+            "credits_used": 4,
+            "credits": 4,
+        }]
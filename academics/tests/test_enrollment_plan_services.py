@@ -0,0 +1,101 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from academics.models import (
+    Course,
+    CourseOffering,
+    Semester,
+    StudentEnrollment,
+    StudentLoadSemester,
+)
+from academics.services.enrollment_plan_services import plan_enrollment
+from users.models import User
+
+
+@pytest.fixture
+def semesters():
+    return Semester.objects.create(year=2024, term=2), Semester.objects.create(year=2025, term=1)
+
+
+@pytest.fixture
+def teacher():
+    return User.objects.create_user(username="teacher1", password="pass", role=User.Role.TEACHER)
+
+
+@pytest.fixture
+def student(semesters):
+    student = User.objects.create_user(username="student1", password="pass", role=User.Role.STUDENT)
+    StudentLoadSemester.objects.create(student=student, semester=semesters[1], max_credits=8, credits_used=3)
+    return student
+
+
+@pytest.fixture
+def courses():
+    return [
+        Course.objects.create(code="CS101", name="Intro to CS", credits=3),
+        Course.objects.create(code="CS102", name="Algorithms", credits=4),
+        Course.objects.create(code="CS103", name="AI Fundamentals", credits=2),
+        Course.objects.create(code="CS104", name="Compilers", credits=3),
+    ]
+
+
+@pytest.mark.django_db
+class TestPlanEnrollment:
+
+    def test_plan_reports_every_check(self, student, teacher, semesters, courses):
+        """✅ Should report credits, taken courses, missing prerequisites and seats."""
+        StudentEnrollment.objects.create(student=student, semester=semesters[0], course=courses[0], grade=4)
+        StudentEnrollment.objects.create(student=student, semester=semesters[1], course=courses[2])
+        courses[1].prerequisites.add(courses[0])
+        courses[3].prerequisites.add(courses[1])
+        CourseOffering.objects.create(teacher=teacher, semester=semesters[1], course=courses[1], capacity=1, seats_taken=1)
+
+        plan = plan_enrollment(student, semesters[1], [courses[1].id, courses[2].id, courses[3].id])
+
+        by_code = {course["code"]: course for course in plan["courses"]}
+        assert plan["requested_credits"] == 7
+        assert plan["total_credits"] == 10
+        assert plan["fits_credit_limit"] is False
+        assert plan["feasible"] is False
+        assert by_code["CS102"]["missing_prerequisites"] == []
+        assert by_code["CS102"]["seats_available"] == 0
+        assert by_code["CS103"]["already_enrolled"] is True
+        assert by_code["CS104"]["missing_prerequisites"] == ["CS102"]
+        assert by_code["CS104"]["seats_available"] is None
+
+    def test_plan_feasible_schedule(self, student, semesters, courses):
+        """✅ A schedule that passes every check should be feasible."""
+        plan = plan_enrollment(student, semesters[1], [courses[0].id])
+
+        assert plan["feasible"] is True
+        assert plan["total_credits"] == 6
+
+    def test_plan_runs_constant_queries_and_writes_nothing(self, student, teacher, semesters, courses):
+        """✅ The query count should not depend on the number of courses."""
+        for course in courses[1:]:
+            course.prerequisites.add(courses[0])
+            CourseOffering.objects.create(teacher=teacher, semester=semesters[1], course=course)
+
+        with CaptureQueriesContext(connection) as one:
+            plan_enrollment(student, semesters[1], [courses[1].id])
+        with CaptureQueriesContext(connection) as three:
+            plan_enrollment(student, semesters[1], [course.id for course in courses[1:]])
+
+        assert len(one) == len(three) == 5
+        assert all(query["sql"].lstrip().upper().startswith("SELECT") for query in three.captured_queries)
+
+    def test_plan_endpoint(self, student, semesters, courses):
+        """✅ Students should plan through the API with comma-separated course ids."""
+        client = APIClient()
+        client.force_authenticate(student)
+
+        response = client.get(
+            "/academics/enrollments/plan/",
+            {"semester_id": semesters[1].id, "course_ids": f"{courses[0].id},{courses[2].id}"},
+        )
+
+        assert response.status_code == 200
+        assert response.data["data"]["requested_credits"] == 5
+        assert not StudentEnrollment.objects.exists()
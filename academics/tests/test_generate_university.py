@@ -0,0 +1,84 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db.models import Sum
+
+from academics.models import (
+    Course,
+    CourseOffering,
+    CoursePrerequisiteClosure,
+    StudentEnrollment,
+    StudentLoadSemester,
+    TeacherLoadSemester,
+)
+from users.models import User
+
+SMALL = {
+    "students": 40,
+    "teachers": 6,
+    "courses": 120,
+    "semesters": 4,
+    "semesters_per_student": 3,
+    "batch_size": 25,
+}
+
+
+def generate(prefix, **overrides):
+    out = StringIO()
+    call_command("generate_university", prefix=prefix, stdout=out, **{**SMALL, **overrides})
+    return out.getvalue()
+
+
+def signature(prefix):
+    return (
+        list(Course.objects.filter(code__startswith=f"{prefix.upper()}-").order_by("code").values_list("credits", flat=True)),
+        list(
+            StudentEnrollment.objects.filter(student__username__startswith=f"{prefix}_")
+            .order_by("student__username", "semester_id", "course__code")
+            .values_list("student__username", "course__code", "grade")
+        ),
+    )
+
+
+@pytest.mark.django_db
+class TestGenerateUniversity:
+
+    def test_generates_consistent_dataset(self):
+        """✅ The generator should create every table with consistent counters."""
+        output = generate("t")
+
+        assert User.objects.filter(role=User.Role.STUDENT).count() == 40
+        assert User.objects.filter(role=User.Role.TEACHER).count() == 6
+        assert Course.objects.count() == 120
+        assert CourseOffering.objects.exists()
+        assert StudentEnrollment.objects.exists()
+        assert CoursePrerequisiteClosure.objects.exists()
+        assert "rows/s" in output
+
+        for load in StudentLoadSemester.objects.all():
+            taken = StudentEnrollment.objects.filter(
+                student=load.student, semester=load.semester
+            ).aggregate(total=Sum("course__credits"))["total"] or 0
+            assert load.credits_used == taken <= load.max_credits
+        for load in TeacherLoadSemester.objects.all():
+            assert load.credits_used <= load.max_credits
+
+    def test_same_seed_same_data(self):
+        """✅ Two runs with the same seed should produce the same dataset."""
+        generate("a", seed=7)
+        generate("b", seed=7)
+
+        credits_a, enrollments_a = signature("a")
+        credits_b, enrollments_b = signature("b")
+        assert credits_a == credits_b
+        assert [row[2] for row in enrollments_a] == [row[2] for row in enrollments_b]
+        assert len(enrollments_a) == len(enrollments_b)
+
+    def test_existing_prefix_fails(self):
+        """❌ Reusing a prefix should be rejected."""
+        generate("dup")
+
+        with pytest.raises(CommandError):
+            generate("dup")
@@ -1,6 +1,8 @@
 import pytest
 from django.core.exceptions import ValidationError, ObjectDoesNotExist
-from django.db import IntegrityError
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import IntegrityError, OperationalError
+from rest_framework.test import APIClient
 
 from academics.models import (
     Course,
@@ -9,7 +11,7 @@ from academics.models import (
     StudentEnrollment,
 )
 from users.models import User
-from academics.services.grade_student_services import grade_student_in_course
+from academics.services.grade_student_services import grade_student_in_course, import_grades_from_csv
 from academics.constants import MIN_GRADE, MAX_GRADE
 
 
@@ -27,13 +29,14 @@ class TestGradeStudentInCourse:
         course = Course.objects.create(code="CS101", name="Intro to CS", credits=3)
 
         # Course offering (teacher teaches this course)
-        CourseOffering.objects.create(teacher=teacher, semester=semester, course=course)
+        offering = CourseOffering.objects.create(teacher=teacher, semester=semester, course=course)
 
         # Enrollment (student is enrolled)
         enrollment = StudentEnrollment.objects.create(
             student=student,
             semester=semester,
-            course=course
+            course=course,
+            offering=offering,
         )
 
         return {
@@ -110,6 +113,40 @@ class TestGradeStudentInCourse:
                 grade=4.0,
             )
 
+    def test_teacher_of_another_section(self, setup_data):
+        """❌ Teaching another section of the course should not allow grading this one."""
+        data = setup_data
+        another_teacher = User.objects.create_user(username="teacher2", password="pass", role=User.Role.TEACHER)
+        CourseOffering.objects.create(teacher=another_teacher, semester=data["semester"], course=data["course"])
+
+        with pytest.raises(ValidationError, match="not authorized to grade this course"):
+            grade_student_in_course(
+                teacher=another_teacher,
+                student=data["student"],
+                semester=data["semester"],
+                course=data["course"],
+                grade=4.0,
+            )
+
+        data["enrollment"].refresh_from_db()
+        assert data["enrollment"].grade is None
+
+    def test_grade_enrollment_without_section(self, setup_data):
+        """✅ Enrollments without a section can be graded by a teacher of the course."""
+        data = setup_data
+        StudentEnrollment.objects.filter(pk=data["enrollment"].pk).update(offering=None)
+
+        enrollment = grade_student_in_course(
+            teacher=data["teacher"],
+            student=data["student"],
+            semester=data["semester"],
+            course=data["course"],
+            grade=3.5,
+        )
+
+        enrollment.refresh_from_db()
+        assert enrollment.grade == 3.5
+
     def test_student_not_enrolled(self, setup_data):
         """❌ Cannot assign a grade if student is not enrolled in the course."""
         data = setup_data
@@ -123,3 +160,140 @@ class TestGradeStudentInCourse:
                 course=data["course"],
                 grade=4.0,
             )
+
+
+@pytest.mark.django_db
+class TestImportGradesFromCsv:
+    @pytest.fixture
+    def setup_data(self):
+        teacher = User.objects.create_user(username="teacher1", password="pass", role=User.Role.TEACHER)
+        semester = Semester.objects.create(year=2025, term=1)
+        course = Course.objects.create(code="CS101", name="Intro to CS", credits=3)
+        offering = CourseOffering.objects.create(teacher=teacher, semester=semester, course=course)
+
+        students = [
+            User.objects.create_user(username=f"student{i}", password="pass", role=User.Role.STUDENT)
+            for i in range(3)
+        ]
+        for student in students:
+            StudentEnrollment.objects.create(student=student, semester=semester, course=course, offering=offering)
+
+        return {"teacher": teacher, "offering": offering, "students": students}
+
+    def _csv(self, *rows):
+        return ["student_id,grade"] + [f"{student_id},{grade}" for student_id, grade in rows]
+
+    def test_import_grades_success(self, setup_data):
+        """✅ Should grade every listed student of the offering."""
+        data = setup_data
+        lines = self._csv(*[(student.id, "4.5") for student in data["students"]])
+
+        result = import_grades_from_csv(teacher=data["teacher"], offering=data["offering"], lines=lines)
+
+        assert result == {"updated": 3, "errors": []}
+        assert all(
+            grade == 4.5 for grade in StudentEnrollment.objects.values_list("grade", flat=True)
+        )
+
+    def test_import_reports_invalid_rows(self, setup_data):
+        """❌ Invalid rows should be reported with their row number and skipped."""
+        data = setup_data
+        outsider = User.objects.create_user(username="outsider", password="pass", role=User.Role.STUDENT)
+        lines = self._csv(
+            (data["students"][0].id, "3.5"),
+            (data["students"][1].id, "9"),
+            (data["students"][2].id, "4.25"),
+            ("abc", "4.0"),
+            (outsider.id, "4.0"),
+            (data["students"][0].id, "2.0"),
+        )
+
+        result = import_grades_from_csv(teacher=data["teacher"], offering=data["offering"], lines=lines)
+
+        assert result["updated"] == 1
+        assert [error["row"] for error in result["errors"]] == [3, 4, 5, 6, 7]
+        assert "between" in result["errors"][0]["error"]
+        assert "one decimal place" in result["errors"][1]["error"]
+        assert "not enrolled" in result["errors"][3]["error"]
+        assert "Duplicate" in result["errors"][4]["error"]
+
+    def test_import_uses_constant_queries(self, setup_data, django_assert_max_num_queries):
+        """✅ A whole chunk is resolved and written with a handful of queries."""
+        data = setup_data
+        lines = self._csv(*[(student.id, "4.0") for student in data["students"]])
+
+        with django_assert_max_num_queries(4):
+            import_grades_from_csv(teacher=data["teacher"], offering=data["offering"], lines=lines)
+
+    def test_import_by_other_teacher_fails(self, setup_data):
+        """❌ Only the offering's teacher can import its grades."""
+        data = setup_data
+        another_teacher = User.objects.create_user(username="teacher2", password="pass", role=User.Role.TEACHER)
+
+        with pytest.raises(ValidationError, match="not authorized to grade this course"):
+            import_grades_from_csv(teacher=another_teacher, offering=data["offering"], lines=self._csv())
+
+    def test_import_skips_other_sections(self, setup_data):
+        """❌ Students of another section of the course should not be graded by the import."""
+        data = setup_data
+        offering = data["offering"]
+        another_teacher = User.objects.create_user(username="teacher2", password="pass", role=User.Role.TEACHER)
+        other_section = CourseOffering.objects.create(
+            teacher=another_teacher, semester=offering.semester, course=offering.course
+        )
+
+        result = import_grades_from_csv(
+            teacher=another_teacher, offering=other_section, lines=self._csv((data["students"][1].id, "1.0"))
+        )
+
+        assert result["updated"] == 0
+        assert "not enrolled" in result["errors"][0]["error"]
+        assert StudentEnrollment.objects.get(student=data["students"][1]).grade is None
+
+    def test_import_grades_enrollments_without_section(self, setup_data):
+        """✅ Enrollments in the course without a section should be graded by the import."""
+        data = setup_data
+        StudentEnrollment.objects.filter(student=data["students"][0]).update(offering=None)
+
+        result = import_grades_from_csv(
+            teacher=data["teacher"], offering=data["offering"], lines=self._csv((data["students"][0].id, "4.0"))
+        )
+
+        assert result == {"updated": 1, "errors": []}
+        assert StudentEnrollment.objects.get(student=data["students"][0]).grade == 4.0
+
+    def test_import_missing_columns(self, setup_data):
+        """❌ The CSV must have student_id and grade columns."""
+        data = setup_data
+
+        with pytest.raises(ValidationError, match="missing required columns"):
+            import_grades_from_csv(teacher=data["teacher"], offering=data["offering"], lines=["student,score"])
+
+
+@pytest.mark.django_db
+class TestGradeImportView:
+
+    def _upload(self, teacher, offering):
+        client = APIClient()
+        client.force_authenticate(teacher)
+        csv_file = SimpleUploadedFile("grades.csv", b"student_id,grade\n", content_type="text/csv")
+        return client.post("/academics/grades/import/", {"offering_id": offering.id, "file": csv_file})
+
+    def test_unexpected_error_returns_json(self, monkeypatch):
+        """❌ An unexpected error should return the standard 500 body instead of Django's error page."""
+        teacher = User.objects.create_user(username="teacher1", password="pass", role=User.Role.TEACHER)
+        semester = Semester.objects.create(year=2025, term=1)
+        course = Course.objects.create(code="CS101", name="Intro to CS", credits=3)
+        offering = CourseOffering.objects.create(teacher=teacher, semester=semester, course=course)
+
+        def fail(**kwargs):
+            raise OperationalError("server closed the connection unexpectedly")
+
+        monkeypatch.setattr("academics.views.grade_views.import_grades_from_csv", fail)
+        response = self._upload(teacher, offering)
+
+        assert response.status_code == 500
+        assert response.json() == {
+            "is_ok": False,
+            "error": "Unexpected error: server closed the connection unexpectedly",
+        }
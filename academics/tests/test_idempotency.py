@@ -0,0 +1,249 @@
+from datetime import timedelta
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from academics.models import (
+    Course,
+    CourseOffering,
+    IdempotencyRecord,
+    Semester,
+    StudentEnrollment,
+    StudentLoadSemester,
+    TeacherLoadSemester,
+)
+from academics.services.idempotency_services import (
+    CLAIMED,
+    IN_PROGRESS,
+    REPLAY,
+    claim_idempotency_key,
+    purge_idempotency_records,
+    request_fingerprint,
+    store_idempotent_response,
+)
+from academics.services.student_enrollment_services import enroll_student_in_course
+from users.models import User
+
+ENROLLMENTS_URL = "/academics/enrollments/"
+
+
+@pytest.fixture
+def semester():
+    return Semester.objects.create(year=2025, term=1)
+
+
+@pytest.fixture
+def course():
+    return Course.objects.create(code="CS101", name="Intro to CS", credits=3)
+
+
+@pytest.fixture
+def teacher(semester):
+    teacher = User.objects.create_user(username="teacher1", password="pass", role=User.Role.TEACHER)
+    TeacherLoadSemester.objects.create(teacher=teacher, semester=semester, max_credits=20)
+    return teacher
+
+
+@pytest.fixture
+def student(semester):
+    student = User.objects.create_user(username="student1", password="pass", role=User.Role.STUDENT)
+    StudentLoadSemester.objects.create(student=student, semester=semester, max_credits=10)
+    return student
+
+
+def client_for(user: User) -> APIClient:
+    client = APIClient()
+    client.force_authenticate(user)
+    return client
+
+
+@pytest.mark.django_db
+class TestIdempotencyServices:
+
+    def test_claim_then_replay(self, student):
+        """✅ The first claim should run the request and later ones replay it."""
+        fingerprint = request_fingerprint("POST", "/x/", {"a": 1})
+        claim = claim_idempotency_key(student, "key-1", fingerprint)
+        assert claim.state == CLAIMED
+
+        assert claim_idempotency_key(student, "key-1", fingerprint).state == IN_PROGRESS
+
+        store_idempotent_response(claim.record, 201, {"is_ok": True})
+        replay = claim_idempotency_key(student, "key-1", fingerprint)
+        assert replay.state == REPLAY
+        assert replay.record.response_body == {"is_ok": True}
+
+    def test_fingerprint_ignores_key_order(self):
+        """✅ The same body should fingerprint the same whatever its key order."""
+        first = request_fingerprint("POST", "/x/", {"a": 1, "b": 2})
+
+        assert first == request_fingerprint("POST", "/x/", {"b": 2, "a": 1})
+        assert request_fingerprint("POST", "/x/", {"a": 1}) != request_fingerprint("POST", "/x/", {"a": 2})
+
+    def test_expired_and_stale_records_are_reclaimed(self, student, settings):
+        """✅ Expired records and pending records past the timeout can be claimed again."""
+        settings.IDEMPOTENCY = {"TTL": 3600, "PENDING_TIMEOUT": 60}
+        fingerprint = request_fingerprint("POST", "/x/", {})
+        done = claim_idempotency_key(student, "done", fingerprint).record
+        store_idempotent_response(done, 201, {"is_ok": True})
+        stale = claim_idempotency_key(student, "stale", fingerprint).record
+        IdempotencyRecord.objects.filter(pk=done.pk).update(created_at=timezone.now() - timedelta(hours=2))
+        IdempotencyRecord.objects.filter(pk=stale.pk).update(created_at=timezone.now() - timedelta(minutes=2))
+
+        assert claim_idempotency_key(student, "done", fingerprint).state == CLAIMED
+        assert claim_idempotency_key(student, "stale", fingerprint).state == CLAIMED
+        assert IdempotencyRecord.objects.get(pk=done.pk).status_code is None
+
+    def test_purge(self, student):
+        """✅ Purging should only delete records older than the TTL."""
+        fingerprint = request_fingerprint("POST", "/x/", {})
+        old = claim_idempotency_key(student, "old", fingerprint).record
+        claim_idempotency_key(student, "new", fingerprint)
+        IdempotencyRecord.objects.filter(pk=old.pk).update(created_at=timezone.now() - timedelta(days=2))
+
+        assert purge_idempotency_records() == 1
+        assert list(IdempotencyRecord.objects.values_list("key", flat=True)) == ["new"]
+
+        call_command("purge_idempotency_keys", "--older-than", "0")
+        assert not IdempotencyRecord.objects.exists()
+
+
+@pytest.mark.django_db
+class TestIdempotentEndpoints:
+
+    def test_enrollment_retry_is_replayed(self, semester, course, student, monkeypatch):
+        """✅ A retried enrollment should return the first response without enrolling again."""
+        client = client_for(student)
+        body = {"student_id": student.id, "semester_id": semester.id, "course_id": course.id}
+
+        first = client.post(ENROLLMENTS_URL, body, format="json", HTTP_IDEMPOTENCY_KEY="abc")
+        monkeypatch.setattr(
+            "academics.views.student_enrollment_views.enroll_student_in_course",
+            lambda **kwargs: pytest.fail("the service should not run on a replay"),
+        )
+        second = client.post(ENROLLMENTS_URL, body, format="json", HTTP_IDEMPOTENCY_KEY="abc")
+
+        assert first.status_code == second.status_code == 201
+        assert second.json() == first.json()
+        assert second["Idempotent-Replayed"] == "true"
+        assert StudentEnrollment.objects.filter(student=student).count() == 1
+        assert StudentLoadSemester.objects.get(student=student).credits_used == 3
+
+    def test_without_key_duplicate_fails(self, semester, course, student):
+        """❌ Without a key, a retried enrollment should still hit the duplicate check."""
+        client = client_for(student)
+        body = {"student_id": student.id, "semester_id": semester.id, "course_id": course.id}
+
+        assert client.post(ENROLLMENTS_URL, body, format="json").status_code == 201
+        assert client.post(ENROLLMENTS_URL, body, format="json").status_code == 400
+        assert not IdempotencyRecord.objects.exists()
+
+    def test_key_reused_with_another_body(self, semester, course, student):
+        """❌ Reusing a key for a different request should return 422."""
+        other = Course.objects.create(code="CS102", name="Data Structures", credits=3)
+        client = client_for(student)
+
+        body = {"student_id": student.id, "semester_id": semester.id, "course_id": course.id}
+        client.post(ENROLLMENTS_URL, body, format="json", HTTP_IDEMPOTENCY_KEY="abc")
+        response = client.post(
+            ENROLLMENTS_URL, {**body, "course_id": other.id}, format="json", HTTP_IDEMPOTENCY_KEY="abc"
+        )
+
+        assert response.status_code == 422
+        assert not StudentEnrollment.objects.filter(course=other).exists()
+
+    def test_request_in_progress(self, semester, course, student):
+        """❌ A retry while the first request is running should return 409."""
+        body = {"student_id": student.id, "semester_id": semester.id, "course_id": course.id}
+        claim_idempotency_key(student, "abc", request_fingerprint("POST", ENROLLMENTS_URL, body))
+
+        response = client_for(student).post(ENROLLMENTS_URL, body, format="json", HTTP_IDEMPOTENCY_KEY="abc")
+
+        assert response.status_code == 409
+        assert not StudentEnrollment.objects.exists()
+
+    def test_keys_are_scoped_per_user(self, semester, course, student):
+        """✅ Two users sending the same key should not see each other's responses."""
+        other = User.objects.create_user(username="student2", password="pass", role=User.Role.STUDENT)
+        StudentLoadSemester.objects.create(student=other, semester=semester, max_credits=10)
+        body = {"student_id": student.id, "semester_id": semester.id, "course_id": course.id}
+
+        client_for(student).post(ENROLLMENTS_URL, body, format="json", HTTP_IDEMPOTENCY_KEY="abc")
+        response = client_for(other).post(
+            ENROLLMENTS_URL, {**body, "student_id": other.id}, format="json", HTTP_IDEMPOTENCY_KEY="abc"
+        )
+
+        assert response.status_code == 201
+        assert "Idempotent-Replayed" not in response
+        assert StudentEnrollment.objects.count() == 2
+
+    def test_server_errors_are_not_stored(self, semester, course, student, monkeypatch):
+        """✅ After a 500 the same key should run the request again."""
+        client = client_for(student)
+        body = {"student_id": student.id, "semester_id": semester.id, "course_id": course.id}
+
+        def fail(**kwargs):
+            raise RuntimeError("database unavailable")
+
+        monkeypatch.setattr("academics.views.student_enrollment_views.enroll_student_in_course", fail)
+        assert client.post(ENROLLMENTS_URL, body, format="json", HTTP_IDEMPOTENCY_KEY="abc").status_code == 500
+        assert not IdempotencyRecord.objects.exists()
+
+        monkeypatch.setattr(
+            "academics.views.student_enrollment_views.enroll_student_in_course", enroll_student_in_course
+        )
+        assert client.post(ENROLLMENTS_URL, body, format="json", HTTP_IDEMPOTENCY_KEY="abc").status_code == 201
+
+    def test_client_errors_are_replayed(self, semester, course, student):
+        """✅ A 400 response should be replayed like any other stored response."""
+        client = client_for(student)
+        body = {"student_id": student.id, "semester_id": semester.id, "course_id": 999}
+
+        first = client.post(ENROLLMENTS_URL, body, format="json", HTTP_IDEMPOTENCY_KEY="abc")
+        second = client.post(ENROLLMENTS_URL, body, format="json", HTTP_IDEMPOTENCY_KEY="abc")
+
+        assert first.status_code == second.status_code == 400
+        assert second["Idempotent-Replayed"] == "true"
+
+    def test_invalid_key(self, semester, course, student):
+        """❌ Keys longer than 255 characters should be rejected."""
+        response = client_for(student).post(
+            ENROLLMENTS_URL,
+            {"student_id": student.id, "semester_id": semester.id, "course_id": course.id},
+            format="json",
+            HTTP_IDEMPOTENCY_KEY="k" * 256,
+        )
+
+        assert response.status_code == 400
+        assert not StudentEnrollment.objects.exists()
+
+    def test_grade_retry_is_replayed(self, semester, course, teacher, student):
+        """✅ A retried grade should be replayed with the same body, decimals included."""
+        CourseOffering.objects.create(teacher=teacher, semester=semester, course=course)
+        enroll_student_in_course(student, semester, course)
+        client = client_for(teacher)
+        body = {"student_id": student.id, "semester_id": semester.id, "course_id": course.id, "grade": "4.5"}
+
+        first = client.post("/academics/grades/", body, format="json", HTTP_IDEMPOTENCY_KEY="g1")
+        second = client.post("/academics/grades/", body, format="json", HTTP_IDEMPOTENCY_KEY="g1")
+
+        assert first.status_code == second.status_code == 201
+        assert second.json() == first.json()
+        assert second.json()["data"]["teacher"] == "teacher1"
+        assert second["Idempotent-Replayed"] == "true"
+
+    def test_offering_retry_is_replayed(self, semester, course, teacher):
+        """✅ A retried offering creation should not fail on the existing offering."""
+        admin = User.objects.create_user(username="admin1", password="pass", role=User.Role.ADMIN)
+        client = client_for(admin)
+        body = {"teacher_id": teacher.id, "semester_id": semester.id, "course_id": course.id, "capacity": 30}
+
+        first = client.post("/academics/courses-offering/", body, format="json", HTTP_IDEMPOTENCY_KEY="o1")
+        second = client.post("/academics/courses-offering/", body, format="json", HTTP_IDEMPOTENCY_KEY="o1")
+
+        assert first.status_code == second.status_code == 201
+        assert second.json() == first.json()
+        assert CourseOffering.objects.count() == 1
+        assert TeacherLoadSemester.objects.get(teacher=teacher).credits_used == 3
@@ -0,0 +1,163 @@
+import random
+from datetime import timedelta
+
+import pytest
+from django.core.exceptions import ValidationError
+from django.core.management import call_command
+from django.utils import timezone
+
+from academics.models import (
+    Course,
+    CourseOffering,
+    CoursePreference,
+    Semester,
+    StudentEnrollment,
+    StudentLoadSemester,
+)
+from academics.services.lottery_services import (
+    allocate_seats,
+    load_lottery_demand,
+    run_lottery,
+    submit_course_preferences,
+)
+from academics.services.seat_services import find_seat_violations
+from academics.services.credit_services import find_credit_violations
+from academics.services.student_enrollment_services import enroll_student_in_course
+from users.models import User
+
+
+@pytest.fixture
+def semester():
+    now = timezone.now()
+    return Semester.objects.create(
+        year=2025,
+        term=1,
+        enrollment_mode=Semester.EnrollmentMode.LOTTERY,
+        preferences_open_at=now - timedelta(days=1),
+        preferences_close_at=now + timedelta(days=1),
+    )
+
+
+@pytest.fixture
+def courses(semester):
+    teacher = User.objects.create_user(username="teacher1", password="pass", role=User.Role.TEACHER)
+    courses = [Course.objects.create(code=f"CS10{i}", name=f"Course {i}", credits=3) for i in range(3)]
+    for course in courses:
+        CourseOffering.objects.create(teacher=teacher, semester=semester, course=course, capacity=2)
+    return courses
+
+
+def make_student(username, semester, max_credits=6):
+    student = User.objects.create_user(username=username, password="pass", role=User.Role.STUDENT)
+    StudentLoadSemester.objects.create(student=student, semester=semester, max_credits=max_credits)
+    return student
+
+
+def close_window(semester):
+    Semester.objects.filter(pk=semester.pk).update(preferences_close_at=timezone.now() - timedelta(seconds=1))
+    semester.refresh_from_db()
+
+
+@pytest.mark.django_db
+class TestLotteryServices:
+
+    def test_submit_replaces_preferences(self, semester, courses):
+        """✅ Submitting again should replace the previous ranking."""
+        student = make_student("s1", semester)
+        submit_course_preferences(student, semester, courses)
+        submit_course_preferences(student, semester, [courses[2], courses[0]])
+
+        ranking = list(
+            CoursePreference.objects.filter(student=student).order_by("rank").values_list("course_id", flat=True)
+        )
+        assert ranking == [courses[2].id, courses[0].id]
+
+    def test_submit_outside_window_fails(self, semester, courses):
+        """❌ Preferences should be rejected once the window has closed."""
+        student = make_student("s1", semester)
+        close_window(semester)
+
+        with pytest.raises(ValidationError, match="window"):
+            submit_course_preferences(student, semester, courses)
+
+    def test_direct_enrollment_blocked_until_allocated(self, semester, courses):
+        """❌ Direct enrollment should be rejected while the lottery is pending."""
+        student = make_student("s1", semester)
+
+        with pytest.raises(ValidationError, match="lottery"):
+            enroll_student_in_course(student, semester, courses[0])
+
+    def test_lottery_respects_capacity_and_credits(self, semester, courses):
+        """✅ The lottery should fill seats without exceeding capacities or credit limits."""
+        students = [make_student(f"s{i}", semester) for i in range(5)]
+        for student in students:
+            submit_course_preferences(student, semester, courses)
+        close_window(semester)
+
+        result = run_lottery(semester, seed=7)
+
+        assert result.students == 5
+        assert result.enrollments == 6
+        assert StudentEnrollment.objects.filter(semester=semester).count() == 6
+        assert find_seat_violations(semester) == []
+        assert find_credit_violations(semester) == {"students": [], "teachers": []}
+        semester.refresh_from_db()
+        assert semester.allocated_at is not None
+        with pytest.raises(ValidationError, match="already allocated"):
+            run_lottery(semester)
+
+    def test_lottery_rounds_spread_seats(self, semester, courses):
+        """✅ Everyone should get a course in the first round before anyone gets a second."""
+        students = [make_student(f"s{i}", semester) for i in range(3)]
+        for student in students:
+            submit_course_preferences(student, semester, courses)
+        close_window(semester)
+
+        demand = load_lottery_demand(semester)
+        allocation = allocate_seats(demand, random.Random(1))
+
+        assert sorted(allocation.students[:3]) == [0, 1, 2]
+        assert len(allocation.students) == 6
+
+    def test_lottery_skips_missing_prerequisites(self, semester, courses):
+        """✅ Preferences for courses whose prerequisites are not passed should be skipped."""
+        courses[0].prerequisites.add(courses[1])
+        student = make_student("s1", semester)
+        submit_course_preferences(student, semester, [courses[0], courses[2]])
+        close_window(semester)
+
+        run_lottery(semester, seed=1)
+
+        assert list(StudentEnrollment.objects.filter(student=student).values_list("course_id", flat=True)) == [
+            courses[2].id
+        ]
+
+    def test_lottery_adds_to_counters_instead_of_overwriting(self, semester, courses, monkeypatch):
+        """✅ Seats and credits taken after the demand was loaded should not be overwritten."""
+        from academics.services import lottery_services
+
+        student = make_student("s1", semester)
+        submit_course_preferences(student, semester, [courses[0]])
+        close_window(semester)
+
+        def allocate_then_change_rows(demand, rng):
+            # Rows changed by someone else between the read and the write.
+            CourseOffering.objects.filter(course=courses[0]).update(seats_taken=1)
+            StudentLoadSemester.objects.filter(student=student).update(credits_used=2)
+            return allocate_seats(demand, rng)
+
+        monkeypatch.setattr(lottery_services, "allocate_seats", allocate_then_change_rows)
+        run_lottery(semester, seed=1)
+
+        assert CourseOffering.objects.get(course=courses[0]).seats_taken == 2
+        assert StudentLoadSemester.objects.get(student=student).credits_used == 5
+
+    def test_run_lottery_command_dry_run(self, semester, courses, capsys):
+        """✅ A dry run should report the allocation without saving it."""
+        submit_course_preferences(make_student("s1", semester), semester, courses)
+        close_window(semester)
+
+        call_command("run_lottery", semester_id=semester.id, seed=3, dry_run=True)
+
+        assert "2 seats allocated" in capsys.readouterr().out
+        assert not StudentEnrollment.objects.exists()
@@ -0,0 +1,93 @@
+import pytest
+from django.core.exceptions import ValidationError
+from django.db import transaction
+
+from academics.models import Course, CoursePrerequisiteClosure
+from academics.services import prerequisite_services
+
+
+@pytest.mark.django_db
+class TestPrerequisiteClosure:
+
+    @pytest.fixture
+    def chain(self):
+        """CS101 -> CS102 -> CS103 -> CS104 (each course requires the previous one)."""
+        courses = [
+            Course.objects.create(code=f"CS10{i}", name=f"Course {i}", credits=3)
+            for i in range(1, 5)
+        ]
+        for prerequisite, course in zip(courses, courses[1:]):
+            course.prerequisites.add(prerequisite)
+        return courses
+
+    def test_ancestors_are_transitive(self, chain):
+        """✅ Should return every direct and indirect prerequisite, closest first."""
+        ancestors = prerequisite_services.get_course_ancestors(chain[3])
+
+        assert ancestors == [chain[2], chain[1], chain[0]]
+
+    def test_descendants_are_transitive(self, chain):
+        """✅ Should return every course that depends on the given one."""
+        descendants = prerequisite_services.get_course_descendants(chain[0])
+
+        assert descendants == [chain[1], chain[2], chain[3]]
+
+    def test_depth_is_shortest_chain(self, chain):
+        """✅ A shortcut link should lower the stored depth."""
+        assert CoursePrerequisiteClosure.objects.get(ancestor=chain[0], descendant=chain[3]).depth == 3
+
+        chain[3].prerequisites.add(chain[0])
+
+        assert CoursePrerequisiteClosure.objects.get(ancestor=chain[0], descendant=chain[3]).depth == 1
+
+    def test_long_cycle_is_rejected(self, chain):
+        """❌ Closing a cycle through several courses must be rejected."""
+        assert prerequisite_services.would_create_cycle(chain[0], chain[3]) is True
+
+        with pytest.raises(ValidationError, match="cyclic dependency"), transaction.atomic():
+            chain[0].prerequisites.add(chain[3])
+
+        assert not chain[0].prerequisites.exists()
+
+    def test_reverse_cycle_is_rejected(self, chain):
+        """❌ Cycles must also be rejected when added through dependent_courses."""
+        with pytest.raises(ValidationError, match="cyclic dependency"):
+            chain[3].dependent_courses.add(chain[0])
+
+    def test_removing_link_updates_closure(self, chain):
+        """✅ Removing a link should drop every path that went through it."""
+        chain[2].prerequisites.remove(chain[1])
+
+        assert prerequisite_services.get_course_ancestors(chain[3]) == [chain[2]]
+        assert prerequisite_services.is_prerequisite_of(chain[0], chain[3]) is False
+        assert prerequisite_services.is_prerequisite_of(chain[0], chain[1]) is True
+
+    def test_removal_keeps_alternative_paths(self, chain):
+        """✅ A pair reachable through another path must survive a removal."""
+        chain[3].prerequisites.add(chain[1])
+
+        chain[3].prerequisites.remove(chain[2])
+
+        assert CoursePrerequisiteClosure.objects.get(ancestor=chain[0], descendant=chain[3]).depth == 2
+        assert prerequisite_services.is_prerequisite_of(chain[2], chain[3]) is False
+
+    def test_clear_updates_closure(self, chain):
+        """✅ Clearing prerequisites should remove the course's ancestors."""
+        chain[1].dependent_courses.clear()
+
+        assert prerequisite_services.get_course_descendants(chain[1]) == []
+        assert prerequisite_services.get_course_ancestors(chain[3]) == [chain[2]]
+
+    def test_full_rebuild_matches_incremental(self, chain):
+        """✅ A full rebuild should produce the same rows as incremental maintenance."""
+        chain[3].prerequisites.add(chain[1])
+        incremental = set(
+            CoursePrerequisiteClosure.objects.values_list("ancestor_id", "descendant_id", "depth")
+        )
+
+        rows = prerequisite_services.rebuild_prerequisite_closure()
+
+        assert rows == len(incremental)
+        assert set(
+            CoursePrerequisiteClosure.objects.values_list("ancestor_id", "descendant_id", "depth")
+        ) == incremental
@@ -0,0 +1,76 @@
+import json
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.db.models import F
+
+from academics.models import CourseOffering, StudentEnrollment
+from loadtest.report import Sample, percentile, summarize
+
+
+class TestReport:
+
+    def test_percentile(self):
+        """✅ Percentiles should use the nearest rank."""
+        values = [float(value) for value in range(1, 101)]
+
+        assert percentile(values, 50) == 50.0
+        assert percentile(values, 99) == 99.0
+        assert percentile([], 50) == 0.0
+
+    def test_errors_are_grouped(self):
+        """✅ Errors differing only in numbers should be counted together."""
+        samples = [
+            Sample("enroll", 400, 0.01, "Enrollment would exceed credit limit (20). Current: 18, New Course: 3"),
+            Sample("enroll", 400, 0.02, "Enrollment would exceed credit limit (20). Current: 19, New Course: 4"),
+            Sample("enroll", 201, 0.03, None),
+        ]
+
+        report = summarize(samples, elapsed=1.0)
+
+        assert report["requests"] == 3
+        assert report["throughput_rps"] == 3.0
+        assert report["scenarios"]["enroll"]["status_codes"] == {"201": 1, "400": 2}
+        assert list(report["errors"].values()) == [2]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_registration_rush_against_live_server(live_server, tmp_path):
+    """✅ The rush should enroll students through HTTP without credit violations."""
+    call_command(
+        "generate_university",
+        prefix="rush",
+        students=20,
+        teachers=4,
+        courses=50,
+        semesters=2,
+        stdout=StringIO(),
+    )
+    enrollments_before = StudentEnrollment.objects.count()
+    out = StringIO()
+    report_path = tmp_path / "report.json"
+
+    call_command(
+        "registration_rush",
+        base_url=live_server.url,
+        students=10,
+        teachers=2,
+        mix="enroll=3,teacher=1",
+        # The live server shares one SQLite connection between its threads,
+        # so concurrent transactions would interleave; one virtual user keeps them apart.
+        concurrency=1,
+        duration=30,
+        requests=40,
+        output=str(report_path),
+        stdout=out,
+        stderr=StringIO(),
+    )
+    report = json.loads(report_path.read_text())
+
+    output = out.getvalue()
+    assert "40 requests" in output
+    assert "No credit-limit or seat violations found." in output
+    enrolled = report["scenarios"]["enroll"]["status_codes"].get("201", 0)
+    assert StudentEnrollment.objects.count() - enrollments_before == enrolled
+    assert not CourseOffering.objects.filter(seats_taken__gt=F("capacity")).exists()
@@ -0,0 +1,151 @@
+import threading
+
+import pytest
+from django.core.exceptions import ValidationError
+from django.db import connection, connections
+
+from academics.models import (
+    Course,
+    CourseOffering,
+    Semester,
+    StudentEnrollment,
+    StudentLoadSemester,
+    TeacherLoadSemester,
+)
+from academics.services.course_offering_services import create_course_offering
+from academics.services.seat_services import (
+    find_seat_violations,
+    rebuild_seat_counters,
+    release_seat,
+    reserve_seat,
+    take_seat,
+)
+from academics.services.student_enrollment_services import enroll_student_in_course
+from users.models import User
+
+
+@pytest.fixture
+def teacher():
+    return User.objects.create_user(username="teacher1", password="pass", role=User.Role.TEACHER)
+
+
+@pytest.fixture
+def semester():
+    return Semester.objects.create(year=2025, term=1)
+
+
+@pytest.fixture
+def course():
+    return Course.objects.create(code="CS101", name="Intro to CS", credits=3)
+
+
+def make_student(username, semester, max_credits=10):
+    student = User.objects.create_user(username=username, password="pass", role=User.Role.STUDENT)
+    StudentLoadSemester.objects.create(student=student, semester=semester, max_credits=max_credits)
+    return student
+
+
+@pytest.mark.django_db
+class TestSeatServices:
+
+    def test_reserve_until_full(self, teacher, semester, course):
+        """✅ Seats should be taken until the capacity is reached."""
+        offering = CourseOffering.objects.create(teacher=teacher, semester=semester, course=course, capacity=2)
+
+        assert reserve_seat(offering) is True
+        assert reserve_seat(offering) is True
+        assert reserve_seat(offering) is False
+        offering.refresh_from_db()
+        assert offering.seats_taken == 2
+
+        release_seat(offering)
+        offering.refresh_from_db()
+        assert offering.seats_taken == 1
+
+    def test_take_seat_uses_next_section(self, teacher, semester, course):
+        """✅ A full section should be skipped in favour of the next one."""
+        other_teacher = User.objects.create_user(username="teacher2", password="pass", role=User.Role.TEACHER)
+        full = CourseOffering.objects.create(teacher=teacher, semester=semester, course=course, capacity=1, seats_taken=1)
+        free = CourseOffering.objects.create(teacher=other_teacher, semester=semester, course=course, capacity=1)
+
+        assert take_seat(semester, course) == free
+        with pytest.raises(ValidationError, match="no seats left"):
+            take_seat(semester, course)
+        assert take_seat(semester, Course.objects.create(code="CS102", name="Other", credits=2)) is None
+        assert full.seats_taken == 1
+
+    def test_take_seat_rejects_foreign_offering(self, teacher, semester, course):
+        """❌ An offering of another course should be rejected."""
+        other = Course.objects.create(code="CS102", name="Other", credits=2)
+        offering = CourseOffering.objects.create(teacher=teacher, semester=semester, course=other)
+
+        with pytest.raises(ValidationError, match="does not belong"):
+            take_seat(semester, course, offering)
+
+    def test_create_offering_with_capacity(self, teacher, semester, course):
+        """✅ The offering should be created with the requested capacity."""
+        TeacherLoadSemester.objects.create(teacher=teacher, semester=semester, max_credits=10)
+
+        offering = create_course_offering(teacher=teacher, semester=semester, course=course, capacity=25)
+
+        assert offering.capacity == 25
+        with pytest.raises(ValidationError):
+            create_course_offering(teacher=teacher, semester=semester, course=course, capacity=0)
+
+    def test_enrollment_links_offering_and_respects_capacity(self, teacher, semester, course):
+        """❌ Once the offering is full, enrollment should fail without spending credits."""
+        offering = CourseOffering.objects.create(teacher=teacher, semester=semester, course=course, capacity=1)
+        first = make_student("student1", semester)
+        second = make_student("student2", semester)
+
+        enrollment = enroll_student_in_course(student=first, semester=semester, course=course)
+        assert enrollment.offering == offering
+
+        with pytest.raises(ValidationError, match="no seats left"):
+            enroll_student_in_course(student=second, semester=semester, course=course)
+        assert StudentLoadSemester.objects.get(student=second, semester=semester).credits_used == 0
+        offering.refresh_from_db()
+        assert offering.seats_taken == 1
+
+    def test_rebuild_and_find_violations(self, teacher, semester, course):
+        """✅ Counters out of sync should be reported and then rebuilt."""
+        offering = CourseOffering.objects.create(teacher=teacher, semester=semester, course=course, seats_taken=3)
+        student = make_student("student1", semester)
+        StudentEnrollment.objects.create(student=student, semester=semester, course=course, offering=offering)
+
+        assert [row["id"] for row in find_seat_violations(semester)] == [offering.id]
+
+        assert rebuild_seat_counters() == 1
+        offering.refresh_from_db()
+        assert offering.seats_taken == 1
+        assert find_seat_violations(semester) == []
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.skipif(connection.vendor != "postgresql", reason="needs concurrent connections")
+def test_parallel_enrollments_never_overbook(teacher, semester, course):
+    """✅ Concurrent enrollments should fill the offering exactly to its capacity."""
+    offering = CourseOffering.objects.create(teacher=teacher, semester=semester, course=course, capacity=5)
+    students = [make_student(f"student{i}", semester) for i in range(20)]
+    barrier = threading.Barrier(len(students))
+    results = []
+
+    def enroll(student):
+        try:
+            barrier.wait()
+            enroll_student_in_course(student=student, semester=semester, course=course)
+            results.append("ok")
+        except ValidationError:
+            results.append("full")
+        finally:
+            connections.close_all()
+
+    threads = [threading.Thread(target=enroll, args=(student,)) for student in students]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    offering.refresh_from_db()
+    assert results.count("ok") == offering.seats_taken == 5
+    assert StudentEnrollment.objects.filter(offering=offering).count() == 5
@@ -0,0 +1,335 @@
+import threading
+
+import pytest
+from django.core.exceptions import ValidationError
+from django.db import connection, connections
+from django.test.utils import CaptureQueriesContext
+
+from academics.models import (
+    Course,
+    Semester,
+    CourseOffering,
+    StudentEnrollment,
+    StudentLoadSemester,
+    WaitlistEntry,
+)
+from academics.services.grade_student_services import grade_student_in_course
+from academics.services.student_enrollment_services import (
+    enroll_student_in_course,
+    enroll_student_in_courses,
+    swap_student_enrollment,
+)
+from users.models import User
+
+
+@pytest.mark.django_db
+class TestEnrollStudentInCourses:
+
+    @pytest.fixture
+    def student(self):
+        return User.objects.create_user(
+            username="student1",
+            email="student1@example.com",
+            password="pass123",
+            role=User.Role.STUDENT,
+        )
+
+    @pytest.fixture
+    def semester(self):
+        return Semester.objects.create(year=2025, term=1)
+
+    @pytest.fixture
+    def courses(self):
+        return [
+            Course.objects.create(code="CS101", name="Intro to CS", credits=3),
+            Course.objects.create(code="CS102", name="Algorithms", credits=4),
+            Course.objects.create(code="CS103", name="AI Fundamentals", credits=2),
+        ]
+
+    def test_enroll_in_several_courses(self, student, semester, courses):
+        """✅ Should create every enrollment when the batch fits the credit limit."""
+        StudentLoadSemester.objects.create(student=student, semester=semester, max_credits=9)
+
+        enrollments = enroll_student_in_courses(student=student, semester=semester, courses=courses)
+
+        assert len(enrollments) == 3
+        assert StudentEnrollment.objects.filter(student=student, semester=semester).count() == 3
+
+    def test_batch_exceeding_credit_limit_creates_nothing(self, student, semester, courses):
+        """❌ Should reject the whole batch if it exceeds the credit limit."""
+        StudentLoadSemester.objects.create(student=student, semester=semester, max_credits=8)
+
+        with pytest.raises(ValidationError, match="Enrollment would exceed credit limit"):
+            enroll_student_in_courses(student=student, semester=semester, courses=courses)
+
+        assert StudentEnrollment.objects.count() == 0
+
+    def test_existing_credits_count_towards_limit(self, student, semester, courses):
+        """❌ Credits already enrolled must be included in the check."""
+        StudentLoadSemester.objects.create(student=student, semester=semester, max_credits=7)
+        enroll_student_in_courses(student=student, semester=semester, courses=[courses[1]])
+
+        with pytest.raises(ValidationError, match="Enrollment would exceed credit limit"):
+            enroll_student_in_courses(student=student, semester=semester, courses=[courses[0], courses[2]])
+
+    def test_already_enrolled_course_rejects_batch(self, student, semester, courses):
+        """❌ Should reject the batch if any course is already enrolled."""
+        StudentLoadSemester.objects.create(student=student, semester=semester, max_credits=20)
+        StudentEnrollment.objects.create(student=student, semester=semester, course=courses[0])
+
+        with pytest.raises(ValidationError, match="already enrolled"):
+            enroll_student_in_courses(student=student, semester=semester, courses=courses)
+
+        assert StudentEnrollment.objects.count() == 1
+
+    def test_repeated_course_in_batch(self, student, semester, courses):
+        """❌ Should reject a batch that repeats the same course."""
+        StudentLoadSemester.objects.create(student=student, semester=semester, max_credits=20)
+
+        with pytest.raises(ValidationError, match="more than once"):
+            enroll_student_in_courses(student=student, semester=semester, courses=[courses[0], courses[0]])
+
+    def test_without_semester_load(self, student, semester, courses):
+        """❌ Should raise ValidationError if the student has no semester load."""
+        with pytest.raises(ValidationError, match="no configured semester load"):
+            enroll_student_in_courses(student=student, semester=semester, courses=courses)
+
+    def test_only_students_can_enroll(self, semester, courses):
+        """❌ Only users with the STUDENT role can enroll."""
+        teacher = User.objects.create_user(username="teacher1", password="pass", role=User.Role.TEACHER)
+
+        with pytest.raises(ValidationError, match="Only users with the STUDENT role"):
+            enroll_student_in_courses(student=teacher, semester=semester, courses=courses)
+
+
+@pytest.mark.django_db
+class TestPrerequisiteEnforcement:
+
+    @pytest.fixture
+    def student(self):
+        return User.objects.create_user(username="student1", password="pass", role=User.Role.STUDENT)
+
+    @pytest.fixture
+    def teacher(self):
+        return User.objects.create_user(username="teacher1", password="pass", role=User.Role.TEACHER)
+
+    @pytest.fixture
+    def semesters(self, student):
+        first = Semester.objects.create(year=2024, term=2)
+        second = Semester.objects.create(year=2025, term=1)
+        StudentLoadSemester.objects.create(student=student, semester=first, max_credits=30)
+        StudentLoadSemester.objects.create(student=student, semester=second, max_credits=30)
+        return first, second
+
+    @pytest.fixture
+    def basics(self):
+        return [
+            Course.objects.create(code=f"MAT10{i}", name=f"Math {i}", credits=3)
+            for i in range(1, 6)
+        ]
+
+    @pytest.fixture
+    def advanced(self, basics):
+        course = Course.objects.create(code="MAT300", name="Advanced Math", credits=4)
+        course.prerequisites.add(basics[0])
+        return course
+
+    def _pass_courses(self, student, teacher, semester, courses):
+        for course in courses:
+            offering = CourseOffering.objects.create(teacher=teacher, semester=semester, course=course)
+            StudentEnrollment.objects.create(student=student, semester=semester, course=course, offering=offering)
+            grade_student_in_course(
+                teacher=teacher, student=student, semester=semester, course=course, grade=4.0
+            )
+
+    def test_missing_prerequisite_is_rejected(self, student, semesters, advanced):
+        """❌ Should not enroll a student who has not passed the prerequisites."""
+        with pytest.raises(ValidationError, match="MAT300 requires MAT101"):
+            enroll_student_in_course(student=student, semester=semesters[1], course=advanced)
+
+        assert StudentEnrollment.objects.count() == 0
+
+    def test_failed_prerequisite_is_rejected(self, student, teacher, semesters, basics, advanced):
+        """❌ A prerequisite graded below PASSING_GRADE does not count as passed."""
+        offering = CourseOffering.objects.create(teacher=teacher, semester=semesters[0], course=basics[0])
+        StudentEnrollment.objects.create(student=student, semester=semesters[0], course=basics[0], offering=offering)
+        grade_student_in_course(
+            teacher=teacher, student=student, semester=semesters[0], course=basics[0], grade=2.0
+        )
+
+        with pytest.raises(ValidationError, match="Missing prerequisites"):
+            enroll_student_in_course(student=student, semester=semesters[1], course=advanced)
+
+    def test_passed_prerequisite_allows_enrollment(self, student, teacher, semesters, basics, advanced):
+        """✅ Should enroll once the prerequisites are passed."""
+        self._pass_courses(student, teacher, semesters[0], basics[:1])
+
+        enrollment = enroll_student_in_course(student=student, semester=semesters[1], course=advanced)
+
+        assert enrollment.course == advanced
+
+    def test_new_grade_is_seen_by_next_check(self, student, teacher, semesters, basics, advanced):
+        """✅ A new grade must be visible to the next prerequisite check."""
+        with pytest.raises(ValidationError):
+            enroll_student_in_course(student=student, semester=semesters[1], course=advanced)
+
+        self._pass_courses(student, teacher, semesters[0], basics[:1])
+
+        assert enroll_student_in_course(student=student, semester=semesters[1], course=advanced)
+
+    def test_lowered_grade_is_seen_by_next_check(self, student, teacher, semesters, basics, advanced):
+        """❌ A regrade below PASSING_GRADE, even one that bypasses the services, must block the course."""
+        self._pass_courses(student, teacher, semesters[0], basics[:1])
+        StudentEnrollment.objects.filter(student=student, course=basics[0]).update(grade=2.0)
+
+        with pytest.raises(ValidationError, match="MAT300 requires MAT101"):
+            enroll_student_in_course(student=student, semester=semesters[1], course=advanced)
+
+    def test_bulk_enrollment_checks_prerequisites(self, student, semesters, basics, advanced):
+        """❌ The whole batch should fail if any course misses a prerequisite."""
+        with pytest.raises(ValidationError, match="MAT300 requires MAT101"):
+            enroll_student_in_courses(
+                student=student, semester=semesters[1], courses=[basics[1], advanced]
+            )
+
+        assert StudentEnrollment.objects.count() == 0
+
+    def test_query_count_does_not_depend_on_prerequisites(
+        self, student, teacher, semesters, basics
+    ):
+        """✅ Checking five prerequisites costs the same queries as checking one."""
+        self._pass_courses(student, teacher, semesters[0], basics)
+        one = Course.objects.create(code="MAT301", name="One prerequisite", credits=2)
+        one.prerequisites.add(basics[0])
+        five = Course.objects.create(code="MAT302", name="Five prerequisites", credits=2)
+        five.prerequisites.add(*basics)
+
+        with CaptureQueriesContext(connection) as one_queries:
+            enroll_student_in_course(student=student, semester=semesters[1], course=one)
+        with CaptureQueriesContext(connection) as five_queries:
+            enroll_student_in_course(student=student, semester=semesters[1], course=five)
+
+        assert len(five_queries) == len(one_queries)
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.skipif(connection.vendor != "postgresql", reason="needs row locks and concurrent connections")
+class TestConcurrentEnrollment:
+
+    def test_parallel_duplicate_enrollment(self):
+        """❌ Parallel requests for the same course should give one enrollment and one validation error."""
+        student = User.objects.create_user(username="student1", password="pass123", role=User.Role.STUDENT)
+        semester = Semester.objects.create(year=2025, term=1)
+        course = Course.objects.create(code="CS101", name="Intro to CS", credits=3)
+        StudentLoadSemester.objects.create(student=student, semester=semester, max_credits=9)
+        barrier = threading.Barrier(4)
+        results = []
+
+        def enroll():
+            try:
+                barrier.wait()
+                enroll_student_in_course(student=student, semester=semester, course=course)
+                results.append("ok")
+            except ValidationError:
+                results.append("rejected")
+            finally:
+                connections.close_all()
+
+        threads = [threading.Thread(target=enroll) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sorted(results) == ["ok", "rejected", "rejected", "rejected"]
+        assert StudentLoadSemester.objects.get(student=student, semester=semester).credits_used == 3
+
+
+@pytest.mark.django_db
+class TestSwapStudentEnrollment:
+
+    @pytest.fixture
+    def semester(self):
+        return Semester.objects.create(year=2025, term=1)
+
+    @pytest.fixture
+    def teacher(self):
+        return User.objects.create_user(username="teacher1", password="pass", role=User.Role.TEACHER)
+
+    @pytest.fixture
+    def student(self, semester):
+        student = User.objects.create_user(username="student1", password="pass", role=User.Role.STUDENT)
+        StudentLoadSemester.objects.create(student=student, semester=semester, max_credits=6)
+        return student
+
+    @pytest.fixture
+    def courses(self):
+        return [
+            Course.objects.create(code="CS101", name="Intro to CS", credits=3),
+            Course.objects.create(code="CS102", name="Algorithms", credits=4),
+            Course.objects.create(code="CS103", name="AI Fundamentals", credits=2),
+        ]
+
+    def test_swap_course_adjusts_credits_and_seats(self, student, teacher, semester, courses):
+        """✅ Should replace the enrollment and count only the credit difference."""
+        old = CourseOffering.objects.create(teacher=teacher, semester=semester, course=courses[0], capacity=1)
+        new = CourseOffering.objects.create(teacher=teacher, semester=semester, course=courses[1], capacity=1)
+        enroll_student_in_course(student, semester, courses[0])
+        enroll_student_in_course(student, semester, courses[2])
+
+        enrollment = swap_student_enrollment(student, semester, courses[0], courses[1])
+
+        assert enrollment.offering == new
+        assert set(StudentEnrollment.objects.filter(student=student).values_list("course_id", flat=True)) == {
+            courses[1].id, courses[2].id
+        }
+        assert StudentLoadSemester.objects.get(student=student).credits_used == 6
+        old.refresh_from_db()
+        new.refresh_from_db()
+        assert (old.seats_taken, new.seats_taken) == (0, 1)
+
+    def test_swap_keeps_old_seat_when_new_course_is_full(self, student, teacher, semester, courses):
+        """❌ A full target should leave the original enrollment untouched."""
+        old = CourseOffering.objects.create(teacher=teacher, semester=semester, course=courses[0], capacity=1)
+        CourseOffering.objects.create(teacher=teacher, semester=semester, course=courses[2], capacity=0)
+        enroll_student_in_course(student, semester, courses[0])
+
+        with pytest.raises(ValidationError, match="no seats left"):
+            swap_student_enrollment(student, semester, courses[0], courses[2])
+
+        assert StudentEnrollment.objects.get(student=student).course == courses[0]
+        assert StudentLoadSemester.objects.get(student=student).credits_used == 3
+        old.refresh_from_db()
+        assert old.seats_taken == 1
+
+    def test_swap_exceeding_credit_limit_fails(self, student, semester, courses):
+        """❌ Should reject a swap whose credit difference does not fit the limit."""
+        enroll_student_in_course(student, semester, courses[0])
+        enroll_student_in_course(student, semester, courses[2])
+
+        with pytest.raises(ValidationError, match="exceed credit limit"):
+            swap_student_enrollment(student, semester, courses[2], courses[1])
+
+    def test_switch_section_promotes_waitlist(self, student, teacher, semester, courses):
+        """✅ Moving to another section should hand the old seat to the waitlist."""
+        first = CourseOffering.objects.create(teacher=teacher, semester=semester, course=courses[0], capacity=1)
+        other_teacher = User.objects.create_user(username="teacher2", password="pass", role=User.Role.TEACHER)
+        second = CourseOffering.objects.create(teacher=other_teacher, semester=semester, course=courses[0], capacity=1)
+        enroll_student_in_course(student, semester, courses[0], offering=first)
+        waiting = User.objects.create_user(username="student2", password="pass", role=User.Role.STUDENT)
+        StudentLoadSemester.objects.create(student=waiting, semester=semester, max_credits=6)
+        WaitlistEntry.objects.create(student=waiting, offering=first)
+
+        enrollment = swap_student_enrollment(student, semester, courses[0], courses[0], offering=second)
+
+        assert enrollment.offering == second
+        assert StudentEnrollment.objects.get(student=waiting).offering == first
+        assert StudentLoadSemester.objects.get(student=student).credits_used == 3
+
+    def test_switch_to_same_section_fails(self, student, teacher, semester, courses):
+        """❌ Switching to the section already held should be rejected."""
+        offering = CourseOffering.objects.create(teacher=teacher, semester=semester, course=courses[0])
+        enroll_student_in_course(student, semester, courses[0])
+
+        with pytest.raises(ValidationError, match="different section"):
+            swap_student_enrollment(student, semester, courses[0], courses[0], offering=offering)
@@ -0,0 +1,223 @@
+import pytest
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from academics.models import (
+    Course,
+    CourseOffering,
+    Semester,
+    StudentEnrollment,
+    StudentLoadSemester,
+    WaitlistEntry,
+)
+from academics.services.student_enrollment_services import (
+    drop_student_enrollment,
+    enroll_student_in_course,
+    swap_student_enrollment,
+)
+from academics.services.waitlist_services import (
+    get_waitlist_entry,
+    get_waitlist_position,
+    join_waitlist,
+    leave_waitlist,
+)
+from users.models import User
+
+
+@pytest.fixture
+def semester():
+    return Semester.objects.create(year=2025, term=1)
+
+
+@pytest.fixture
+def course():
+    return Course.objects.create(code="CS101", name="Intro to CS", credits=3)
+
+
+@pytest.fixture
+def offering(semester, course):
+    teacher = User.objects.create_user(username="teacher1", password="pass", role=User.Role.TEACHER)
+    return CourseOffering.objects.create(teacher=teacher, semester=semester, course=course, capacity=1)
+
+
+def make_student(username, semester, max_credits=10):
+    student = User.objects.create_user(username=username, password="pass", role=User.Role.STUDENT)
+    StudentLoadSemester.objects.create(student=student, semester=semester, max_credits=max_credits)
+    return student
+
+
+def load_reads_after_offering_locks(queries: list[dict]) -> list[str]:
+    """
+    Return the statements reading a student load after the first statement
+    that locks an offering row (a seat update or `lock_offerings`).
+    """
+    offering_locked = False
+    late_reads = []
+    for query in queries:
+        sql = query["sql"]
+        if sql.startswith('UPDATE "academics_courseoffering"') or sql.startswith(
+            'SELECT "academics_courseoffering"."id" FROM'
+        ):
+            offering_locked = True
+        elif offering_locked and 'FROM "academics_studentloadsemester"' in sql:
+            late_reads.append(sql)
+    return late_reads
+
+
+@pytest.mark.django_db
+class TestWaitlistServices:
+
+    def test_join_returns_fifo_positions(self, semester, course, offering):
+        """✅ Students joining a full offering should get increasing positions."""
+        enroll_student_in_course(make_student("s0", semester), semester, course)
+        first, second, third = (make_student(f"s{i}", semester) for i in range(1, 4))
+
+        assert join_waitlist(first, offering)[1] == 1
+        assert join_waitlist(second, offering)[1] == 2
+        assert join_waitlist(third, offering)[1] == 3
+
+        leave_waitlist(first, offering)
+        assert get_waitlist_position(get_waitlist_entry(third, offering)) == 2
+
+    def test_join_rejects_free_offering(self, semester, offering):
+        """❌ An offering with free seats should not accept waitlist entries."""
+        with pytest.raises(ValidationError, match="free seats"):
+            join_waitlist(make_student("s1", semester), offering)
+
+    def test_join_rejects_semester_awaiting_lottery(self, semester, course, offering):
+        """❌ Waitlists of a lottery semester should stay closed until its seats are allocated."""
+        enroll_student_in_course(make_student("s0", semester), semester, course)
+        Semester.objects.filter(pk=semester.pk).update(enrollment_mode=Semester.EnrollmentMode.LOTTERY)
+
+        with pytest.raises(ValidationError, match="lottery"):
+            join_waitlist(make_student("s1", semester), offering)
+
+    def test_join_twice_fails(self, semester, course, offering):
+        """❌ A student should not be on the same waitlist twice."""
+        enroll_student_in_course(make_student("s0", semester), semester, course)
+        student = make_student("s1", semester)
+        join_waitlist(student, offering)
+
+        with pytest.raises(ValidationError, match="already on the waitlist"):
+            join_waitlist(student, offering)
+
+    def test_drop_promotes_head_of_waitlist(self, semester, course, offering):
+        """✅ Dropping should hand the seat and credits to the first student in line."""
+        enrolled = make_student("s0", semester)
+        enroll_student_in_course(enrolled, semester, course)
+        first, second = make_student("s1", semester), make_student("s2", semester)
+        join_waitlist(first, offering)
+        join_waitlist(second, offering)
+
+        promoted = drop_student_enrollment(enrolled, semester, course)
+
+        assert promoted.student == first
+        assert promoted.offering == offering
+        assert not StudentEnrollment.objects.filter(student=enrolled).exists()
+        assert StudentLoadSemester.objects.get(student=enrolled).credits_used == 0
+        assert StudentLoadSemester.objects.get(student=first).credits_used == 3
+        offering.refresh_from_db()
+        assert offering.seats_taken == 1
+        assert get_waitlist_position(get_waitlist_entry(second, offering)) == 1
+
+    def test_drop_skips_students_over_credit_limit(self, semester, course, offering):
+        """✅ Students the course would push over max_credits should be skipped and removed."""
+        enrolled = make_student("s0", semester)
+        enroll_student_in_course(enrolled, semester, course)
+        full_load, eligible = make_student("s1", semester, max_credits=2), make_student("s2", semester)
+        join_waitlist(full_load, offering)
+        join_waitlist(eligible, offering)
+
+        promoted = drop_student_enrollment(enrolled, semester, course)
+
+        assert promoted.student == eligible
+        assert not WaitlistEntry.objects.filter(offering=offering).exists()
+        assert StudentLoadSemester.objects.get(student=full_load).credits_used == 0
+        offering.refresh_from_db()
+        assert offering.seats_taken == 1
+
+    def test_drop_without_waitlist_frees_seat(self, semester, course, offering):
+        """✅ Dropping with an empty waitlist should leave the seat free."""
+        enrolled = make_student("s0", semester)
+        enroll_student_in_course(enrolled, semester, course)
+
+        assert drop_student_enrollment(enrolled, semester, course) is None
+        offering.refresh_from_db()
+        assert offering.seats_taken == 0
+
+    def test_drop_graded_enrollment_fails(self, semester, course, offering):
+        """❌ Graded enrollments should not be dropped."""
+        enrolled = make_student("s0", semester)
+        enrollment = enroll_student_in_course(enrolled, semester, course)
+        enrollment.grade = 4
+        enrollment.save()
+
+        with pytest.raises(ValidationError, match="Graded"):
+            drop_student_enrollment(enrolled, semester, course)
+
+    def test_waitlist_endpoints(self, semester, course, offering):
+        """✅ Students should join, check and leave a waitlist through the API."""
+        enrolled = make_student("s0", semester)
+        enroll_student_in_course(enrolled, semester, course)
+        student = make_student("s1", semester)
+        client = APIClient()
+        client.force_authenticate(student)
+        url = f"/academics/courses-offering/{offering.id}/waitlist/"
+
+        response = client.post(url, {}, format="json")
+        assert response.status_code == 201
+        assert response.data["data"]["position"] == 1
+        assert client.get(url).data["data"]["position"] == 1
+
+        client.force_authenticate(enrolled)
+        response = client.post(
+            "/academics/enrollments/drop/",
+            {"semester_id": semester.id, "course_id": course.id},
+            format="json",
+        )
+        assert response.status_code == 200
+        assert response.data["data"]["promoted"]["student"] == "s1"
+
+        client.force_authenticate(student)
+        assert client.delete(url).status_code == 400
+
+
+@pytest.mark.django_db
+class TestWaitlistLockOrder:
+    """Promotions must lock the loads of waitlisted students before any offering row."""
+
+    @pytest.fixture
+    def waitlist(self, semester, course, offering):
+        enrolled = make_student("s0", semester)
+        enroll_student_in_course(enrolled, semester, course)
+        full_load, eligible = make_student("s1", semester, max_credits=2), make_student("s2", semester)
+        join_waitlist(full_load, offering)
+        join_waitlist(eligible, offering)
+        return enrolled, eligible
+
+    def test_drop_locks_loads_first(self, semester, course, waitlist):
+        """✅ A drop should not read any load once it has touched the offering."""
+        enrolled, eligible = waitlist
+
+        with CaptureQueriesContext(connection) as queries:
+            promoted = drop_student_enrollment(enrolled, semester, course)
+
+        assert promoted.student == eligible
+        assert load_reads_after_offering_locks(queries.captured_queries) == []
+
+    def test_swap_locks_loads_first(self, semester, course, offering, waitlist):
+        """✅ A swap should lock every offering only after the loads of the promotion."""
+        enrolled, eligible = waitlist
+        other_teacher = User.objects.create_user(username="teacher2", password="pass", role=User.Role.TEACHER)
+        other = CourseOffering.objects.create(teacher=other_teacher, semester=semester, course=course, capacity=1)
+
+        with CaptureQueriesContext(connection) as queries:
+            swap_student_enrollment(enrolled, semester, course, course, offering=other)
+
+        assert StudentEnrollment.objects.get(student=eligible).offering == offering
+        assert load_reads_after_offering_locks(queries.captured_queries) == []
+        offering.refresh_from_db()
+        other.refresh_from_db()
+        assert (offering.seats_taken, other.seats_taken) == (1, 1)
@@ -1,20 +1,46 @@
 from django.urls import path
-from academics.views.semester_views import SemesterView
+from academics.views.semester_views import AsyncSemesterView, SemesterView
 from academics.views.teacher_load_views import TeacherLoadAssignView
-from academics.views.course_views import CourseView
+from academics.views.course_views import AsyncCourseView, CourseView
 from academics.views.course_offering_views import CourseOfferingCreateView
 from academics.views.student_load_views import AssignSemesterToStudentView
-from academics.views.student_enrollment_views import StudentEnrollmentView
-from academics.views.grade_views import GradeView
-from academics.views.teacher_course_views import TeacherCourseOfferingView
+from academics.views.student_enrollment_views import (
+    StudentEnrollmentView,
+    StudentBulkEnrollmentView,
+    StudentEnrollmentDropView,
+    StudentEnrollmentSwapView,
+    StudentEnrollmentPlanView,
+)
+from academics.views.grade_views import GradeView, GradeImportView
+from academics.views.teacher_course_views import (
+    AsyncTeacherCourseOfferingView,
+    OfferingRosterView,
+    TeacherCourseOfferingView,
+)
+from academics.views.waitlist_views import WaitlistView
+from academics.views.course_preference_views import CoursePreferenceView
+from academics.views.batch_views import BatchView
 
 urlpatterns = [
     path("semesters/", SemesterView.as_view(), name="semesters"),
     path("teacher-load/assign/", TeacherLoadAssignView.as_view(), name="teacher-assign"),
     path("courses/", CourseView.as_view(), name="courses"),
     path("courses-offering/", CourseOfferingCreateView.as_view(), name="courses-offering"),
+    path("courses-offering/<int:offering_id>/waitlist/", WaitlistView.as_view(), name="offering-waitlist"),
+    path("courses-offering/<int:offering_id>/roster/", OfferingRosterView.as_view(), name="offering-roster"),
     path("student-semesters/", AssignSemesterToStudentView.as_view(), name="assign-student-semester"),
     path("enrollments/", StudentEnrollmentView.as_view(), name="student-enrollment"),
+    path("enrollments/bulk/", StudentBulkEnrollmentView.as_view(), name="student-bulk-enrollment"),
+    path("enrollments/drop/", StudentEnrollmentDropView.as_view(), name="student-enrollment-drop"),
+    path("enrollments/swap/", StudentEnrollmentSwapView.as_view(), name="student-enrollment-swap"),
+    path("enrollments/plan/", StudentEnrollmentPlanView.as_view(), name="student-enrollment-plan"),
+    path("preferences/", CoursePreferenceView.as_view(), name="course-preferences"),
     path("grades/", GradeView.as_view(), name="student-grades"),
+    path("grades/import/", GradeImportView.as_view(), name="student-grades-import"),
     path("teacher-courses/", TeacherCourseOfferingView.as_view(), name="teacher-courses"),
+    path("batch/", BatchView.as_view(), name="batch"),
+    # Async versions of the read endpoints, for ASGI deployments
+    path("async/semesters/", AsyncSemesterView.as_view(), name="semesters-async"),
+    path("async/courses/", AsyncCourseView.as_view(), name="courses-async"),
+    path("async/teacher-courses/", AsyncTeacherCourseOfferingView.as_view(), name="teacher-courses-async"),
 ]
\ No newline at end of file
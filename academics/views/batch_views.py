@@ -0,0 +1,58 @@
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status, permissions
+from drf_yasg.utils import swagger_auto_schema
+
+from users.permissions import IsAdmin
+
+from academics.idempotency import IDEMPOTENCY_KEY_PARAMETER, idempotent
+from academics.serializers.batch_serializers import BatchSerializer
+from academics.services.batch_services import ATOMIC, run_batch
+
+
+class BatchView(APIView):
+    """
+    API view to run many configuration operations (teacher and student loads,
+    course offerings and enrollments) in a single request.
+    Only admins can perform this action.
+    """
+    permission_classes = [permissions.IsAuthenticated, IsAdmin]
+
+    @swagger_auto_schema(
+        request_body=BatchSerializer,
+        responses={200: "OK", 400: "Bad Request"},
+        operation_summary="Ejecutar operaciones en lote",
+        operation_description=(
+            "Ejecuta una lista de operaciones (`teacher_load.assign`, `student_load.assign`, "
+            "`course_offering.create`, `enrollment.create`) con una sola autenticación y devuelve "
+            "un resultado por operación, en el mismo orden. Con `mode=per_operation` cada operación "
+            "se aplica por separado; con `mode=atomic` se aplican todas o ninguna. "
+            "Si se envía `Idempotency-Key`, los reintentos con la misma clave devuelven la primera respuesta."
+        ),
+        manual_parameters=[IDEMPOTENCY_KEY_PARAMETER],
+        tags=["Config"],
+    )
+    @idempotent
+    def post(self, request):
+        serializer = BatchSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(
+                {"is_ok": False, "errors": serializer.errors},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        mode = serializer.validated_data["mode"]
+        try:
+            results = run_batch(serializer.validated_data["operations"], mode=mode)
+        except Exception as e:
+            return Response(
+                {"is_ok": False, "error": f"Unexpected error: {str(e)}"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+        is_ok = all(result["is_ok"] for result in results)
+        return Response(
+            {"is_ok": is_ok, "mode": mode, "data": results},
+            # A rolled back atomic batch applied nothing, like a rejected request.
+            status=status.HTTP_400_BAD_REQUEST if mode == ATOMIC and not is_ok else status.HTTP_200_OK,
+        )
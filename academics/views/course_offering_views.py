@@ -7,6 +7,7 @@ from academics.services.course_services import get_course_by_id
 from users.permissions import IsAdmin
 from users.services.user_services import get_user_by_id
 
+from academics.idempotency import IDEMPOTENCY_KEY_PARAMETER, idempotent
 from academics.serializers.course_offering_serializer import CourseOfferingCreateSerializer
 from academics.services.course_offering_services import create_course_offering
 from academics.services.semester_services import get_semester_by_id
@@ -22,9 +23,14 @@ class CourseOfferingCreateView(APIView):
         request_body=CourseOfferingCreateSerializer,
         responses={201: "Created", 400: "Bad Request"},
         operation_summary="Crear oferta de curso",
-        operation_description="Crea una nueva oferta de curso para un profesor en un semestre específico.",
+        operation_description=(
+            "Crea una nueva oferta de curso para un profesor en un semestre específico. "
+            "Si se envía `Idempotency-Key`, los reintentos con la misma clave devuelven la primera respuesta."
+        ),
+        manual_parameters=[IDEMPOTENCY_KEY_PARAMETER],
         tags=["Courses"],
     )
+    @idempotent
     def post(self, request, *args, **kwargs):
         serializer = CourseOfferingCreateSerializer(data=request.data)
         if not serializer.is_valid():
@@ -47,6 +53,7 @@ class CourseOfferingCreateView(APIView):
                 teacher=teacher,
                 semester=semester_obj,
                 course=course_obj,
+                capacity=serializer.validated_data.get("capacity"),
             )
             return Response(
                 {
@@ -0,0 +1,117 @@
+from django.core.exceptions import ValidationError, ObjectDoesNotExist
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status, permissions
+from drf_yasg.utils import swagger_auto_schema
+from drf_yasg import openapi
+
+from users.models import User
+from users.permissions import IsAdminOrStudent
+from users.services.user_services import get_user_by_id
+
+from academics.serializers.course_preference_serializers import CoursePreferenceSubmitSerializer
+from academics.services.course_services import get_courses_by_ids
+from academics.services.lottery_services import get_course_preferences, submit_course_preferences
+from academics.services.semester_services import get_semester_by_id
+
+
+class CoursePreferenceView(APIView):
+    """
+    API view to submit and review ranked course preferences for a lottery semester.
+    - **Students** manage their own preferences.
+    - **Admins** act on behalf of a student (must include `student_id`).
+    """
+    permission_classes = [permissions.IsAuthenticated, IsAdminOrStudent]
+
+    def _get_student(self, request, student_id) -> User:
+        if request.user.role != User.Role.ADMIN:
+            return request.user
+        if not student_id:
+            raise ValidationError("student_id es requerido para administradores.")
+        return get_user_by_id(int(student_id))
+
+    @swagger_auto_schema(
+        request_body=CoursePreferenceSubmitSerializer,
+        responses={201: "Created", 400: "Bad Request"},
+        operation_summary="Registrar preferencias de cursos para el sorteo",
+        operation_description=(
+            "Reemplaza la lista ordenada de cursos deseados por el estudiante en un semestre "
+            "con inscripción por sorteo. Solo se acepta mientras la ventana de preferencias está abierta."
+        ),
+        tags=["Enrollments"],
+    )
+    def post(self, request):
+        serializer = CoursePreferenceSubmitSerializer(data=request.data)
+        try:
+            serializer.is_valid(raise_exception=True)
+            student = self._get_student(request, serializer.validated_data.get("student_id"))
+            semester = get_semester_by_id(serializer.validated_data.get("semester_id"))
+            course_ids = serializer.validated_data.get("course_ids")
+            courses_by_id = {course.id: course for course in get_courses_by_ids(course_ids)}
+
+            preferences = submit_course_preferences(
+                student=student,
+                semester=semester,
+                courses=[courses_by_id[course_id] for course_id in course_ids],
+            )
+
+            return Response(
+                {"is_ok": True, "data": serializer.to_representation(preferences)},
+                status=status.HTTP_201_CREATED,
+            )
+
+        except (ValidationError, ObjectDoesNotExist) as e:
+            return Response(
+                {"is_ok": False, "error": str(e)},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        except Exception as e:
+            return Response(
+                {"is_ok": False, "error": f"Unexpected error: {str(e)}"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+    @swagger_auto_schema(
+        manual_parameters=[
+            openapi.Parameter(
+                "semester_id",
+                openapi.IN_QUERY,
+                description="ID of the semester",
+                type=openapi.TYPE_INTEGER,
+                required=True,
+            ),
+            openapi.Parameter(
+                "student_id",
+                openapi.IN_QUERY,
+                description="ID of the student (required only for admins)",
+                type=openapi.TYPE_INTEGER,
+                required=False,
+            ),
+        ],
+        responses={200: "Ranked course preferences", 400: "Bad Request"},
+        operation_summary="Consultar preferencias de cursos",
+        tags=["Enrollments"],
+    )
+    def get(self, request):
+        try:
+            student = self._get_student(request, request.query_params.get("student_id"))
+            semester = get_semester_by_id(int(request.query_params.get("semester_id", 0)))
+            preferences = get_course_preferences(student, semester)
+
+            return Response(
+                {"is_ok": True, "data": CoursePreferenceSubmitSerializer(preferences).data},
+                status=status.HTTP_200_OK,
+            )
+
+        except (ValidationError, ObjectDoesNotExist, ValueError) as e:
+            return Response(
+                {"is_ok": False, "error": str(e)},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        except Exception as e:
+            return Response(
+                {"is_ok": False, "error": f"Unexpected error: {str(e)}"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
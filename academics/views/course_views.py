@@ -5,14 +5,23 @@ from rest_framework import status, permissions
 from drf_yasg.utils import swagger_auto_schema
 
 from django.core.exceptions import ValidationError
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.http import parse_etags
+from core.async_views import AsyncAPIView, json_response
+from core.pagination import CURSOR_QUERY_PARAMETERS, get_page_params, wants_pagination
+from core.streaming import EXPORT_QUERY_PARAMETER, get_export_format, streaming_export_response
 from users.permissions import IsAdmin
 
 from academics.serializers.course_serializers import CourseSerializer
 from academics.services.course_services import (
+    aget_courses_page,
+    aiter_courses_values,
     create_course, 
     get_courses_by_ids,
-    get_all_courses,
+    get_courses_page,
+    iter_courses_values,
     )
+from academics.services.catalog_services import aget_course_catalog_snapshot, get_course_catalog_snapshot
 
 class CourseView(APIView):
     permission_classes = [permissions.IsAuthenticated, IsAdmin]
@@ -55,11 +64,96 @@ class CourseView(APIView):
     @swagger_auto_schema(
         responses={200: CourseSerializer(many=True)},
         operation_summary="Listar cursos",
-        operation_description="Devuelve la lista completa de cursos registrados.",
+        operation_description=(
+            "Devuelve la lista completa de cursos registrados. "
+            "La respuesta incluye un ETag; si se envía en `If-None-Match` "
+            "y el catálogo no cambió, se responde 304 sin cuerpo. "
+            "Si se envía `cursor` o `page_size`, se devuelve una página del catálogo. "
+            "Con `export=ndjson` o `export=json` se transmiten todos los cursos."
+        ),
+        manual_parameters=CURSOR_QUERY_PARAMETERS + [EXPORT_QUERY_PARAMETER],
         tags=["Courses"],
     )
     def get(self, request):
-        """Retrive all courses."""
-        courses = get_all_courses()
-        serializer = CourseSerializer(courses, many=True)
-        return Response({"is_ok": True, "data": serializer.data}, status=status.HTTP_200_OK)
\ No newline at end of file
+        """Retrive all courses from the cached catalog snapshot, or one page of them."""
+        try:
+            export_format = get_export_format(request.query_params)
+        except ValidationError as e:
+            return Response(
+                {"is_ok": False, "error": str(e)},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if export_format:
+            return streaming_export_response(iter_courses_values(), export_format, filename="courses")
+
+        if wants_pagination(request.query_params):
+            try:
+                after_id, page_size = get_page_params(request.query_params)
+            except ValidationError as e:
+                return Response(
+                    {"is_ok": False, "error": str(e)},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            page = get_courses_page(after_id=after_id, page_size=page_size)
+            serializer = CourseSerializer(page.items, many=True)
+            return Response(
+                {"is_ok": True, "data": serializer.data, "next_cursor": page.next_cursor},
+                status=status.HTTP_200_OK,
+            )
+
+        body, etag = get_course_catalog_snapshot()
+        return _catalog_response(request, body, etag)
+
+
+def _catalog_response(request, body: bytes, etag: str) -> HttpResponse:
+    """
+    Answer with the catalog snapshot, or 304 when the client already has it.
+    """
+    client_etags = parse_etags(request.headers.get("If-None-Match", ""))
+    if etag in client_etags or "*" in client_etags:
+        response = HttpResponseNotModified()
+    else:
+        response = HttpResponse(body, content_type="application/json", status=status.HTTP_200_OK)
+
+    response["ETag"] = etag
+    response["Cache-Control"] = "private, no-cache"
+    return response
+
+
+class AsyncCourseView(AsyncAPIView):
+    """
+    Async version of `CourseView.get` for ASGI deployments.
+    A catalog request is served from the cache without touching a worker thread.
+    """
+
+    permission_classes = [permissions.IsAuthenticated, IsAdmin]
+
+    async def get(self, request):
+        """Retrive all courses from the cached catalog snapshot, or one page of them."""
+        try:
+            export_format = get_export_format(request.query_params)
+        except ValidationError as e:
+            return json_response(
+                {"is_ok": False, "error": str(e)},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if export_format:
+            return streaming_export_response(aiter_courses_values(), export_format, filename="courses")
+
+        if wants_pagination(request.query_params):
+            try:
+                after_id, page_size = get_page_params(request.query_params)
+            except ValidationError as e:
+                return json_response(
+                    {"is_ok": False, "error": str(e)},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            page = await aget_courses_page(after_id=after_id, page_size=page_size)
+            serializer = CourseSerializer(page.items, many=True)
+            return json_response(
+                {"is_ok": True, "data": serializer.data, "next_cursor": page.next_cursor},
+                status=status.HTTP_200_OK,
+            )
+
+        body, etag = await aget_course_catalog_snapshot()
+        return _catalog_response(request, body, etag)
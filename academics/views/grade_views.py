@@ -1,4 +1,7 @@
+import codecs
+
 from rest_framework import status, permissions
+from rest_framework.parsers import MultiPartParser
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from django.core.exceptions import ValidationError, ObjectDoesNotExist
@@ -9,8 +12,14 @@ from users.models import User
 from users.permissions import IsAdminOrTeacher
 from users.services import user_services
 
-from academics.serializers.grade_serializers import GradeSerializer, GradeResponseSerializer
-from academics.services.grade_student_services import grade_student_in_course
+from academics.idempotency import IDEMPOTENCY_KEY_PARAMETER, idempotent
+from academics.serializers.grade_serializers import (
+    GradeSerializer,
+    GradeResponseSerializer,
+    GradeImportSerializer,
+)
+from academics.services.grade_student_services import grade_student_in_course, import_grades_from_csv
+from academics.services.course_offering_services import get_course_offering_by_id
 from academics.services.semester_services import get_semester_by_id
 from academics.services.course_services import get_course_by_id
 
@@ -32,11 +41,14 @@ class GradeView(APIView):
             "**Rules:**\n"
             "- Teachers can only assign grades for courses they teach.\n"
             "- Admins can assign grades for any course and must specify a `teacher_id`.\n"
-            "- Grade must be between the defined MIN_GRADE and MAX_GRADE constants (e.g., 0.0–5.0)."
+            "- Grade must be between the defined MIN_GRADE and MAX_GRADE constants (e.g., 0.0–5.0).\n"
+            "- Retries with the same `Idempotency-Key` return the first response."
         ),
+        manual_parameters=[IDEMPOTENCY_KEY_PARAMETER],
         tags=["Grades"],
         responses={201: "Created", 400: "Bad Request", 500: "Internal server error"},
     )
+    @idempotent
     def post(self, request):
         """
         Handle POST request to assign a grade to a student.
@@ -97,3 +109,50 @@ class GradeView(APIView):
                 {"is_ok": False, "error": f"Unexpected error: {str(e)}"},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
+
+
+class GradeImportView(APIView):
+    """
+    API endpoint for importing every grade of a course offering from a CSV file.
+    - **Teachers** can only import grades for their own offerings.
+    - **Admins** can import grades for any offering (on behalf of its teacher).
+    """
+
+    permission_classes = [permissions.IsAuthenticated, IsAdminOrTeacher]
+    parser_classes = [MultiPartParser]
+
+    @swagger_auto_schema(
+        request_body=GradeImportSerializer,
+        operation_summary="Import grades for a course offering from CSV",
+        operation_description=(
+            "Upload a CSV file with `student_id` and `grade` columns to grade every student "
+            "of a course offering in one request. \n\n"
+            "Valid rows are saved; invalid rows are skipped and reported in `errors` "
+            "with their row number."
+        ),
+        tags=["Grades"],
+        responses={200: "Import summary", 400: "Bad Request"},
+    )
+    def post(self, request):
+        serializer = GradeImportSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(
+                {"is_ok": False, "errors": serializer.errors},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            offering = get_course_offering_by_id(serializer.validated_data["offering_id"])
+            teacher = offering.teacher if request.user.role == User.Role.ADMIN else request.user
+
+            lines = codecs.iterdecode(serializer.validated_data["file"], "utf-8-sig")
+            result = import_grades_from_csv(teacher=teacher, offering=offering, lines=lines)
+
+            return Response({"is_ok": True, "data": result}, status=status.HTTP_200_OK)
+        except (ValidationError, UnicodeDecodeError) as e:
+            return Response({"is_ok": False, "error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            return Response(
+                {"is_ok": False, "error": f"Unexpected error: {str(e)}"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
@@ -2,9 +2,18 @@ from rest_framework import status, permissions
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from drf_yasg.utils import swagger_auto_schema
+from django.core.exceptions import ValidationError
 
+from core.async_views import AsyncAPIView, json_response
+from core.pagination import CURSOR_QUERY_PARAMETERS, get_page_params, wants_pagination
 from academics.serializers.semester_serializers import SemesterSerializer
-from academics.services.semester_services import create_semester, list_semesters
+from academics.services.semester_services import (
+    alist_semesters,
+    alist_semesters_page,
+    create_semester,
+    list_semesters,
+    list_semesters_page,
+)
 
 from users.permissions import IsAdmin
 
@@ -19,11 +28,31 @@ class SemesterView(APIView):
 
     @swagger_auto_schema(
         operation_summary="List all semesters",
+        operation_description=(
+            "Lists every semester in chronological order. "
+            "Sending `cursor` or `page_size` returns one page ordered by id instead."
+        ),
+        manual_parameters=CURSOR_QUERY_PARAMETERS,
         responses={200: SemesterSerializer(many=True)},
         tags=["Config"],
     )
     def get(self, request):
-        """List all semesters in chronological order."""
+        """List all semesters in chronological order, or one page of them."""
+        if wants_pagination(request.query_params):
+            try:
+                after_id, page_size = get_page_params(request.query_params)
+            except ValidationError as e:
+                return Response(
+                    {"is_ok": False, "error": str(e)},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            page = list_semesters_page(after_id=after_id, page_size=page_size)
+            serializer = SemesterSerializer(page.items, many=True)
+            return Response(
+                {"is_ok": True, "data": serializer.data, "next_cursor": page.next_cursor},
+                status=status.HTTP_200_OK,
+            )
+
         semesters = list_semesters()
         serializer = SemesterSerializer(semesters, many=True)
         return Response({"is_ok": True, "data": serializer.data}, status=status.HTTP_200_OK)
@@ -55,4 +84,34 @@ class SemesterView(APIView):
         return Response(
             {"is_ok": True, "data": response_data},
             status=status.HTTP_201_CREATED,
-        )
\ No newline at end of file
+        )
+
+
+class AsyncSemesterView(AsyncAPIView):
+    """
+    Async version of `SemesterView.get` for ASGI deployments.
+    Only admin users are allowed to access this endpoint.
+    """
+
+    permission_classes = [permissions.IsAuthenticated, IsAdmin]
+
+    async def get(self, request):
+        """List all semesters in chronological order, or one page of them."""
+        if wants_pagination(request.query_params):
+            try:
+                after_id, page_size = get_page_params(request.query_params)
+            except ValidationError as e:
+                return json_response(
+                    {"is_ok": False, "error": str(e)},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            page = await alist_semesters_page(after_id=after_id, page_size=page_size)
+            serializer = SemesterSerializer(page.items, many=True)
+            return json_response(
+                {"is_ok": True, "data": serializer.data, "next_cursor": page.next_cursor},
+                status=status.HTTP_200_OK,
+            )
+
+        semesters = await alist_semesters()
+        serializer = SemesterSerializer(semesters, many=True)
+        return json_response({"is_ok": True, "data": serializer.data}, status=status.HTTP_200_OK)
@@ -3,15 +3,29 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status, permissions
 from drf_yasg.utils import swagger_auto_schema
+from drf_yasg import openapi
 
 from users.models import User
 from users.permissions import IsAdminOrStudent
 from users.services.user_services import get_user_by_id
 
-from academics.serializers.student_enrollment_serializers import StudentEnrollmentCreateSerializer
-from academics.services.student_enrollment_services import enroll_student_in_course
+from academics.idempotency import IDEMPOTENCY_KEY_PARAMETER, idempotent
+from academics.serializers.student_enrollment_serializers import (
+    StudentEnrollmentCreateSerializer,
+    StudentBulkEnrollmentSerializer,
+    StudentEnrollmentDropSerializer,
+    StudentEnrollmentSwapSerializer,
+)
+from academics.services.student_enrollment_services import (
+    enroll_student_in_course,
+    enroll_student_in_courses,
+    drop_student_enrollment,
+    swap_student_enrollment,
+)
+from academics.services.enrollment_plan_services import plan_enrollment
 from academics.services.semester_services import get_semester_by_id
-from academics.services.course_services import get_course_by_id
+from academics.services.course_services import get_course_by_id, get_courses_by_ids
+from academics.services.course_offering_services import get_course_offering_by_id
 
 
 class StudentEnrollmentView(APIView):
@@ -26,10 +40,13 @@ class StudentEnrollmentView(APIView):
         responses={201: "Created", 400: "Bad Request"},
         operation_summary="Inscribir un estudiante a un curso",
         operation_description=(
-            "Permite que un estudiante se inscriba a un curso, o que un admin inscriba a un estudiante."
+            "Permite que un estudiante se inscriba a un curso, o que un admin inscriba a un estudiante. "
+            "Si se envía `Idempotency-Key`, los reintentos con la misma clave devuelven la primera respuesta."
         ),
+        manual_parameters=[IDEMPOTENCY_KEY_PARAMETER],
         tags=["Enrollments"],
     )
+    @idempotent
     def post(self, request):
         serializer = StudentEnrollmentCreateSerializer(data=request.data)
         try:
@@ -47,6 +64,8 @@ class StudentEnrollmentView(APIView):
 
             semester = get_semester_by_id(serializer.validated_data.get("semester_id"))
             course = get_course_by_id(serializer.validated_data.get("course_id"))
+            offering_id = serializer.validated_data.get("offering_id")
+            offering = get_course_offering_by_id(offering_id) if offering_id else None
 
             if request.user.role != User.Role.ADMIN and student != request.user:
                 return Response(
@@ -58,6 +77,7 @@ class StudentEnrollmentView(APIView):
                 student=student,
                 semester=semester,
                 course=course,
+                offering=offering,
             )
 
             return Response(
@@ -75,4 +95,261 @@ class StudentEnrollmentView(APIView):
             return Response(
                 {"is_ok": False, "error": f"Unexpected error: {str(e)}"},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            )
\ No newline at end of file
+            )
+
+
+class StudentBulkEnrollmentView(APIView):
+    """
+    API view to enroll a student in several courses at once ("cart checkout").
+    All enrollments are created together or none is.
+    """
+    permission_classes = [permissions.IsAuthenticated, IsAdminOrStudent]
+
+    @swagger_auto_schema(
+        request_body=StudentBulkEnrollmentSerializer,
+        responses={201: "Created", 400: "Bad Request"},
+        operation_summary="Inscribir un estudiante a varios cursos",
+        operation_description=(
+            "Inscribe a un estudiante en una lista de cursos en una sola operación. "
+            "Si alguna inscripción no es válida, no se crea ninguna."
+        ),
+        tags=["Enrollments"],
+    )
+    def post(self, request):
+        serializer = StudentBulkEnrollmentSerializer(data=request.data)
+        try:
+            serializer.is_valid(raise_exception=True)
+
+            student = request.user
+            if request.user.role == User.Role.ADMIN:
+                student_id = serializer.validated_data.get("student_id")
+                if not student_id:
+                    return Response(
+                        {"is_ok": False, "error": "student_id es requerido para administradores."},
+                        status=status.HTTP_400_BAD_REQUEST,
+                    )
+                student = get_user_by_id(student_id)
+
+            semester = get_semester_by_id(serializer.validated_data.get("semester_id"))
+            courses = get_courses_by_ids(serializer.validated_data.get("course_ids"))
+
+            enrollments = enroll_student_in_courses(
+                student=student,
+                semester=semester,
+                courses=courses,
+            )
+
+            return Response(
+                {"is_ok": True, "data": serializer.to_representation(enrollments)},
+                status=status.HTTP_201_CREATED,
+            )
+
+        except (ValidationError, ObjectDoesNotExist) as e:
+            return Response(
+                {"is_ok": False, "error": str(e)},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        except Exception as e:
+            return Response(
+                {"is_ok": False, "error": f"Unexpected error: {str(e)}"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+
+class StudentEnrollmentDropView(APIView):
+    """
+    API view to drop a course. The freed seat goes to the first eligible
+    student on the offering's waitlist in the same transaction.
+    """
+    permission_classes = [permissions.IsAuthenticated, IsAdminOrStudent]
+
+    @swagger_auto_schema(
+        request_body=StudentEnrollmentDropSerializer,
+        responses={200: "OK", 400: "Bad Request"},
+        operation_summary="Retirar a un estudiante de un curso",
+        operation_description=(
+            "Elimina la inscripción de un estudiante en un curso no calificado. "
+            "El cupo liberado se asigna al primer estudiante elegible de la lista de espera."
+        ),
+        tags=["Enrollments"],
+    )
+    def post(self, request):
+        serializer = StudentEnrollmentDropSerializer(data=request.data)
+        try:
+            serializer.is_valid(raise_exception=True)
+
+            student = request.user
+            if request.user.role == User.Role.ADMIN:
+                student_id = serializer.validated_data.get("student_id")
+                if not student_id:
+                    return Response(
+                        {"is_ok": False, "error": "student_id es requerido para administradores."},
+                        status=status.HTTP_400_BAD_REQUEST,
+                    )
+                student = get_user_by_id(student_id)
+
+            semester = get_semester_by_id(serializer.validated_data.get("semester_id"))
+            course = get_course_by_id(serializer.validated_data.get("course_id"))
+
+            promoted = drop_student_enrollment(
+                student=student,
+                semester=semester,
+                course=course,
+            )
+
+            return Response(
+                {"is_ok": True, "data": serializer.to_representation(promoted)},
+                status=status.HTTP_200_OK,
+            )
+
+        except (ValidationError, ObjectDoesNotExist) as e:
+            return Response(
+                {"is_ok": False, "error": str(e)},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        except Exception as e:
+            return Response(
+                {"is_ok": False, "error": f"Unexpected error: {str(e)}"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+
+class StudentEnrollmentSwapView(APIView):
+    """
+    API view to exchange one course (or section) for another in a single step.
+    The old seat is only given up if the new one is granted.
+    """
+    permission_classes = [permissions.IsAuthenticated, IsAdminOrStudent]
+
+    @swagger_auto_schema(
+        request_body=StudentEnrollmentSwapSerializer,
+        responses={201: "Created", 400: "Bad Request"},
+        operation_summary="Cambiar un curso o sección por otro",
+        operation_description=(
+            "Retira al estudiante de `drop_course_id` e inscribe `add_course_id` en una sola transacción. "
+            "Para cambiar de sección, enviar el mismo curso en ambos campos y la sección destino en `offering_id`."
+        ),
+        tags=["Enrollments"],
+    )
+    def post(self, request):
+        serializer = StudentEnrollmentSwapSerializer(data=request.data)
+        try:
+            serializer.is_valid(raise_exception=True)
+
+            student = request.user
+            if request.user.role == User.Role.ADMIN:
+                student_id = serializer.validated_data.get("student_id")
+                if not student_id:
+                    return Response(
+                        {"is_ok": False, "error": "student_id es requerido para administradores."},
+                        status=status.HTTP_400_BAD_REQUEST,
+                    )
+                student = get_user_by_id(student_id)
+
+            semester = get_semester_by_id(serializer.validated_data.get("semester_id"))
+            drop_course = get_course_by_id(serializer.validated_data.get("drop_course_id"))
+            add_course = get_course_by_id(serializer.validated_data.get("add_course_id"))
+            offering_id = serializer.validated_data.get("offering_id")
+            offering = get_course_offering_by_id(offering_id) if offering_id else None
+
+            enrollment = swap_student_enrollment(
+                student=student,
+                semester=semester,
+                drop_course=drop_course,
+                add_course=add_course,
+                offering=offering,
+            )
+
+            return Response(
+                {"is_ok": True, "data": serializer.to_representation(enrollment)},
+                status=status.HTTP_201_CREATED,
+            )
+
+        except (ValidationError, ObjectDoesNotExist) as e:
+            return Response(
+                {"is_ok": False, "error": str(e)},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        except Exception as e:
+            return Response(
+                {"is_ok": False, "error": f"Unexpected error: {str(e)}"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+
+class StudentEnrollmentPlanView(APIView):
+    """
+    Read-only API view to check a candidate schedule before enrolling.
+    Nothing is written; the checks run on the read replica when configured.
+    """
+    permission_classes = [permissions.IsAuthenticated, IsAdminOrStudent]
+
+    @swagger_auto_schema(
+        manual_parameters=[
+            openapi.Parameter(
+                "semester_id",
+                openapi.IN_QUERY,
+                description="ID of the semester to plan",
+                type=openapi.TYPE_INTEGER,
+                required=True,
+            ),
+            openapi.Parameter(
+                "course_ids",
+                openapi.IN_QUERY,
+                description="Comma-separated IDs of the candidate courses (e.g. 1,2,3)",
+                type=openapi.TYPE_STRING,
+                required=True,
+            ),
+            openapi.Parameter(
+                "student_id",
+                openapi.IN_QUERY,
+                description="ID of the student (required only for admins)",
+                type=openapi.TYPE_INTEGER,
+                required=False,
+            ),
+        ],
+        responses={200: "Enrollment plan", 400: "Bad Request"},
+        operation_summary="Simular una inscripción",
+        operation_description=(
+            "Valida una lista de cursos candidatos sin inscribir: créditos frente a `max_credits`, "
+            "cursos ya inscritos o aprobados, prerrequisitos faltantes y cupos disponibles."
+        ),
+        tags=["Enrollments"],
+    )
+    def get(self, request):
+        try:
+            student = request.user
+            if request.user.role == User.Role.ADMIN:
+                student_id = request.query_params.get("student_id")
+                if not student_id:
+                    return Response(
+                        {"is_ok": False, "error": "student_id es requerido para administradores."},
+                        status=status.HTTP_400_BAD_REQUEST,
+                    )
+                student = get_user_by_id(int(student_id))
+
+            semester = get_semester_by_id(int(request.query_params.get("semester_id", 0)))
+            course_ids = [
+                int(course_id)
+                for course_id in request.query_params.get("course_ids", "").split(",")
+                if course_id.strip()
+            ]
+
+            plan = plan_enrollment(student=student, semester=semester, course_ids=course_ids)
+
+            return Response({"is_ok": True, "data": plan}, status=status.HTTP_200_OK)
+
+        except (ValidationError, ObjectDoesNotExist, ValueError) as e:
+            return Response(
+                {"is_ok": False, "error": str(e)},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        except Exception as e:
+            return Response(
+                {"is_ok": False, "error": f"Unexpected error: {str(e)}"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
@@ -9,8 +9,20 @@ from users.models import User
 from users.permissions import IsAdminOrTeacher
 from users.services import user_services
 
-from academics.services.semester_services import get_semester_by_id
-from academics.services.course_offering_services import get_teacher_courses_by_semester
+from core.async_views import AsyncAPIView, json_response
+
+from academics.services.semester_services import aget_semester_by_id, get_semester_by_id
+from core.pagination import CURSOR_QUERY_PARAMETERS, get_page_params
+from core.streaming import EXPORT_QUERY_PARAMETER, get_export_format, streaming_export_response
+from academics.services.course_offering_services import (
+    aget_teacher_courses_by_semester,
+    aiter_teacher_courses_by_semester_values,
+    get_course_offering_by_id,
+    get_offering_roster_page,
+    get_teacher_courses_by_semester,
+    iter_offering_roster_values,
+    iter_teacher_courses_by_semester_values,
+)
 from academics.serializers.course_offering_serializer import CourseOfferingSerializer
 
 class TeacherCourseOfferingView(APIView):
@@ -48,6 +60,7 @@ class TeacherCourseOfferingView(APIView):
                 type=openapi.TYPE_INTEGER,
                 required=False,
             ),
+            EXPORT_QUERY_PARAMETER,
         ],
         responses={
             200: "List of assigned courses",
@@ -64,7 +77,7 @@ class TeacherCourseOfferingView(APIView):
         
         teacher_param = request.query_params.get("teacher_id")
         teacher_id: int = None
-        if teacher_id is not None:
+        if teacher_param is not None:
             teacher_id = int(teacher_param)
             
         if not semester_id:
@@ -104,6 +117,14 @@ class TeacherCourseOfferingView(APIView):
             )
         
         try:
+            export_format = get_export_format(request.query_params)
+            if export_format:
+                return streaming_export_response(
+                    iter_teacher_courses_by_semester_values(teacher, semester),
+                    export_format,
+                    filename="teacher-courses",
+                )
+
             offerings = get_teacher_courses_by_semester(teacher, semester)
             serializer = CourseOfferingSerializer(offerings, many=True)
             return Response(
@@ -117,5 +138,125 @@ class TeacherCourseOfferingView(APIView):
                 {"is_ok": False, "error": str(e)},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
-        
-        
+
+
+class AsyncTeacherCourseOfferingView(AsyncAPIView):
+    """
+    Async version of `TeacherCourseOfferingView.get` for ASGI deployments.
+    - **Teachers** can view their own assigned courses.
+    - **Admins** can view the assigned courses for any teacher (must include `teacher_id`).
+    """
+
+    permission_classes = [permissions.IsAuthenticated, IsAdminOrTeacher]
+
+    async def get(self, request):
+        user = request.user
+        try:
+            semester_id = int(request.query_params.get("semester_id", ""))
+            teacher_param = request.query_params.get("teacher_id")
+            teacher_id = int(teacher_param) if teacher_param is not None else None
+        except ValueError:
+            return json_response(
+                {"is_ok": False, "error": "semester_id is required and ids must be integers."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            semester = await aget_semester_by_id(semester_id=semester_id)
+        except ValidationError as e:
+            return json_response(
+                {"is_ok": False, "error": f"validation error {e}"}, status=status.HTTP_400_BAD_REQUEST)
+
+        teacher = user
+        if user.role == User.Role.ADMIN:
+            if not teacher_id:
+                return json_response(
+                    {"is_ok": False, "error": "teacher_id is required for admins."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            try:
+                teacher = await user_services.aget_user_by_id(user_id=teacher_id)
+            except ValidationError:
+                return json_response(
+                    {"is_ok": False, "error": "Invalid teacher_id."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+        try:
+            export_format = get_export_format(request.query_params)
+            if export_format:
+                return streaming_export_response(
+                    aiter_teacher_courses_by_semester_values(teacher, semester),
+                    export_format,
+                    filename="teacher-courses",
+                )
+
+            offerings = await aget_teacher_courses_by_semester(teacher, semester)
+            serializer = CourseOfferingSerializer(offerings, many=True)
+            return json_response(
+                {"is_ok": True, "data": serializer.data},
+                status=status.HTTP_200_OK,
+            )
+        except ValidationError as e:
+            return json_response({"is_ok": False, "error": f"validation error {e}"}, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            return json_response(
+                {"is_ok": False, "error": str(e)},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+
+class OfferingRosterView(APIView):
+    """
+    API endpoint for the students enrolled in a course offering, with their grades.
+    - **Teachers** can view the roster of their own offerings.
+    - **Admins** can view the roster of any offering.
+    """
+
+    permission_classes = [permissions.IsAuthenticated, IsAdminOrTeacher]
+
+    @swagger_auto_schema(
+        operation_summary="Retrieve the roster of a course offering",
+        operation_description=(
+            "Returns the enrolled students with their profile fields and current grade, "
+            "one page at a time ordered by enrollment id. Use `next_cursor` to fetch the next page, "
+            "or `export` to stream the whole roster."
+        ),
+        tags=["Courses"],
+        manual_parameters=[*CURSOR_QUERY_PARAMETERS, EXPORT_QUERY_PARAMETER],
+        responses={
+            200: "Roster page",
+            400: "Invalid request",
+            403: "Permission denied",
+        },
+    )
+    def get(self, request, offering_id):
+        try:
+            offering = get_course_offering_by_id(offering_id)
+            if request.user.role != User.Role.ADMIN and offering.teacher_id != request.user.id:
+                return Response(
+                    {"is_ok": False, "error": "You can only view the roster of your own courses."},
+                    status=status.HTTP_403_FORBIDDEN,
+                )
+
+            export_format = get_export_format(request.query_params)
+            if export_format:
+                return streaming_export_response(
+                    iter_offering_roster_values(offering),
+                    export_format,
+                    filename=f"roster-{offering.id}",
+                )
+
+            after_id, page_size = get_page_params(request.query_params)
+            page = get_offering_roster_page(offering, after_id=after_id, page_size=page_size)
+            return Response(
+                {"is_ok": True, "data": page.items, "next_cursor": page.next_cursor},
+                status=status.HTTP_200_OK,
+            )
+        except ValidationError as e:
+            return Response({"is_ok": False, "error": f"validation error {e}"}, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            return Response(
+                {"is_ok": False, "error": str(e)},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
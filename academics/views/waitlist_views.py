@@ -0,0 +1,136 @@
+from django.core.exceptions import ValidationError, ObjectDoesNotExist
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status, permissions
+from drf_yasg.utils import swagger_auto_schema
+from drf_yasg import openapi
+
+from users.models import User
+from users.permissions import IsAdminOrStudent
+from users.services.user_services import get_user_by_id
+
+from academics.serializers.waitlist_serializers import WaitlistJoinSerializer
+from academics.services.course_offering_services import get_course_offering_by_id
+from academics.services.waitlist_services import (
+    get_waitlist_entry,
+    get_waitlist_position,
+    join_waitlist,
+    leave_waitlist,
+)
+
+STUDENT_ID_PARAMETER = openapi.Parameter(
+    "student_id",
+    openapi.IN_QUERY,
+    description="ID of the student (required only for admins)",
+    type=openapi.TYPE_INTEGER,
+    required=False,
+)
+
+
+class WaitlistView(APIView):
+    """
+    API view to join, check and leave the waitlist of a full course offering.
+    - **Students** act on their own waitlist entry.
+    - **Admins** act on behalf of a student (must include `student_id`).
+    """
+    permission_classes = [permissions.IsAuthenticated, IsAdminOrStudent]
+
+    def _get_student(self, request, student_id) -> User:
+        if request.user.role != User.Role.ADMIN:
+            return request.user
+        if not student_id:
+            raise ValidationError("student_id es requerido para administradores.")
+        return get_user_by_id(int(student_id))
+
+    @swagger_auto_schema(
+        request_body=WaitlistJoinSerializer,
+        responses={201: "Created", 400: "Bad Request"},
+        operation_summary="Unirse a la lista de espera de un curso",
+        operation_description=(
+            "Agrega al estudiante al final de la lista de espera de una oferta sin cupos "
+            "y devuelve su posición. Cuando se libera un cupo, el primer estudiante elegible "
+            "se inscribe automáticamente."
+        ),
+        tags=["Enrollments"],
+    )
+    def post(self, request, offering_id):
+        serializer = WaitlistJoinSerializer(data=request.data)
+        try:
+            serializer.is_valid(raise_exception=True)
+            student = self._get_student(request, serializer.validated_data.get("student_id"))
+            offering = get_course_offering_by_id(offering_id)
+
+            entry, position = join_waitlist(student=student, offering=offering)
+
+            return Response(
+                {"is_ok": True, "data": serializer.to_representation((entry, position))},
+                status=status.HTTP_201_CREATED,
+            )
+
+        except (ValidationError, ObjectDoesNotExist) as e:
+            return Response(
+                {"is_ok": False, "error": str(e)},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        except Exception as e:
+            return Response(
+                {"is_ok": False, "error": f"Unexpected error: {str(e)}"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+    @swagger_auto_schema(
+        manual_parameters=[STUDENT_ID_PARAMETER],
+        responses={200: "Waitlist position", 400: "Bad Request"},
+        operation_summary="Consultar la posición en la lista de espera",
+        tags=["Enrollments"],
+    )
+    def get(self, request, offering_id):
+        try:
+            student = self._get_student(request, request.query_params.get("student_id"))
+            offering = get_course_offering_by_id(offering_id)
+            entry = get_waitlist_entry(student, offering)
+            entry.student = student
+
+            return Response(
+                {"is_ok": True, "data": WaitlistJoinSerializer((entry, get_waitlist_position(entry))).data},
+                status=status.HTTP_200_OK,
+            )
+
+        except (ValidationError, ObjectDoesNotExist, ValueError) as e:
+            return Response(
+                {"is_ok": False, "error": str(e)},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        except Exception as e:
+            return Response(
+                {"is_ok": False, "error": f"Unexpected error: {str(e)}"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+    @swagger_auto_schema(
+        manual_parameters=[STUDENT_ID_PARAMETER],
+        responses={204: "No Content", 400: "Bad Request"},
+        operation_summary="Salir de la lista de espera",
+        tags=["Enrollments"],
+    )
+    def delete(self, request, offering_id):
+        try:
+            student = self._get_student(request, request.query_params.get("student_id"))
+            offering = get_course_offering_by_id(offering_id)
+            leave_waitlist(student, offering)
+
+            return Response(status=status.HTTP_204_NO_CONTENT)
+
+        except (ValidationError, ObjectDoesNotExist, ValueError) as e:
+            return Response(
+                {"is_ok": False, "error": str(e)},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        except Exception as e:
+            return Response(
+                {"is_ok": False, "error": f"Unexpected error: {str(e)}"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
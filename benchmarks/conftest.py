@@ -0,0 +1,89 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+
+from benchmarks.harness import (
+    DEFAULT_TOLERANCES,
+    find_regressions,
+    load_baselines,
+    measure,
+    save_baselines,
+)
+
+# Datasets built with `generate_university`; every size uses the same seed.
+DATASET_SIZES = {
+    "small": {"students": 100, "teachers": 10, "courses": 100, "semesters": 4},
+    "medium": {"students": 1_000, "teachers": 50, "courses": 1_000, "semesters": 6},
+}
+DATASET_SEED = 42
+
+
+def _parse_tolerances(overrides: list[str]) -> dict[str, float]:
+    tolerances = dict(DEFAULT_TOLERANCES)
+    for override in overrides:
+        metric, _, value = override.partition("=")
+        if metric not in tolerances:
+            raise pytest.UsageError(f"Unknown benchmark metric '{metric}'.")
+        tolerances[metric] = float(value)
+    return tolerances
+
+
+@pytest.fixture(scope="session")
+def benchmark_baselines(request):
+    """
+    Baselines of the current database vendor. With --benchmark-update the
+    collected results are written back when the session ends.
+    """
+    baselines = load_baselines()
+    vendor_baselines = baselines.setdefault(connection.vendor, {})
+    yield vendor_baselines
+    if request.config.getoption("--benchmark-update"):
+        save_baselines(baselines)
+
+
+@pytest.fixture(scope="module", params=list(DATASET_SIZES))
+def dataset(request, django_db_setup, django_db_blocker):
+    """
+    Generate one seeded dataset for the whole module and flush it afterwards.
+    """
+    size = request.param
+    with django_db_blocker.unblock():
+        call_command(
+            "generate_university",
+            seed=DATASET_SEED,
+            prefix=f"bench{size}",
+            stdout=StringIO(),
+            **DATASET_SIZES[size],
+        )
+    yield size
+    with django_db_blocker.unblock():
+        call_command("flush", interactive=False, verbosity=0)
+
+
+@pytest.fixture
+def benchmark(request, benchmark_baselines, dataset):
+    """
+    Measure a function and fail if it regressed against its stored baseline.
+
+    Usage: `benchmark(func, setup=None, rounds=5)`.
+    """
+    update = request.config.getoption("--benchmark-update")
+    tolerances = _parse_tolerances(request.config.getoption("--benchmark-tolerance"))
+    key = f"{request.node.originalname}[{dataset}]"
+
+    def run(func, setup=None, rounds=5):
+        result = measure(func, setup, rounds)
+        if update:
+            benchmark_baselines[key] = {**result._asdict(), "wall_time": round(result.wall_time, 6)}
+            return result
+        baseline = benchmark_baselines.get(key)
+        if baseline is None:
+            pytest.skip(f"No baseline for {key}; run with --benchmark-update to record one.")
+        regressions = find_regressions(result, baseline, tolerances)
+        if regressions:
+            pytest.fail(f"{key} regressed: " + "; ".join(regressions))
+        return result
+
+    return run
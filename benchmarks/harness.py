@@ -0,0 +1,101 @@
+import json
+import statistics
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, NamedTuple
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+BASELINES_PATH = Path(__file__).with_name("baselines.json")
+
+METRICS = ("wall_time", "queries", "peak_memory")
+
+# Allowed relative increase over the baseline before a metric counts as a regression.
+DEFAULT_TOLERANCES = {
+    "wall_time": 0.5,
+    "queries": 0.0,
+    "peak_memory": 0.25,
+}
+
+# Increases below these absolute amounts are treated as noise.
+NOISE_FLOORS = {
+    "wall_time": 0.001,
+    "queries": 0,
+    "peak_memory": 16 * 1024,
+}
+
+
+class BenchmarkResult(NamedTuple):
+    wall_time: float
+    queries: int
+    peak_memory: int
+
+
+def measure(func: Callable, setup: Callable[[], tuple] | None = None, rounds: int = 5) -> BenchmarkResult:
+    """
+    Run `func` several times and collect its metrics.
+
+    `setup` is called before every run (outside the measurement) and returns
+    the positional arguments for `func`, so functions that change the database
+    can be given fresh input each time.
+
+    - wall_time: median of `rounds` timed runs, after one warm-up run.
+    - queries: number of queries of one run.
+    - peak_memory: peak traced Python allocations of one run, in bytes.
+    """
+    setup = setup or tuple
+
+    func(*setup())
+
+    times = []
+    for _ in range(rounds):
+        args = setup()
+        start = time.perf_counter()
+        func(*args)
+        times.append(time.perf_counter() - start)
+
+    args = setup()
+    with CaptureQueriesContext(connection) as context:
+        func(*args)
+
+    args = setup()
+    tracemalloc.start()
+    try:
+        func(*args)
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return BenchmarkResult(statistics.median(times), len(context.captured_queries), peak_memory)
+
+
+def load_baselines(path: Path = BASELINES_PATH) -> dict:
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text())
+
+
+def save_baselines(baselines: dict, path: Path = BASELINES_PATH) -> None:
+    path.write_text(json.dumps(baselines, indent=2, sort_keys=True) + "\n")
+
+
+def find_regressions(result: BenchmarkResult, baseline: dict, tolerances: dict[str, float]) -> list[str]:
+    """
+    Compare a result with its baseline.
+
+    Returns:
+        list[str]: One message per metric that grew past its tolerance.
+    """
+    regressions = []
+    for metric in METRICS:
+        if metric not in baseline:
+            continue
+        current, expected = getattr(result, metric), baseline[metric]
+        limit = expected * (1 + tolerances[metric])
+        if current > limit and current - expected > NOISE_FLOORS[metric]:
+            regressions.append(
+                f"{metric}: {current:g} > {expected:g} (+{tolerances[metric]:.0%} tolerance)"
+            )
+    return regressions
@@ -0,0 +1,80 @@
+from itertools import count
+
+import pytest
+from django.db.models import F
+
+from academics.models import CourseOffering, Semester, StudentEnrollment, StudentLoadSemester, TeacherLoadSemester
+from academics.services.course_offering_services import create_course_offering
+from academics.services.course_services import get_courses_by_semester
+from academics.services.grade_student_services import grade_student_in_course
+from academics.services.student_enrollment_services import enroll_student_in_course
+from users.models import User
+from users.services.user_services import list_students
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.django_db]
+
+_usernames = count()
+
+
+def current_semester() -> Semester:
+    return Semester.objects.order_by("-year", "-term").first()
+
+
+def new_user(role) -> User:
+    return User.objects.create(username=f"benchmark_{next(_usernames)}", role=role)
+
+
+def test_enroll_student_in_course(benchmark):
+    semester = current_semester()
+    offering = (
+        CourseOffering.objects.filter(semester=semester, course__prerequisites__isnull=True)
+        .select_related("course")
+        .first()
+    )
+    # Every round takes a seat; make sure the section never fills up.
+    CourseOffering.objects.filter(pk=offering.pk).update(capacity=F("seats_taken") + 1000)
+    course = offering.course
+
+    def setup():
+        student = new_user(User.Role.STUDENT)
+        StudentLoadSemester.objects.create(student=student, semester=semester, max_credits=20)
+        return student, semester, course
+
+    benchmark(enroll_student_in_course, setup)
+
+
+def test_create_course_offering(benchmark):
+    semester = current_semester()
+    course = CourseOffering.objects.filter(semester=semester).select_related("course").first().course
+
+    def setup():
+        teacher = new_user(User.Role.TEACHER)
+        TeacherLoadSemester.objects.create(teacher=teacher, semester=semester, max_credits=20)
+        return teacher, semester, course
+
+    benchmark(create_course_offering, setup)
+
+
+def test_grade_student_in_course(benchmark):
+    semester = current_semester()
+    enrollment = (
+        StudentEnrollment.objects.filter(semester=semester, offering__isnull=False)
+        .select_related("student", "course", "offering__teacher")
+        .order_by("id")
+        .first()
+    )
+
+    benchmark(
+        grade_student_in_course,
+        lambda: (enrollment.offering.teacher, enrollment.student, semester, enrollment.course, 4.0),
+    )
+
+
+def test_get_courses_by_semester(benchmark):
+    semester = current_semester()
+
+    benchmark(get_courses_by_semester, lambda: (semester,))
+
+
+def test_list_students(benchmark):
+    benchmark(list_students)
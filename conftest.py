@@ -0,0 +1,40 @@
+import pytest
+from django.core.cache import cache
+
+from core.cache import clear_read_through_caches
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Start every test with an empty cache so cached rows never leak between tests."""
+    cache.clear()
+    clear_read_through_caches()
+    yield
+    cache.clear()
+    clear_read_through_caches()
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("benchmarks")
+    group.addoption("--benchmarks", action="store_true", help="Run the service benchmarks in benchmarks/.")
+    group.addoption(
+        "--benchmark-update",
+        action="store_true",
+        help="Write the benchmark results to benchmarks/baselines.json instead of comparing them.",
+    )
+    group.addoption(
+        "--benchmark-tolerance",
+        action="append",
+        default=[],
+        metavar="METRIC=RATIO",
+        help="Override the allowed regression of a metric, e.g. wall_time=0.3 (repeatable).",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--benchmarks") or config.getoption("--benchmark-update"):
+        return
+    skip = pytest.mark.skip(reason="benchmarks only run with --benchmarks")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
@@ -0,0 +1,59 @@
+from django.contrib.auth.models import AnonymousUser
+from django.http import HttpResponse
+from django.views import View
+from rest_framework import status
+from rest_framework.renderers import JSONRenderer
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+
+from .async_auth import AsyncJWTAuthentication
+
+
+def json_response(data, status: int = status.HTTP_200_OK) -> HttpResponse:
+    """
+    Render `data` exactly as DRF's `Response` would with the JSON renderer.
+    """
+    return HttpResponse(JSONRenderer().render(data), content_type="application/json", status=status)
+
+
+class AsyncAPIView(View):
+    """
+    Base class for async read endpoints.
+
+    DRF's `APIView` only runs sync handlers, so under ASGI every request to
+    it holds a worker thread. This view keeps the parts of `APIView` the API
+    relies on (JWT authentication, `permission_classes` and the standard
+    401/403 bodies from `core.exceptions`) while the `async def` handlers
+    run on the event loop.
+
+    Subclasses define `async def get(...)` and read `request.query_params`.
+    """
+
+    authentication = AsyncJWTAuthentication()
+    permission_classes = []
+
+    async def dispatch(self, request, *args, **kwargs):
+        request.query_params = request.GET
+        try:
+            result = await self.authentication.aauthenticate(request)
+        except (AuthenticationFailed, InvalidToken):
+            return self.not_authenticated(request)
+        request.user, request.auth = result if result is not None else (AnonymousUser(), None)
+
+        for permission in (permission_class() for permission_class in self.permission_classes):
+            if not permission.has_permission(request, self):
+                if not request.user.is_authenticated:
+                    return self.not_authenticated(request)
+                return json_response(
+                    {"is_ok": False, "error": "You do not have permission to perform this action."},
+                    status=status.HTTP_403_FORBIDDEN,
+                )
+
+        return await super().dispatch(request, *args, **kwargs)
+
+    def not_authenticated(self, request) -> HttpResponse:
+        response = json_response(
+            {"is_ok": False, "error": "Authentication failed or token missing."},
+            status=status.HTTP_401_UNAUTHORIZED,
+        )
+        response["WWW-Authenticate"] = self.authentication.authenticate_header(request)
+        return response
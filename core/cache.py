@@ -0,0 +1,211 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+from core.db import read_from_primary
+
+DEFAULT_READ_THROUGH_CACHE = {
+    "ENABLED": True,
+    "MAX_ENTRIES": 2048,
+    "TTL": 300,
+    "SHARED_CACHE_ALIAS": None,
+}
+
+# Backends whose entries live inside the process that wrote them.
+PROCESS_LOCAL_CACHE_BACKENDS = ("django.core.cache.backends.locmem.LocMemCache",)
+
+_registry: dict[str, "ReadThroughCache"] = {}
+
+
+def get_read_through_settings() -> dict:
+    """
+    Return the READ_THROUGH_CACHE setting merged over the defaults.
+    """
+    return {**DEFAULT_READ_THROUGH_CACHE, **getattr(settings, "READ_THROUGH_CACHE", {})}
+
+
+def get_process_local_caches() -> list[str]:
+    """
+    Return the caches that only the current process can invalidate.
+
+    They are safe with a single process, but with several (gunicorn workers,
+    management commands) a write in one process leaves the others serving
+    stale values: the default cache when it is in memory, and the read-through
+    caches when they have no shared tier.
+    """
+    local = []
+    if settings.CACHES["default"]["BACKEND"] in PROCESS_LOCAL_CACHE_BACKENDS:
+        local.append('CACHES["default"]')
+
+    config = get_read_through_settings()
+    alias = config["SHARED_CACHE_ALIAS"]
+    if config["ENABLED"] and (not alias or settings.CACHES[alias]["BACKEND"] in PROCESS_LOCAL_CACHE_BACKENDS):
+        local.append('READ_THROUGH_CACHE["SHARED_CACHE_ALIAS"]')
+    return local
+
+
+class ReadThroughCache:
+    """
+    Read-through cache for rows looked up by primary key.
+
+    - Without `SHARED_CACHE_ALIAS` values are kept in an in-process LRU with
+      a TTL, so a hit costs no I/O. Only the current process can invalidate
+      it, which is safe with a single process (runserver, tests).
+    - With `SHARED_CACHE_ALIAS` every lookup goes to the cache shared between
+      processes (Redis) and nothing is kept locally, so an invalidation made
+      by any process, web worker or management command, is seen by all the
+      others at once.
+
+    Loaders run against the primary database, so a lagging read replica
+    cannot put stale rows in the cache for a whole TTL. Cached instances are
+    copied on every hit so callers cannot mutate the cached value.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._entries: OrderedDict[Any, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+        _registry[name] = self
+
+    def _shared_key(self, key: Any) -> str:
+        return f"read-through:{self.name}:{key}"
+
+    def _local_hit(self, key: Any) -> tuple[bool, Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, copy.copy(entry[1])
+
+    def _count(self, shared_hit: bool) -> None:
+        with self._lock:
+            if shared_hit:
+                self.shared_hits += 1
+            else:
+                self.misses += 1
+
+    def get_or_load(self, key: Any, loader: Callable[[], Any]) -> Any:
+        """
+        Return the cached value for `key`, calling `loader` on a miss.
+        Exceptions raised by `loader` are propagated and nothing is cached.
+        """
+        config = get_read_through_settings()
+        if not config["ENABLED"]:
+            return loader()
+
+        if not config["SHARED_CACHE_ALIAS"]:
+            found, value = self._local_hit(key)
+            if found:
+                return value
+            with read_from_primary():
+                value = loader()
+            self._count(shared_hit=False)
+            self._store(key, value, time.monotonic() + config["TTL"], config["MAX_ENTRIES"])
+            return copy.copy(value)
+
+        shared = caches[config["SHARED_CACHE_ALIAS"]]
+        value = shared.get(self._shared_key(key))
+        self._count(shared_hit=value is not None)
+        if value is None:
+            with read_from_primary():
+                value = loader()
+            shared.set(self._shared_key(key), value, config["TTL"])
+        return copy.copy(value)
+
+    async def aget_or_load(self, key: Any, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Async counterpart of `get_or_load`; `loader` is a coroutine function.
+        """
+        config = get_read_through_settings()
+        if not config["ENABLED"]:
+            return await loader()
+
+        if not config["SHARED_CACHE_ALIAS"]:
+            found, value = self._local_hit(key)
+            if found:
+                return value
+            with read_from_primary():
+                value = await loader()
+            self._count(shared_hit=False)
+            self._store(key, value, time.monotonic() + config["TTL"], config["MAX_ENTRIES"])
+            return copy.copy(value)
+
+        shared = caches[config["SHARED_CACHE_ALIAS"]]
+        value = await shared.aget(self._shared_key(key))
+        self._count(shared_hit=value is not None)
+        if value is None:
+            with read_from_primary():
+                value = await loader()
+            await shared.aset(self._shared_key(key), value, config["TTL"])
+        return copy.copy(value)
+
+    def _store(self, key: Any, value: Any, expires_at: float, max_entries: int) -> None:
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > max_entries:
+                self._entries.popitem(last=False)
+
+    def _evict(self, key: Any) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+        alias = get_read_through_settings()["SHARED_CACHE_ALIAS"]
+        if alias:
+            caches[alias].delete(self._shared_key(key))
+
+    def invalidate(self, key: Any) -> None:
+        """
+        Drop `key` from the local and the shared cache now and again when the
+        current transaction commits, so a concurrent reader cannot re-cache
+        pre-commit data.
+        """
+        self._evict(key)
+        transaction.on_commit(lambda: self._evict(key))
+
+    def clear(self) -> None:
+        """
+        Drop every local entry and reset the counters. Shared entries expire on their own.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.shared_hits = self.misses = 0
+
+    def stats(self) -> dict:
+        """
+        Return the hit/miss counters and the current number of local entries.
+        """
+        with self._lock:
+            lookups = self.hits + self.shared_hits + self.misses
+            return {
+                "hits": self.hits,
+                "shared_hits": self.shared_hits,
+                "misses": self.misses,
+                "hit_ratio": (self.hits + self.shared_hits) / lookups if lookups else 0.0,
+                "size": len(self._entries),
+            }
+
+
+def get_cache_stats() -> dict[str, dict]:
+    """
+    Return the counters of every read-through cache, keyed by cache name.
+    """
+    return {name: cache.stats() for name, cache in _registry.items()}
+
+
+def clear_read_through_caches() -> None:
+    """
+    Empty every read-through cache in this process.
+    """
+    for cache in _registry.values():
+        cache.clear()
@@ -0,0 +1,273 @@
+import contextlib
+import contextvars
+import functools
+import random
+import threading
+import time
+from typing import Callable, Iterable, Sequence
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, OperationalError, connections, models
+
+# PostgreSQL serialization_failure and deadlock_detected.
+RETRYABLE_SQLSTATES = {"40001", "40P01"}
+# SQLite reports lock contention as OperationalError with these messages.
+RETRYABLE_SQLITE_MESSAGES = ("database is locked", "database table is locked")
+# Alias of the optional read replica in DATABASES.
+READ_REPLICA_ALIAS = "replica"
+
+DEFAULT_REPLICA_SETTINGS = {
+    # Seconds of replication lag above which reads go back to the primary.
+    "MAX_LAG": 5.0,
+    # Seconds the last lag measurement is reused before measuring again.
+    "LAG_CHECK_INTERVAL": 1.0,
+    # Seconds a client keeps reading from the primary after it wrote.
+    "PIN_SECONDS": 5,
+    "PIN_COOKIE": "primary_pin",
+}
+
+# Whether reads must go to the primary: PIN_CLIENT when the client wrote in a
+# recent request, PIN_WROTE once the current request (or command) wrote.
+PIN_NONE, PIN_CLIENT, PIN_WROTE = 0, 1, 2
+_primary_pin = contextvars.ContextVar("primary_pin", default=PIN_NONE)
+
+
+def bulk_insert(
+    model: type[models.Model],
+    fields: Sequence[str],
+    rows: Iterable[Sequence],
+    batch_size: int = 5000,
+    using: str = "default",
+) -> int:
+    """
+    Insert raw rows into the table of `model` without building model instances
+    when the database allows it.
+
+    On PostgreSQL the rows are streamed with a single `COPY ... FROM STDIN`;
+    on other databases they are inserted with `bulk_create` in batches.
+    Signals, `save()` and validation are skipped either way.
+
+    Args:
+        model: The model whose table receives the rows.
+        fields: Attribute names of the columns, in row order (e.g. "student_id").
+        rows: Tuples of column values.
+        batch_size: Rows per INSERT when COPY is not available.
+        using: Database alias.
+
+    Returns:
+        int: Number of rows written.
+    """
+    connection = connections[using]
+    written = 0
+
+    if connection.vendor == "postgresql":
+        opts = model._meta
+        columns = ", ".join(
+            connection.ops.quote_name(opts.get_field(field).column) for field in fields
+        )
+        table = connection.ops.quote_name(opts.db_table)
+        with connection.cursor() as cursor:
+            with cursor.copy(f"COPY {table} ({columns}) FROM STDIN") as copy:
+                for row in rows:
+                    copy.write_row(row)
+                    written += 1
+        return written
+
+    batch = []
+    for row in rows:
+        batch.append(model(**dict(zip(fields, row))))
+        if len(batch) >= batch_size:
+            model.objects.using(using).bulk_create(batch)
+            written += len(batch)
+            batch = []
+    if batch:
+        model.objects.using(using).bulk_create(batch)
+        written += len(batch)
+    return written
+
+
+def is_retryable_error(error: Exception) -> bool:
+    """
+    Check whether a database error is a transient conflict (serialization
+    failure, deadlock or SQLite lock) that a new transaction may not hit.
+    """
+    cause = error.__cause__
+    sqlstate = getattr(cause, "sqlstate", None) or getattr(cause, "pgcode", None)
+    if sqlstate in RETRYABLE_SQLSTATES:
+        return True
+    return isinstance(error, OperationalError) and any(
+        message in str(error) for message in RETRYABLE_SQLITE_MESSAGES
+    )
+
+
+def retry_on_conflict(
+    max_attempts: int = 3,
+    base_delay: float = 0.05,
+    max_delay: float = 1.0,
+    using: str = DEFAULT_DB_ALIAS,
+) -> Callable:
+    """
+    Retry a transactional function when the database aborts it because of a
+    serialization failure or a deadlock.
+
+    Apply it outside `@transaction.atomic` so every attempt runs in a new
+    transaction. When called inside an outer atomic block the function runs
+    once, because only the outermost transaction can be retried.
+
+    Waits between attempts use exponential backoff capped at `max_delay`,
+    with full jitter so retrying requests do not collide again.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if connections[using].in_atomic_block:
+                return func(*args, **kwargs)
+
+            for attempt in range(1, max_attempts + 1):
+                try:
+                    return func(*args, **kwargs)
+                except Exception as e:
+                    if attempt == max_attempts or not is_retryable_error(e):
+                        raise
+                time.sleep(random.uniform(0, min(max_delay, base_delay * 2 ** (attempt - 1))))
+
+        return wrapper
+
+    return decorator
+
+
+def get_replica_settings() -> dict:
+    """
+    Return the REPLICA setting merged over the defaults.
+    """
+    return {**DEFAULT_REPLICA_SETTINGS, **getattr(settings, "REPLICA", {})}
+
+
+def start_pin_scope(client_pinned: bool = False) -> contextvars.Token:
+    """
+    Start tracking writes for a new request.
+
+    Args:
+        client_pinned (bool): Whether the client wrote recently, so even the
+            request's first reads must see the primary.
+
+    Returns:
+        contextvars.Token: Token to end the scope with `end_pin_scope`.
+    """
+    return _primary_pin.set(PIN_CLIENT if client_pinned else PIN_NONE)
+
+
+def end_pin_scope(token: contextvars.Token) -> None:
+    _primary_pin.reset(token)
+
+
+def pin_to_primary() -> None:
+    """
+    Record that the current request wrote, so its remaining reads go to the primary.
+    """
+    _primary_pin.set(PIN_WROTE)
+
+
+@contextlib.contextmanager
+def read_from_primary():
+    """
+    Send the reads made inside the block to the primary.
+
+    For reads whose result outlives the request, such as values loaded into
+    a cache: a replica read would keep data up to `REPLICA["MAX_LAG"]`
+    seconds old for the whole TTL. A write made inside the block still pins
+    the rest of the request.
+    """
+    token = _primary_pin.set(max(_primary_pin.get(), PIN_CLIENT))
+    try:
+        yield
+    finally:
+        wrote = wrote_to_primary()
+        _primary_pin.reset(token)
+        if wrote:
+            pin_to_primary()
+
+
+def is_pinned_to_primary() -> bool:
+    return _primary_pin.get() != PIN_NONE
+
+
+def wrote_to_primary() -> bool:
+    return _primary_pin.get() == PIN_WROTE
+
+
+class ReplicaLagMonitor:
+    """
+    Measures how far the read replica is behind the primary, at most once
+    per `LAG_CHECK_INTERVAL` per process.
+    """
+
+    # Time since the last transaction replayed on a PostgreSQL standby. It
+    # overstates the lag while the primary is idle, which only sends reads
+    # to the primary.
+    LAG_SQL = "SELECT EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())"
+
+    def __init__(self, alias: str = READ_REPLICA_ALIAS):
+        self.alias = alias
+        self._lock = threading.Lock()
+        self._checked_at = float("-inf")
+        self._lag = 0.0
+
+    def measure(self) -> float:
+        """
+        Query the replica for its lag in seconds. An unreachable replica
+        counts as infinitely behind.
+        """
+        try:
+            connection = connections[self.alias]
+            if connection.vendor != "postgresql":
+                return 0.0
+            with connection.cursor() as cursor:
+                cursor.execute(self.LAG_SQL)
+                lag = cursor.fetchone()[0]
+        except Exception:
+            return float("inf")
+        # NULL: the server is not replaying WAL (not a standby, or a mirror in tests).
+        return float(lag) if lag is not None else 0.0
+
+    def lag(self) -> float:
+        interval = get_replica_settings()["LAG_CHECK_INTERVAL"]
+        now = time.monotonic()
+        with self._lock:
+            if now - self._checked_at < interval:
+                return self._lag
+            self._checked_at = now
+        lag = self.measure()
+        with self._lock:
+            self._lag = lag
+        return lag
+
+    def reset(self) -> None:
+        with self._lock:
+            self._checked_at = float("-inf")
+            self._lag = 0.0
+
+
+lag_monitor = ReplicaLagMonitor()
+
+
+def replica_configured() -> bool:
+    return READ_REPLICA_ALIAS in settings.DATABASES
+
+
+def get_read_alias() -> str:
+    """
+    Database alias for read-only queries that can tolerate replication lag.
+
+    Returns the read replica when one is configured, unless the current
+    request already wrote (read-your-writes), a transaction is open on the
+    primary, or the replica lags more than `REPLICA["MAX_LAG"]` seconds;
+    the default database otherwise.
+    """
+    if not replica_configured():
+        return DEFAULT_DB_ALIAS
+    if is_pinned_to_primary() or connections[DEFAULT_DB_ALIAS].in_atomic_block:
+        return DEFAULT_DB_ALIAS
+    if lag_monitor.lag() > get_replica_settings()["MAX_LAG"]:
+        return DEFAULT_DB_ALIAS
+    return READ_REPLICA_ALIAS
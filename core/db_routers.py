@@ -0,0 +1,29 @@
+from django.db import DEFAULT_DB_ALIAS
+
+from .db import READ_REPLICA_ALIAS, get_read_alias, pin_to_primary
+
+
+class PrimaryReplicaRouter:
+    """
+    Send ORM reads to the read replica and writes to the primary.
+
+    Reads use `core.db.get_read_alias`, so they stay on the primary inside
+    transactions, after the current request wrote, and while the replica
+    lags. Without a `replica` alias in DATABASES everything uses `default`.
+    """
+
+    def db_for_read(self, model, **hints):
+        return get_read_alias()
+
+    def db_for_write(self, model, **hints):
+        pin_to_primary()
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Both aliases hold the same data.
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db == READ_REPLICA_ALIAS:
+            return False
+        return None
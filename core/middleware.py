@@ -0,0 +1,141 @@
+import logging
+from contextlib import ExitStack
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.db import connections
+
+from .db import end_pin_scope, get_replica_settings, start_pin_scope, wrote_to_primary
+from .query_metrics import QueryRecorder, get_query_budget, get_query_metrics_settings, registry
+
+logger = logging.getLogger("core.query_metrics")
+
+
+def _endpoint_name(request) -> str:
+    match = getattr(request, "resolver_match", None)
+    if match is None or not match.url_name:
+        return "<unresolved>"
+    return match.view_name
+
+
+class QueryInstrumentationMiddleware:
+    """
+    Record the queries each request runs on every database connection.
+
+    - Adds a `Server-Timing` header with the query count, SQL time and the
+      number of duplicated queries (same statement, different parameters).
+    - Aggregates the metrics per URL name in `core.query_metrics.registry`.
+    - Logs a warning when a request exceeds its query budget
+      (`QUERY_METRICS["BUDGETS"]`, falling back to `DEFAULT_BUDGET`).
+
+    Queries run while a streaming response is consumed happen after the
+    middleware returns and are not counted.
+
+    Under ASGI the ORM runs in the request's thread-sensitive worker thread,
+    so the wrappers are installed on that thread's connections.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not get_query_metrics_settings()["ENABLED"]:
+            return self.get_response(request)
+
+        recorder = QueryRecorder()
+        with ExitStack() as stack:
+            self._install(stack, recorder)
+            response = self.get_response(request)
+        return self._finish(request, response, recorder)
+
+    async def __acall__(self, request):
+        if not get_query_metrics_settings()["ENABLED"]:
+            return await self.get_response(request)
+
+        recorder = QueryRecorder()
+        stack = ExitStack()
+        await sync_to_async(self._install)(stack, recorder)
+        try:
+            response = await self.get_response(request)
+        finally:
+            await sync_to_async(stack.close)()
+        return self._finish(request, response, recorder)
+
+    def _install(self, stack: ExitStack, recorder: QueryRecorder) -> None:
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(recorder))
+
+    def _finish(self, request, response, recorder: QueryRecorder):
+        endpoint = _endpoint_name(request)
+        budget = get_query_budget(endpoint)
+        over_budget = budget is not None and recorder.count > budget
+        registry.record(endpoint, recorder, over_budget)
+        response["Server-Timing"] = recorder.server_timing()
+
+        if over_budget:
+            duplicates = sorted(recorder.duplicates.items(), key=lambda item: -item[1])[:3]
+            logger.warning(
+                "%s ran %d queries (budget %d) in %.2f ms. Most duplicated: %s",
+                endpoint,
+                recorder.count,
+                budget,
+                recorder.duration * 1000,
+                "; ".join(f"{count}x {sql[:200]}" for sql, count in duplicates) or "none",
+            )
+        return response
+
+
+class PrimaryPinningMiddleware:
+    """
+    Read-your-writes for `core.db_routers.PrimaryReplicaRouter`.
+
+    Once a request writes, its remaining reads go to the primary, and the
+    response sets a short-lived cookie (`REPLICA["PIN_COOKIE"]`) so the
+    client's next requests, on any worker, also read from the primary until
+    the replica has caught up (`REPLICA["PIN_SECONDS"]`).
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        config = get_replica_settings()
+        token = start_pin_scope(client_pinned=config["PIN_COOKIE"] in request.COOKIES)
+        try:
+            response = self.get_response(request)
+            wrote = wrote_to_primary()
+        finally:
+            end_pin_scope(token)
+        return self._finish(response, wrote, config)
+
+    async def __acall__(self, request):
+        # The pin lives in a context variable; sync_to_async copies it into the
+        # ORM thread and copies a write's pin back into this task.
+        config = get_replica_settings()
+        token = start_pin_scope(client_pinned=config["PIN_COOKIE"] in request.COOKIES)
+        try:
+            response = await self.get_response(request)
+            wrote = wrote_to_primary()
+        finally:
+            end_pin_scope(token)
+        return self._finish(response, wrote, config)
+
+    def _finish(self, response, wrote: bool, config: dict):
+        if wrote:
+            response.set_cookie(
+                config["PIN_COOKIE"], "1", max_age=config["PIN_SECONDS"], httponly=True, samesite="Lax"
+            )
+        return response
@@ -0,0 +1,125 @@
+import base64
+import binascii
+import json
+from typing import NamedTuple
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db.models import QuerySet
+from drf_yasg import openapi
+
+CURSOR_QUERY_PARAMETERS = [
+    openapi.Parameter(
+        "cursor",
+        openapi.IN_QUERY,
+        description="Opaque cursor returned as `next_cursor` by the previous page",
+        type=openapi.TYPE_STRING,
+        required=False,
+    ),
+    openapi.Parameter(
+        "page_size",
+        openapi.IN_QUERY,
+        description="Number of items per page",
+        type=openapi.TYPE_INTEGER,
+        required=False,
+    ),
+]
+
+
+class KeysetPage(NamedTuple):
+    items: list
+    next_cursor: str | None
+
+
+def encode_cursor(last_id: int) -> str:
+    """
+    Encode the key of the last item of a page into an opaque cursor.
+    """
+    payload = json.dumps({"after": last_id}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> int:
+    """
+    Decode a cursor produced by `encode_cursor`.
+
+    Raises:
+        ValidationError: If the cursor is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        after = json.loads(base64.urlsafe_b64decode(padded.encode()))["after"]
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise ValidationError("Invalid cursor.")
+
+    if not isinstance(after, int) or after < 0:
+        raise ValidationError("Invalid cursor.")
+    return after
+
+
+def get_page_params(query_params) -> tuple[int | None, int]:
+    """
+    Read `cursor` and `page_size` from the request query parameters.
+
+    Returns:
+        tuple[int | None, int]: The key to start after (None for the first
+                                page) and the validated page size.
+
+    Raises:
+        ValidationError: If the cursor or the page size is invalid.
+    """
+    cursor = query_params.get("cursor")
+    after = decode_cursor(cursor) if cursor else None
+
+    raw_page_size = query_params.get("page_size")
+    if raw_page_size is None:
+        return after, settings.LIST_PAGE_SIZE
+
+    try:
+        page_size = int(raw_page_size)
+    except ValueError:
+        raise ValidationError("page_size must be an integer.")
+
+    if not 1 <= page_size <= settings.LIST_MAX_PAGE_SIZE:
+        raise ValidationError(f"page_size must be between 1 and {settings.LIST_MAX_PAGE_SIZE}.")
+    return after, page_size
+
+
+def wants_pagination(query_params) -> bool:
+    """
+    Check whether the request asked for a page explicitly.
+    """
+    return "cursor" in query_params or "page_size" in query_params
+
+
+def paginate_by_key(queryset: QuerySet, after: int | None, page_size: int) -> KeysetPage:
+    """
+    Return one page of `queryset` ordered by primary key, starting after `after`.
+
+    Uses `WHERE pk > after ORDER BY pk LIMIT page_size + 1` instead of OFFSET,
+    so every page costs the same index range scan no matter how deep it is.
+    The extra row only tells whether a next page exists. `.values()`
+    querysets are accepted as long as their rows include `id`.
+    """
+    if after is not None:
+        queryset = queryset.filter(pk__gt=after)
+
+    return _keyset_page(list(queryset.order_by("pk")[: page_size + 1]), page_size)
+
+
+async def apaginate_by_key(queryset: QuerySet, after: int | None, page_size: int) -> KeysetPage:
+    """
+    Async counterpart of `paginate_by_key`, reading the page with `async for`.
+    """
+    if after is not None:
+        queryset = queryset.filter(pk__gt=after)
+
+    return _keyset_page([item async for item in queryset.order_by("pk")[: page_size + 1]], page_size)
+
+
+def _keyset_page(items: list, page_size: int) -> KeysetPage:
+    if len(items) > page_size:
+        items = items[:page_size]
+        last = items[-1]
+        return KeysetPage(items, encode_cursor(last["id"] if isinstance(last, dict) else last.pk))
+    return KeysetPage(items, None)
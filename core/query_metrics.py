@@ -0,0 +1,142 @@
+import re
+import threading
+import time
+from collections import Counter
+
+from django.conf import settings
+
+DEFAULT_QUERY_METRICS = {
+    "ENABLED": True,
+    "DEFAULT_BUDGET": None,
+    "BUDGETS": {},
+}
+
+_IN_LIST = re.compile(r"\(\s*(?:%s|\?)(?:\s*,\s*(?:%s|\?))*\s*\)")
+_LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def get_query_metrics_settings() -> dict:
+    """
+    Return the QUERY_METRICS setting merged over the defaults.
+    """
+    return {**DEFAULT_QUERY_METRICS, **getattr(settings, "QUERY_METRICS", {})}
+
+
+def fingerprint_sql(sql: str) -> str:
+    """
+    Normalize a SQL statement so that executions differing only in their
+    parameters (including the length of IN lists) share the same fingerprint.
+    """
+    sql = _LITERALS.sub("?", sql)
+    sql = _IN_LIST.sub("(...)", sql)
+    return _WHITESPACE.sub(" ", sql).strip()
+
+
+class QueryRecorder:
+    """
+    `connection.execute_wrapper` callable that records the number, total time
+    and fingerprints of the queries executed while it is installed.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.fingerprints: Counter[str] = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - start
+            self.count += 1
+            self.fingerprints[fingerprint_sql(sql)] += 1
+
+    @property
+    def duplicates(self) -> dict[str, int]:
+        """
+        Fingerprints executed more than once, with their execution count.
+        """
+        return {sql: count for sql, count in self.fingerprints.items() if count > 1}
+
+    def server_timing(self) -> str:
+        """
+        Render the recorded metrics as a `Server-Timing` header value.
+        """
+        duplicated = sum(count - 1 for count in self.duplicates.values())
+        return (
+            f'db;dur={self.duration * 1000:.2f};desc="{self.count} queries", '
+            f'db-dup;desc="{duplicated} duplicated"'
+        )
+
+
+class QueryMetricsRegistry:
+    """
+    In-process aggregate of per-request query metrics, keyed by URL name.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._endpoints: dict[str, dict] = {}
+
+    def record(self, endpoint: str, recorder: QueryRecorder, over_budget: bool) -> None:
+        with self._lock:
+            stats = self._endpoints.setdefault(endpoint, {
+                "requests": 0,
+                "queries": 0,
+                "max_queries": 0,
+                "sql_ms": 0.0,
+                "max_sql_ms": 0.0,
+                "requests_with_duplicates": 0,
+                "over_budget": 0,
+                "top_duplicates": Counter(),
+            })
+            sql_ms = recorder.duration * 1000
+            stats["requests"] += 1
+            stats["queries"] += recorder.count
+            stats["max_queries"] = max(stats["max_queries"], recorder.count)
+            stats["sql_ms"] += sql_ms
+            stats["max_sql_ms"] = max(stats["max_sql_ms"], sql_ms)
+            stats["over_budget"] += int(over_budget)
+            duplicates = recorder.duplicates
+            if duplicates:
+                stats["requests_with_duplicates"] += 1
+                stats["top_duplicates"].update(duplicates)
+
+    def snapshot(self) -> dict[str, dict]:
+        """
+        Return a JSON-serializable copy of the aggregates, with averages.
+        """
+        with self._lock:
+            return {
+                endpoint: {
+                    "requests": stats["requests"],
+                    "avg_queries": stats["queries"] / stats["requests"],
+                    "max_queries": stats["max_queries"],
+                    "avg_sql_ms": round(stats["sql_ms"] / stats["requests"], 3),
+                    "max_sql_ms": round(stats["max_sql_ms"], 3),
+                    "requests_with_duplicates": stats["requests_with_duplicates"],
+                    "over_budget": stats["over_budget"],
+                    "top_duplicates": [
+                        {"sql": sql, "executions": count}
+                        for sql, count in stats["top_duplicates"].most_common(5)
+                    ],
+                }
+                for endpoint, stats in self._endpoints.items()
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._endpoints.clear()
+
+
+registry = QueryMetricsRegistry()
+
+
+def get_query_budget(endpoint: str) -> int | None:
+    """
+    Return the maximum number of queries allowed for `endpoint`, if any.
+    """
+    config = get_query_metrics_settings()
+    return config["BUDGETS"].get(endpoint, config["DEFAULT_BUDGET"])
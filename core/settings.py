@@ -62,6 +62,8 @@ REST_FRAMEWORK = {
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'core.middleware.QueryInstrumentationMiddleware',
+    'core.middleware.PrimaryPinningMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -113,9 +115,67 @@ DATABASES = {
         'PASSWORD': os.getenv('POSTGRES_PASSWORD'),
         'HOST': os.getenv('POSTGRES_HOST'),
         'PORT': os.getenv('POSTGRES_PORT', '5432'),
+        # Keep connections open between requests instead of reconnecting every
+        # time; health checks drop connections the server has closed.
+        'CONN_MAX_AGE': int(os.getenv('DB_CONN_MAX_AGE', '60')),
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
+# Optional psycopg 3 connection pool per worker process (needs psycopg-pool).
+# It replaces persistent connections, so CONN_MAX_AGE must be 0.
+if os.getenv('DB_POOL', '').lower() in ('1', 'true', 'yes'):
+    DATABASES['default']['CONN_MAX_AGE'] = 0
+    DATABASES['default']['OPTIONS'] = {
+        'pool': {
+            'min_size': int(os.getenv('DB_POOL_MIN_SIZE', '2')),
+            'max_size': int(os.getenv('DB_POOL_MAX_SIZE', '10')),
+            'timeout': float(os.getenv('DB_POOL_TIMEOUT', '10')),
+        },
+    }
+
+# Optional read replica that takes the ORM reads (see core.db_routers).
+# Tests read it through the default connection.
+if os.getenv('POSTGRES_REPLICA_HOST'):
+    DATABASES['replica'] = {
+        **DATABASES['default'],
+        'HOST': os.getenv('POSTGRES_REPLICA_HOST'),
+        'PORT': os.getenv('POSTGRES_REPLICA_PORT', DATABASES['default']['PORT']),
+        'TEST': {'MIRROR': 'default'},
+    }
+
+# Cache shared by every gunicorn worker and by management commands, so an
+# invalidation made in one process (catalog, read-through lookups) reaches
+# the others. Without REDIS_URL each process keeps its own in-memory cache,
+# which is only safe with a single process (runserver, tests).
+if os.getenv('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.getenv('REDIS_URL'),
+            'KEY_PREFIX': 'university',
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+# Reads go to the replica when it is configured (see core.db_routers).
+DATABASE_ROUTERS = ['core.db_routers.PrimaryReplicaRouter']
+
+# Replica routing (core.db.get_read_alias). Reads fall back to the primary
+# when the replica lags more than MAX_LAG seconds, and a client that wrote
+# keeps reading from the primary for PIN_SECONDS.
+REPLICA = {
+    'MAX_LAG': float(os.getenv('REPLICA_MAX_LAG', '5')),
+    'LAG_CHECK_INTERVAL': 1.0,
+    'PIN_SECONDS': int(os.getenv('REPLICA_PIN_SECONDS', '5')),
+    'PIN_COOKIE': 'primary_pin',
+}
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -169,3 +229,45 @@ SIMPLE_JWT = {
     "BLACKLIST_AFTER_ROTATION": True,
     "AUTH_HEADER_TYPES": ("Bearer",),
 }
+
+# Academics settings
+# Seconds a pre-serialized course catalog snapshot is kept (it is also rebuilt on every change)
+COURSE_CATALOG_CACHE_TIMEOUT = 60 * 60 * 24
+
+# Idempotency-Key support for enrollment, grade and offering POSTs
+# (academics.idempotency). Responses are replayed for TTL seconds; a first
+# request still running after PENDING_TIMEOUT seconds is assumed lost and
+# its key can be claimed again. Run `purge_idempotency_keys` to drop old rows.
+IDEMPOTENCY = {
+    "TTL": 60 * 60 * 24,
+    "PENDING_TIMEOUT": 60,
+}
+
+# Read-through cache for catalog lookups by id (semester, course, user).
+# With SHARED_CACHE_ALIAS (the Redis cache, when configured) lookups go to the
+# cache shared between processes, so invalidations reach every worker;
+# otherwise each process keeps its own copies, which needs a single process.
+# MAX_ENTRIES only bounds the per-process copies.
+READ_THROUGH_CACHE = {
+    "ENABLED": True,
+    "MAX_ENTRIES": 2048,
+    "TTL": 300,
+    "SHARED_CACHE_ALIAS": "default" if os.getenv('REDIS_URL') else None,
+}
+
+# Keyset (cursor) pagination of list endpoints
+LIST_PAGE_SIZE = 100
+LIST_MAX_PAGE_SIZE = 1000
+# Maximum number of operations in one request to the batch endpoint (academics/batch/)
+BATCH_MAX_OPERATIONS = 1000
+# Rows fetched per round trip by streaming exports (?export=ndjson|json)
+EXPORT_CHUNK_SIZE = 2000
+
+# Per-request query instrumentation (core.middleware.QueryInstrumentationMiddleware).
+# BUDGETS maps URL names to the maximum number of queries before a warning is
+# logged, e.g. {"courses": 5}; DEFAULT_BUDGET applies to the other endpoints.
+QUERY_METRICS = {
+    "ENABLED": True,
+    "DEFAULT_BUDGET": 50,
+    "BUDGETS": {},
+}
\ No newline at end of file
@@ -0,0 +1,131 @@
+import json
+from typing import AsyncIterable, AsyncIterator, Iterable, Iterator
+
+from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
+from drf_yasg import openapi
+
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "json": "application/json",
+}
+
+EXPORT_QUERY_PARAMETER = openapi.Parameter(
+    "export",
+    openapi.IN_QUERY,
+    description="Stream every row instead of a page: `ndjson` (one JSON object per line) or `json`",
+    type=openapi.TYPE_STRING,
+    enum=list(EXPORT_FORMATS),
+    required=False,
+)
+
+# Encoded rows are grouped into writes of roughly this many bytes.
+WRITE_BUFFER_SIZE = 64 * 1024
+
+_encoder = DjangoJSONEncoder(separators=(",", ":"))
+
+
+def get_export_format(query_params) -> str | None:
+    """
+    Read the `export` query parameter.
+
+    Returns:
+        str | None: The requested export format, or None for a regular response.
+
+    Raises:
+        ValidationError: If the format is not supported.
+    """
+    export_format = query_params.get("export")
+    if export_format is not None and export_format not in EXPORT_FORMATS:
+        raise ValidationError(f"export must be one of: {', '.join(EXPORT_FORMATS)}.")
+    return export_format
+
+
+def _buffered(chunks: Iterable[str]) -> Iterator[bytes]:
+    buffer: list[str] = []
+    size = 0
+    for chunk in chunks:
+        buffer.append(chunk)
+        size += len(chunk)
+        if size >= WRITE_BUFFER_SIZE:
+            yield "".join(buffer).encode()
+            buffer, size = [], 0
+    if buffer:
+        yield "".join(buffer).encode()
+
+
+def iter_ndjson(rows: Iterable[dict]) -> Iterator[bytes]:
+    """
+    Encode rows as newline-delimited JSON, one row at a time.
+    """
+    return _buffered(_encoder.encode(row) + "\n" for row in rows)
+
+
+def iter_json(rows: Iterable[dict]) -> Iterator[bytes]:
+    """
+    Encode rows incrementally as the `{"is_ok": true, "data": [...]}` envelope
+    used by the rest of the API.
+    """
+    def chunks():
+        yield '{"is_ok":true,"data":['
+        for index, row in enumerate(rows):
+            yield ("," if index else "") + _encoder.encode(row)
+        yield "]}"
+
+    return _buffered(chunks())
+
+
+async def _abuffered(chunks: AsyncIterable[str]) -> AsyncIterator[bytes]:
+    buffer: list[str] = []
+    size = 0
+    async for chunk in chunks:
+        buffer.append(chunk)
+        size += len(chunk)
+        if size >= WRITE_BUFFER_SIZE:
+            yield "".join(buffer).encode()
+            buffer, size = [], 0
+    if buffer:
+        yield "".join(buffer).encode()
+
+
+def aiter_ndjson(rows: AsyncIterable[dict]) -> AsyncIterator[bytes]:
+    """
+    Async counterpart of `iter_ndjson`.
+    """
+    return _abuffered(_encoder.encode(row) + "\n" async for row in rows)
+
+
+def aiter_json(rows: AsyncIterable[dict]) -> AsyncIterator[bytes]:
+    """
+    Async counterpart of `iter_json`.
+    """
+    async def chunks():
+        yield '{"is_ok":true,"data":['
+        index = 0
+        async for row in rows:
+            yield ("," if index else "") + _encoder.encode(row)
+            index += 1
+        yield "]}"
+
+    return _abuffered(chunks())
+
+
+def streaming_export_response(
+    rows: Iterable[dict] | AsyncIterable[dict], export_format: str, filename: str
+) -> StreamingHttpResponse:
+    """
+    Build a StreamingHttpResponse that encodes `rows` while they are read.
+
+    `rows` should be a lazy iterator (e.g. `QuerySet.values().iterator()`),
+    so peak memory is bounded by the iterator chunk size, not by the table.
+    Async views pass an async iterator (`QuerySet.values().aiterator()`),
+    which Django streams without a worker thread.
+    """
+    if hasattr(rows, "__aiter__"):
+        encode = aiter_ndjson if export_format == "ndjson" else aiter_json
+    else:
+        encode = iter_ndjson if export_format == "ndjson" else iter_json
+    response = StreamingHttpResponse(encode(rows), content_type=EXPORT_FORMATS[export_format])
+    response["Content-Disposition"] = f'attachment; filename="{filename}.{export_format}"'
+    return response
@@ -0,0 +1,230 @@
+import json
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from academics.models import Course, CourseOffering, Semester
+from academics.services.catalog_services import bump_catalog_version
+from core.cache import ReadThroughCache
+from core.pagination import apaginate_by_key
+from core.query_metrics import registry
+from users.models import User
+from users.services import user_services
+
+
+def bearer(user: User) -> dict:
+    return {"Authorization": f"Bearer {AccessToken.for_user(user)}"}
+
+
+def async_get(path: str, data=None, **headers):
+    """Send the request through Django's ASGI handler, as under uvicorn."""
+    return async_to_sync(AsyncClient().get)(path, data or {}, headers=headers)
+
+
+@pytest.fixture
+def admin():
+    return User.objects.create_user(username="async_admin", password="pass", role=User.Role.ADMIN)
+
+
+# The ASGI handler runs the ORM in its own thread, with its own connection,
+# so the test data must be committed to be visible. Those reads are routed to
+# the replica when one is configured.
+@pytest.mark.django_db(transaction=True, databases="__all__")
+class TestAsyncAuthentication:
+
+    def test_missing_token(self):
+        """❌ Requests without a token should get the standard 401 body."""
+        response = async_get(reverse("semesters-async"))
+
+        assert response.status_code == 401
+        assert response.json() == {"is_ok": False, "error": "Authentication failed or token missing."}
+        assert response["WWW-Authenticate"].startswith("Bearer")
+
+    def test_invalid_token(self):
+        """❌ A malformed token should be rejected with 401."""
+        response = async_get(reverse("semesters-async"), Authorization="Bearer not-a-token")
+
+        assert response.status_code == 401
+
+    def test_wrong_role(self):
+        """❌ Permission classes should be enforced with the standard 403 body."""
+        student = User.objects.create_user(username="async_student", password="pass", role=User.Role.STUDENT)
+
+        response = async_get(reverse("semesters-async"), **bearer(student))
+
+        assert response.status_code == 403
+        assert response.json()["is_ok"] is False
+
+    def test_inactive_user(self, admin):
+        """❌ Tokens of inactive users should be rejected."""
+        headers = bearer(admin)
+        admin.is_active = False
+        admin.save()
+
+        assert async_get(reverse("semesters-async"), **headers).status_code == 401
+
+
+@pytest.mark.django_db(transaction=True, databases="__all__")
+class TestAsyncReadViews:
+
+    def test_semesters_match_sync_view(self, admin):
+        """✅ The async semester list should return the same body as the sync one."""
+        Semester.objects.create(year=2025, term=2)
+        Semester.objects.create(year=2025, term=1)
+        client = APIClient()
+        client.force_authenticate(admin)
+
+        sync_body = client.get(reverse("semesters")).json()
+        response = async_get(reverse("semesters-async"), **bearer(admin))
+
+        assert response.status_code == 200
+        assert response.json() == sync_body
+        assert [row["term"] for row in response.json()["data"]] == [1, 2]
+
+    def test_semesters_page(self, admin):
+        """✅ page_size should return one keyset page with a cursor."""
+        for term in (1, 2, 3):
+            Semester.objects.create(year=2024, term=term)
+
+        first = async_get(reverse("semesters-async"), {"page_size": 2}, **bearer(admin)).json()
+        second = async_get(
+            reverse("semesters-async"), {"page_size": 2, "cursor": first["next_cursor"]}, **bearer(admin)
+        ).json()
+
+        assert len(first["data"]) == 2
+        assert [row["term"] for row in second["data"]] == [3]
+        assert second["next_cursor"] is None
+
+    def test_invalid_cursor(self, admin):
+        """❌ A malformed cursor should return 400."""
+        response = async_get(reverse("semesters-async"), {"cursor": "!!"}, **bearer(admin))
+
+        assert response.status_code == 400
+
+    def test_course_catalog_and_etag(self, admin):
+        """✅ The catalog should be served from the snapshot and honour If-None-Match."""
+        Course.objects.create(code="ASY101", name="Async", credits=3)
+        bump_catalog_version()
+
+        response = async_get(reverse("courses-async"), **bearer(admin))
+        cached = async_get(reverse("courses-async"), **{"If-None-Match": response["ETag"]}, **bearer(admin))
+
+        assert response.status_code == 200
+        assert [row["code"] for row in response.json()["data"]] == ["ASY101"]
+        assert cached.status_code == 304
+
+    def test_courses_ndjson_export(self, admin):
+        """✅ ?export=ndjson should stream every course from an async iterator."""
+        for i in range(3):
+            Course.objects.create(code=f"EXP{i}", name=f"Export {i}", credits=2)
+
+        response = async_get(reverse("courses-async"), {"export": "ndjson"}, **bearer(admin))
+
+        assert response.status_code == 200
+        assert response.is_async
+        body = async_to_sync(_read_stream)(response)
+        assert [json.loads(line)["code"] for line in body.splitlines()] == ["EXP0", "EXP1", "EXP2"]
+
+    def test_teacher_courses(self):
+        """✅ A teacher should see their offerings of the semester."""
+        teacher = User.objects.create_user(username="async_teacher", password="pass", role=User.Role.TEACHER)
+        semester = Semester.objects.create(year=2025, term=1)
+        course = Course.objects.create(code="TCH101", name="Teaching", credits=3)
+        CourseOffering.objects.create(teacher=teacher, semester=semester, course=course)
+
+        response = async_get(reverse("teacher-courses-async"), {"semester_id": semester.id}, **bearer(teacher))
+
+        assert response.status_code == 200
+        assert [row["course_code"] for row in response.json()["data"]] == ["TCH101"]
+
+    def test_teacher_courses_admin_requires_teacher_id(self, admin):
+        """❌ Admins must say which teacher to look up."""
+        semester = Semester.objects.create(year=2025, term=1)
+
+        response = async_get(reverse("teacher-courses-async"), {"semester_id": semester.id}, **bearer(admin))
+
+        assert response.status_code == 400
+        assert response.json()["error"] == "teacher_id is required for admins."
+
+    def test_teacher_courses_missing_semester(self, admin):
+        """❌ A missing semester_id should return 400 instead of failing."""
+        response = async_get(reverse("teacher-courses-async"), **bearer(admin))
+
+        assert response.status_code == 400
+
+    def test_students_page(self, admin):
+        """✅ The async student list should page like the sync one."""
+        for i in range(3):
+            user_services.create_user_student(
+                username=f"async_student{i}",
+                email=f"async_student{i}@example.com",
+                password="password123",
+                enrollment_number=f"AS{i}",
+                program="Computer Science",
+            )
+
+        response = async_get(reverse("list-students-async"), {"page_size": 2}, **bearer(admin))
+
+        assert response.status_code == 200
+        assert len(response.json()["data"]) == 2
+        assert response.json()["next_cursor"] is not None
+
+    def test_async_teacher_list_without_page_params(self, admin):
+        """✅ Without cursor or page_size the async teacher list should return everything."""
+        user_services.create_user_teacher(
+            username="async_teacher", email="async_teacher@example.com", password="password123", department="CS"
+        )
+
+        response = async_get(reverse("list-teachers-async"), **bearer(admin))
+
+        assert response.status_code == 200
+        assert len(response.json()["data"]) == 1
+        assert "next_cursor" not in response.json()
+
+    def test_query_metrics_under_asgi(self, admin):
+        """✅ Queries run by async views should still be counted by the middleware."""
+        registry.reset()
+        Semester.objects.create(year=2025, term=1)
+
+        response = async_get(reverse("semesters-async"), **bearer(admin))
+
+        assert "queries" in response["Server-Timing"]
+        assert registry.snapshot()["semesters-async"]["requests"] == 1
+        assert registry.snapshot()["semesters-async"]["max_queries"] >= 2
+        registry.reset()
+
+
+async def _read_stream(response) -> bytes:
+    return b"".join([chunk async for chunk in response.streaming_content])
+
+
+@pytest.mark.django_db
+class TestAsyncHelpers:
+
+    def test_apaginate_by_key(self):
+        """✅ The async keyset page should match the sync one."""
+        for term in (1, 2, 3):
+            Semester.objects.create(year=2023, term=term)
+
+        page = async_to_sync(apaginate_by_key)(Semester.objects.all(), None, 2)
+
+        assert [semester.term for semester in page.items] == [1, 2]
+        assert page.next_cursor is not None
+
+    def test_aget_or_load_caches(self):
+        """✅ The async read-through lookup should call the loader once."""
+        cache = ReadThroughCache("async-test")
+        calls = []
+
+        async def load():
+            calls.append(1)
+            return {"value": 1}
+
+        assert async_to_sync(cache.aget_or_load)(1, load) == {"value": 1}
+        assert async_to_sync(cache.aget_or_load)(1, load) == {"value": 1}
+        assert len(calls) == 1
+        assert cache.stats()["hits"] == 1
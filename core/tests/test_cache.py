@@ -0,0 +1,176 @@
+import pytest
+from asgiref.sync import async_to_sync
+from django.core.cache import caches
+from django.db import DEFAULT_DB_ALIAS
+from django.core.exceptions import ValidationError
+from django.test import override_settings
+from django.utils import timezone
+
+from academics.models import Semester
+from academics.services.semester_services import get_semester_by_id, semester_cache
+from core import db
+from core.cache import ReadThroughCache, get_cache_stats, get_process_local_caches
+from core.db import READ_REPLICA_ALIAS, end_pin_scope, get_read_alias, start_pin_scope
+
+LOCMEM = {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+REDIS = {"BACKEND": "django.core.cache.backends.redis.RedisCache", "LOCATION": "redis://localhost:6379/0"}
+
+
+class TestReadThroughCache:
+
+    def test_miss_then_hit(self):
+        """✅ The loader should run once and later lookups should hit the local tier."""
+        cache = ReadThroughCache("test-miss-hit")
+        calls = []
+
+        def load():
+            calls.append(1)
+            return {"value": 1}
+
+        assert cache.get_or_load(1, load) == {"value": 1}
+        assert cache.get_or_load(1, load) == {"value": 1}
+        assert len(calls) == 1
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+        assert "test-miss-hit" in get_cache_stats()
+
+    def test_hits_return_copies(self):
+        """✅ Mutating a returned value must not change the cached one."""
+        cache = ReadThroughCache("test-copies")
+        cache.get_or_load(1, lambda: {"value": 1})["value"] = 2
+
+        assert cache.get_or_load(1, lambda: None) == {"value": 1}
+
+    @override_settings(READ_THROUGH_CACHE={"MAX_ENTRIES": 2})
+    def test_least_recently_used_entry_is_evicted(self):
+        """✅ The local tier should keep at most MAX_ENTRIES entries."""
+        cache = ReadThroughCache("test-lru")
+        cache.get_or_load(1, lambda: "a")
+        cache.get_or_load(2, lambda: "b")
+        cache.get_or_load(1, lambda: "a")
+        cache.get_or_load(3, lambda: "c")
+
+        assert cache.get_or_load(1, lambda: "reloaded") == "a"
+        assert cache.get_or_load(2, lambda: "reloaded") == "reloaded"
+
+    @override_settings(READ_THROUGH_CACHE={"TTL": 0})
+    def test_expired_entries_are_reloaded(self):
+        """✅ Entries older than TTL should be loaded again."""
+        cache = ReadThroughCache("test-ttl")
+        cache.get_or_load(1, lambda: "old")
+
+        assert cache.get_or_load(1, lambda: "new") == "new"
+
+    @override_settings(READ_THROUGH_CACHE={"SHARED_CACHE_ALIAS": "default"})
+    def test_shared_tier_serves_local_misses(self):
+        """✅ A value missing from the local tier should be served from the shared tier."""
+        cache = ReadThroughCache("test-shared")
+        cache.get_or_load(1, lambda: "value")
+        cache.clear()
+
+        assert cache.get_or_load(1, lambda: "reloaded") == "value"
+        assert cache.stats()["shared_hits"] == 1
+
+    @override_settings(READ_THROUGH_CACHE={"SHARED_CACHE_ALIAS": "default"})
+    def test_shared_tier_keeps_no_local_copies(self):
+        """✅ With a shared tier, a value evicted from it should be reloaded, not served from a local copy."""
+        cache = ReadThroughCache("test-shared-only")
+        cache.get_or_load(1, lambda: "old")
+        caches["default"].delete(cache._shared_key(1))
+
+        assert cache.get_or_load(1, lambda: "new") == "new"
+        assert cache.stats()["size"] == 0
+
+    @override_settings(READ_THROUGH_CACHE={"ENABLED": False})
+    def test_disabled_cache_always_loads(self):
+        """✅ With ENABLED=False every lookup should call the loader."""
+        cache = ReadThroughCache("test-disabled")
+        cache.get_or_load(1, lambda: "a")
+
+        assert cache.get_or_load(1, lambda: "b") == "b"
+        assert cache.stats()["size"] == 0
+
+    @pytest.mark.parametrize("shared_alias", [None, "default"])
+    def test_loaders_read_from_primary(self, shared_alias, monkeypatch):
+        """✅ Loaders should not fill the cache from a lagging replica."""
+        monkeypatch.setattr(db, "replica_configured", lambda: True)
+        monkeypatch.setattr(db.lag_monitor, "lag", lambda: 0.0)
+        token = start_pin_scope()
+        cache = ReadThroughCache(f"test-primary-{shared_alias}")
+
+        async def aload():
+            return get_read_alias()
+
+        try:
+            with override_settings(READ_THROUGH_CACHE={"SHARED_CACHE_ALIAS": shared_alias}):
+                assert cache.get_or_load(1, get_read_alias) == DEFAULT_DB_ALIAS
+                assert async_to_sync(cache.aget_or_load)(2, aload) == DEFAULT_DB_ALIAS
+            assert get_read_alias() == READ_REPLICA_ALIAS
+        finally:
+            cache.clear()
+            end_pin_scope(token)
+
+    def test_loader_errors_are_not_cached(self):
+        """❌ A failing loader should propagate its error and cache nothing."""
+        cache = ReadThroughCache("test-errors")
+
+        def load():
+            raise ValidationError("missing")
+
+        with pytest.raises(ValidationError):
+            cache.get_or_load(1, load)
+        assert cache.get_or_load(1, lambda: "found") == "found"
+
+
+
+class TestProcessLocalCaches:
+
+    @override_settings(CACHES={"default": LOCMEM}, READ_THROUGH_CACHE={"SHARED_CACHE_ALIAS": None})
+    def test_in_memory_caches_are_reported(self):
+        """❌ An in-memory default cache and a read-through cache without shared tier are per process."""
+        assert get_process_local_caches() == ['CACHES["default"]', 'READ_THROUGH_CACHE["SHARED_CACHE_ALIAS"]']
+
+    @override_settings(CACHES={"default": REDIS}, READ_THROUGH_CACHE={"SHARED_CACHE_ALIAS": "default"})
+    def test_shared_caches_are_not_reported(self):
+        """✅ A Redis default cache used as the shared tier can serve several workers."""
+        assert get_process_local_caches() == []
+
+    @override_settings(CACHES={"default": REDIS}, READ_THROUGH_CACHE={"ENABLED": False})
+    def test_disabled_read_through_cache_is_not_reported(self):
+        """✅ A disabled read-through cache cannot serve stale rows."""
+        assert get_process_local_caches() == []
+
+
+@pytest.mark.django_db
+class TestServiceCaching:
+
+    def test_get_semester_by_id_hits_cache(self, django_assert_num_queries):
+        """✅ Repeated lookups of the same semester should not query the database."""
+        semester = Semester.objects.create(year=2025, term=1)
+        get_semester_by_id(semester.id)
+
+        with django_assert_num_queries(0):
+            assert get_semester_by_id(semester.id) == semester
+
+    def test_save_invalidates_cached_semester(self):
+        """✅ Saving a semester should drop its cached copy."""
+        semester = Semester.objects.create(year=2025, term=1)
+        get_semester_by_id(semester.id)
+
+        semester.year = 2026
+        semester.save()
+
+        assert get_semester_by_id(semester.id).year == 2026
+        assert semester_cache.stats()["misses"] == 2
+
+    @override_settings(READ_THROUGH_CACHE={"SHARED_CACHE_ALIAS": "default"})
+    def test_invalidation_from_another_process_is_seen(self):
+        """✅ With a shared tier, a semester allocated by another process (run_lottery) should be seen at once."""
+        semester = Semester.objects.create(year=2025, term=1)
+        assert get_semester_by_id(semester.id).allocated_at is None
+
+        # What another process does: write the row and evict the shared entry.
+        Semester.objects.filter(pk=semester.pk).update(allocated_at=timezone.now())
+        caches["default"].delete(semester_cache._shared_key(semester.id))
+
+        assert get_semester_by_id(semester.id).allocated_at is not None
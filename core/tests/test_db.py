@@ -0,0 +1,85 @@
+import pytest
+from django.db import OperationalError, transaction
+
+from academics.models import Semester
+from core.db import bulk_insert, is_retryable_error, retry_on_conflict
+
+
+class SerializationFailure(Exception):
+    sqlstate = "40001"
+
+
+def conflict() -> OperationalError:
+    error = OperationalError("could not serialize access")
+    error.__cause__ = SerializationFailure()
+    return error
+
+
+class TestRetryOnConflict:
+
+    def test_retries_serialization_failures(self):
+        """✅ A serialization failure should be retried until the call succeeds."""
+        calls = []
+
+        @retry_on_conflict(max_attempts=3, base_delay=0)
+        def flaky():
+            calls.append(1)
+            if len(calls) < 3:
+                raise conflict()
+            return "done"
+
+        assert flaky() == "done"
+        assert len(calls) == 3
+
+    def test_gives_up_after_max_attempts(self):
+        """❌ The last conflict should be raised once the attempts run out."""
+        calls = []
+
+        @retry_on_conflict(max_attempts=2, base_delay=0)
+        def always_conflicts():
+            calls.append(1)
+            raise conflict()
+
+        with pytest.raises(OperationalError):
+            always_conflicts()
+        assert len(calls) == 2
+
+    def test_other_errors_are_not_retried(self):
+        """❌ Errors that are not conflicts should propagate immediately."""
+        calls = []
+
+        @retry_on_conflict(base_delay=0)
+        def fails():
+            calls.append(1)
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            fails()
+        assert len(calls) == 1
+        assert not is_retryable_error(OperationalError("no such table"))
+
+    @pytest.mark.django_db
+    def test_no_retry_inside_outer_transaction(self):
+        """❌ Inside an outer atomic block the call should run only once."""
+        calls = []
+
+        @retry_on_conflict(base_delay=0)
+        def always_conflicts():
+            calls.append(1)
+            raise conflict()
+
+        with pytest.raises(OperationalError):
+            with transaction.atomic():
+                always_conflicts()
+        assert len(calls) == 1
+
+
+@pytest.mark.django_db
+class TestBulkInsert:
+
+    def test_inserts_rows(self):
+        """✅ Raw rows should be written in batches."""
+        written = bulk_insert(Semester, ["year", "term"], ((2000 + i, 1) for i in range(5)), batch_size=2)
+
+        assert written == 5
+        assert Semester.objects.count() == 5
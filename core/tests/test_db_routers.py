@@ -0,0 +1,149 @@
+import pytest
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+from academics.models import Semester
+from core import db
+from core.db import (
+    READ_REPLICA_ALIAS,
+    ReplicaLagMonitor,
+    end_pin_scope,
+    get_read_alias,
+    read_from_primary,
+    start_pin_scope,
+)
+from core.db_routers import PrimaryReplicaRouter
+from core.middleware import PrimaryPinningMiddleware
+
+
+@pytest.fixture
+def pin_scope():
+    """Run the test as a fresh request that has not written yet."""
+    token = start_pin_scope()
+    yield
+    end_pin_scope(token)
+
+
+@pytest.fixture
+def replica(monkeypatch):
+    """Pretend a replica alias is configured (it is never connected to) with no lag."""
+    monkeypatch.setattr(db, "replica_configured", lambda: True)
+    monkeypatch.setattr(db.lag_monitor, "lag", lambda: 0.0)
+
+
+@pytest.mark.usefixtures("pin_scope")
+class TestPrimaryReplicaRouter:
+
+    @pytest.mark.skipif(READ_REPLICA_ALIAS in settings.DATABASES, reason="a replica alias is configured")
+    def test_without_replica_everything_uses_default(self):
+        """✅ Without a replica alias reads should stay on the default database."""
+        assert get_read_alias() == DEFAULT_DB_ALIAS
+        assert PrimaryReplicaRouter().db_for_read(Semester) == DEFAULT_DB_ALIAS
+
+    def test_reads_go_to_replica(self, replica):
+        """✅ Reads should use the replica and writes the primary."""
+        router = PrimaryReplicaRouter()
+
+        assert router.db_for_read(Semester) == READ_REPLICA_ALIAS
+        assert router.allow_migrate(READ_REPLICA_ALIAS, "academics") is False
+
+    def test_reads_after_a_write_use_primary(self, replica):
+        """✅ Once the request wrote, its reads should see the primary."""
+        router = PrimaryReplicaRouter()
+
+        assert router.db_for_write(Semester) == DEFAULT_DB_ALIAS
+        assert router.db_for_read(Semester) == DEFAULT_DB_ALIAS
+
+    def test_read_from_primary_block(self, replica):
+        """✅ Reads inside read_from_primary should use the primary, and only there."""
+        with read_from_primary():
+            assert get_read_alias() == DEFAULT_DB_ALIAS
+
+        assert get_read_alias() == READ_REPLICA_ALIAS
+
+    def test_write_inside_read_from_primary_keeps_pin(self, replica):
+        """✅ A write inside read_from_primary should still pin the rest of the request."""
+        with read_from_primary():
+            PrimaryReplicaRouter().db_for_write(Semester)
+
+        assert get_read_alias() == DEFAULT_DB_ALIAS
+
+    def test_lagging_replica_falls_back_to_primary(self, replica, monkeypatch):
+        """✅ Reads should go to the primary while the replica lags past MAX_LAG."""
+        monkeypatch.setattr(db.lag_monitor, "lag", lambda: settings.REPLICA["MAX_LAG"] + 1)
+
+        assert get_read_alias() == DEFAULT_DB_ALIAS
+
+    @pytest.mark.django_db
+    def test_reads_inside_transactions_use_primary(self, replica):
+        """✅ Reads inside an atomic block should stay on the primary."""
+        with transaction.atomic():
+            assert get_read_alias() == DEFAULT_DB_ALIAS
+
+
+class TestReplicaLagMonitor:
+
+    def test_measurement_is_reused_within_interval(self, settings):
+        """✅ The lag should be measured at most once per check interval."""
+        settings.REPLICA = {**settings.REPLICA, "LAG_CHECK_INTERVAL": 60}
+        calls = []
+
+        class CountingMonitor(ReplicaLagMonitor):
+            def measure(self):
+                calls.append(1)
+                return 2.5
+
+        monitor = CountingMonitor()
+        assert monitor.lag() == monitor.lag() == 2.5
+        assert len(calls) == 1
+
+    def test_missing_replica_counts_as_lagging(self):
+        """❌ An unreachable replica should be treated as infinitely behind."""
+        assert ReplicaLagMonitor(alias="missing").measure() == float("inf")
+
+
+@pytest.mark.usefixtures("pin_scope")
+class TestPrimaryPinningMiddleware:
+
+    def test_write_sets_pin_cookie(self):
+        """✅ A request that writes should pin the client to the primary."""
+        def view(request):
+            PrimaryReplicaRouter().db_for_write(Semester)
+            return HttpResponse()
+
+        response = PrimaryPinningMiddleware(view)(RequestFactory().post("/"))
+
+        assert response.cookies[settings.REPLICA["PIN_COOKIE"]]["max-age"] == settings.REPLICA["PIN_SECONDS"]
+        assert not db.is_pinned_to_primary()
+
+    def test_cookie_pins_reads(self, replica):
+        """✅ A client that wrote recently should read from the primary."""
+        seen = []
+
+        def view(request):
+            seen.append(get_read_alias())
+            return HttpResponse()
+
+        factory = RequestFactory()
+        pinned = factory.get("/")
+        pinned.COOKIES[settings.REPLICA["PIN_COOKIE"]] = "1"
+        response = PrimaryPinningMiddleware(view)(pinned)
+        PrimaryPinningMiddleware(view)(factory.get("/"))
+
+        assert seen == [DEFAULT_DB_ALIAS, READ_REPLICA_ALIAS]
+        assert settings.REPLICA["PIN_COOKIE"] not in response.cookies
+
+
+@pytest.mark.skipif(READ_REPLICA_ALIAS not in settings.DATABASES, reason="needs a replica database alias")
+@pytest.mark.django_db(transaction=True, databases=[DEFAULT_DB_ALIAS, READ_REPLICA_ALIAS])
+def test_queries_are_routed_to_replica(pin_scope):
+    """✅ With two aliases configured, ORM reads outside transactions should run on the replica."""
+    from django.db import connections
+    from django.test.utils import CaptureQueriesContext
+
+    with CaptureQueriesContext(connections[READ_REPLICA_ALIAS]) as replica_queries:
+        list(Semester.objects.all())
+    assert Semester.objects.all().db == READ_REPLICA_ALIAS
+    assert replica_queries
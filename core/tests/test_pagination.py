@@ -0,0 +1,67 @@
+import pytest
+from django.core.exceptions import ValidationError
+from django.test import override_settings
+
+from academics.models import Semester
+from core.pagination import decode_cursor, encode_cursor, get_page_params, paginate_by_key
+
+
+class TestCursorParams:
+
+    def test_cursor_round_trip(self):
+        """✅ A decoded cursor should return the encoded key."""
+        assert decode_cursor(encode_cursor(42)) == 42
+
+    @pytest.mark.parametrize("cursor", ["not-a-cursor", encode_cursor(-1), "eyJ4IjoxfQ"])
+    def test_invalid_cursor(self, cursor):
+        """❌ Malformed cursors should raise ValidationError."""
+        with pytest.raises(ValidationError, match="Invalid cursor"):
+            decode_cursor(cursor)
+
+    @override_settings(LIST_PAGE_SIZE=25, LIST_MAX_PAGE_SIZE=50)
+    def test_page_params(self):
+        """✅ Should read the cursor and fall back to the default page size."""
+        assert get_page_params({}) == (None, 25)
+        assert get_page_params({"cursor": encode_cursor(7), "page_size": "10"}) == (7, 10)
+
+    @override_settings(LIST_MAX_PAGE_SIZE=50)
+    @pytest.mark.parametrize("page_size", ["0", "51", "ten"])
+    def test_invalid_page_size(self, page_size):
+        """❌ page_size must be an integer within the configured bounds."""
+        with pytest.raises(ValidationError, match="page_size"):
+            get_page_params({"page_size": page_size})
+
+
+@pytest.mark.django_db
+class TestPaginateByKey:
+
+    @pytest.fixture
+    def semesters(self):
+        return [Semester.objects.create(year=2000 + i, term=1) for i in range(5)]
+
+    def test_walks_every_page(self, semesters):
+        """✅ Following next_cursor should return every row exactly once, in key order."""
+        seen = []
+        after = None
+        while True:
+            page = paginate_by_key(Semester.objects.all(), after, 2)
+            seen += page.items
+            if page.next_cursor is None:
+                break
+            after = decode_cursor(page.next_cursor)
+
+        assert seen == semesters
+
+    def test_last_full_page_has_no_cursor(self, semesters):
+        """✅ A page that ends exactly at the last row should not return a cursor."""
+        page = paginate_by_key(Semester.objects.all(), semesters[2].pk, 2)
+
+        assert page.items == semesters[3:]
+        assert page.next_cursor is None
+
+    def test_query_does_not_use_offset(self, semesters, django_assert_num_queries):
+        """✅ Each page should be a single keyset query without OFFSET."""
+        with django_assert_num_queries(1) as queries:
+            paginate_by_key(Semester.objects.all(), semesters[1].pk, 2)
+
+        assert "OFFSET" not in queries.captured_queries[0]["sql"].upper()
@@ -0,0 +1,93 @@
+import logging
+
+import pytest
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from academics.models import Semester
+from core.query_metrics import QueryRecorder, fingerprint_sql, registry
+from users.models import User
+
+
+@pytest.fixture(autouse=True)
+def reset_registry():
+    registry.reset()
+    yield
+    registry.reset()
+
+
+@pytest.fixture
+def admin_client():
+    admin = User.objects.create_user(
+        username="metrics_admin", password="pass", role=User.Role.ADMIN
+    )
+    client = APIClient()
+    client.force_authenticate(user=admin)
+    return client
+
+
+class TestFingerprintSql:
+
+    def test_parameters_and_in_lists_are_normalized(self):
+        """✅ Statements differing only in parameters should share a fingerprint."""
+        first = fingerprint_sql('SELECT * FROM "t" WHERE "id" IN (%s, %s) AND "code" = \'A\'')
+        second = fingerprint_sql('SELECT * FROM  "t" WHERE "id" IN (%s) AND "code" = \'B\'')
+
+        assert first == second
+
+    def test_recorder_reports_duplicates(self):
+        """✅ The recorder should count queries and keep repeated fingerprints."""
+        recorder = QueryRecorder()
+        execute = lambda sql, params, many, context: None
+        recorder(execute, "SELECT 1 FROM t WHERE id = %s", [1], False, {})
+        recorder(execute, "SELECT 1 FROM t WHERE id = %s", [2], False, {})
+        recorder(execute, "SELECT 2", None, False, {})
+
+        assert recorder.count == 3
+        assert recorder.duplicates == {"SELECT ? FROM t WHERE id = %s": 2}
+        assert 'desc="3 queries"' in recorder.server_timing()
+        assert 'desc="1 duplicated"' in recorder.server_timing()
+
+
+@pytest.mark.django_db
+class TestQueryInstrumentationMiddleware:
+
+    def test_server_timing_header_and_registry(self, admin_client):
+        """✅ Responses should carry Server-Timing and be aggregated by URL name."""
+        Semester.objects.create(year=2025, term=1)
+
+        response = admin_client.get(reverse("semesters"))
+
+        assert response.status_code == 200
+        assert response["Server-Timing"].startswith("db;dur=")
+        stats = registry.snapshot()["semesters"]
+        assert stats["requests"] == 1
+        assert stats["max_queries"] >= 1
+
+    @override_settings(QUERY_METRICS={"BUDGETS": {"semesters": 0}})
+    def test_budget_exceeded_logs_warning(self, admin_client, caplog):
+        """❌ A request over its query budget should log a warning."""
+        with caplog.at_level(logging.WARNING, logger="core.query_metrics"):
+            admin_client.get(reverse("semesters"))
+
+        assert "semesters ran" in caplog.text
+        assert registry.snapshot()["semesters"]["over_budget"] == 1
+
+    @override_settings(QUERY_METRICS={"ENABLED": False})
+    def test_disabled(self, admin_client):
+        """✅ Nothing should be recorded when instrumentation is disabled."""
+        response = admin_client.get(reverse("semesters"))
+
+        assert "Server-Timing" not in response
+        assert registry.snapshot() == {}
+
+    def test_metrics_endpoint(self, admin_client):
+        """✅ Admins should be able to read the aggregated metrics."""
+        admin_client.get(reverse("semesters"))
+
+        response = admin_client.get(reverse("query-metrics"))
+
+        assert response.status_code == 200
+        assert "semesters" in response.data["data"]["endpoints"]
+        assert "caches" in response.data["data"]
@@ -0,0 +1,74 @@
+import json
+from decimal import Decimal
+
+import pytest
+from django.core.exceptions import ValidationError
+from rest_framework.test import APIClient
+
+from core.streaming import get_export_format, iter_json, iter_ndjson
+from users.models import User
+from users.services import user_services
+
+
+class TestEncoders:
+
+    def test_ndjson_one_object_per_line(self):
+        """✅ Each row should be encoded as one JSON line."""
+        body = b"".join(iter_ndjson(iter([{"id": 1}, {"id": 2, "grade": Decimal("4.5")}])))
+
+        assert [json.loads(line) for line in body.splitlines()] == [{"id": 1}, {"id": 2, "grade": "4.5"}]
+
+    def test_json_uses_api_envelope(self):
+        """✅ The JSON export should be a valid document with the usual envelope."""
+        body = b"".join(iter_json(iter([{"id": 1}, {"id": 2}])))
+
+        assert json.loads(body) == {"is_ok": True, "data": [{"id": 1}, {"id": 2}]}
+
+    def test_json_with_no_rows(self):
+        """✅ An empty export should still be valid JSON."""
+        assert json.loads(b"".join(iter_json(iter([])))) == {"is_ok": True, "data": []}
+
+    def test_rows_are_consumed_lazily(self):
+        """✅ Rows should be read while the response is written, not up front."""
+        consumed = []
+
+        def rows():
+            for i in range(3):
+                consumed.append(i)
+                yield {"id": i}
+
+        stream = iter_ndjson(rows())
+        assert consumed == []
+        list(stream)
+        assert consumed == [0, 1, 2]
+
+    def test_invalid_export_format(self):
+        """❌ Unsupported formats should raise ValidationError."""
+        assert get_export_format({}) is None
+        with pytest.raises(ValidationError, match="export must be one of"):
+            get_export_format({"export": "xml"})
+
+
+@pytest.mark.django_db
+class TestStudentExportView:
+
+    def test_students_ndjson_export(self):
+        """✅ ?export=ndjson should stream every student."""
+        for i in range(3):
+            user_services.create_user_student(
+                username=f"student{i}",
+                email=f"student{i}@example.com",
+                password="password123",
+                enrollment_number=f"A{i}",
+                program="Computer Science",
+            )
+        client = APIClient()
+        client.force_authenticate(User.objects.create_user(username="admin1", password="pass", role=User.Role.ADMIN))
+
+        response = client.get("/users/students/", {"export": "ndjson", "page_size": 1})
+
+        assert response.status_code == 200
+        assert response["Content-Type"] == "application/x-ndjson"
+        rows = [json.loads(line) for line in b"".join(response.streaming_content).splitlines()]
+        assert [row["username"] for row in rows] == ["student0", "student1", "student2"]
+        assert set(rows[0]) == {"user_id", "username", "email", "enrollment_number", "program"}
@@ -15,11 +15,14 @@ Including another URLconf
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
 from django.contrib import admin
+from django.contrib.staticfiles.urls import staticfiles_urlpatterns
 from django.urls import path, include, re_path
 from rest_framework import permissions
 from drf_yasg.views import get_schema_view
 from drf_yasg import openapi
 
+from core.views import QueryMetricsView
+
 schema_view = get_schema_view(
     openapi.Info(
         title="My API",
@@ -37,8 +40,13 @@ urlpatterns = [
     path('admin/', admin.site.urls),
     path('users/', include(('users.urls'))),
     path('academics/', include(('academics.urls'))),
+    path('metrics/queries/', QueryMetricsView.as_view(), name='query-metrics'),
     # swagger
     re_path(r'^swagger(?P<format>\.json|\.yaml)$', schema_view.without_ui(cache_timeout=0), name='schema-json'),
     path('swagger/', schema_view.with_ui('swagger', cache_timeout=0), name='schema-swagger-ui'),
     path('redoc/', schema_view.with_ui('redoc', cache_timeout=0), name='schema-redoc'),
 ]
+
+# runserver serves static files by itself; this keeps the Swagger and admin
+# assets working under gunicorn while DEBUG is on (it is a no-op otherwise).
+urlpatterns += staticfiles_urlpatterns()
@@ -0,0 +1,46 @@
+from rest_framework import status, permissions
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from drf_yasg.utils import swagger_auto_schema
+
+from core.cache import get_cache_stats
+from core.query_metrics import registry
+
+from users.permissions import IsAdmin
+
+
+class QueryMetricsView(APIView):
+    """
+    API View exposing the per-endpoint query metrics collected by
+    QueryInstrumentationMiddleware in this process.
+    Only admin users are allowed to access this endpoint.
+    """
+
+    permission_classes = [permissions.IsAuthenticated, IsAdmin]
+
+    @swagger_auto_schema(
+        operation_summary="Per-endpoint query metrics",
+        operation_description=(
+            "Returns, per URL name, the number of requests, average and maximum "
+            "query count and SQL time, requests over budget and the most duplicated "
+            "queries, plus the read-through cache counters. Metrics are per process."
+        ),
+        responses={200: "Metrics"},
+        tags=["Metrics"],
+    )
+    def get(self, request):
+        """Return the query metrics and cache counters of this process."""
+        return Response(
+            {"is_ok": True, "data": {"endpoints": registry.snapshot(), "caches": get_cache_stats()}},
+            status=status.HTTP_200_OK,
+        )
+
+    @swagger_auto_schema(
+        operation_summary="Reset the query metrics",
+        responses={204: "Metrics reset"},
+        tags=["Metrics"],
+    )
+    def delete(self, request):
+        """Reset the query metrics of this process."""
+        registry.reset()
+        return Response(status=status.HTTP_204_NO_CONTENT)
@@ -0,0 +1,61 @@
+"""
+Gunicorn settings for the production server.
+
+Run with `gunicorn -c gunicorn.conf.py core.wsgi:application`. Every value can
+be overridden with the environment variables below. To serve the async
+endpoints under ASGI, set GUNICORN_WORKER_CLASS=uvicorn_worker.UvicornWorker
+and load `core.asgi:application` instead.
+"""
+import multiprocessing
+import os
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:8000")
+
+# Import Django once in the master so workers fork with the app already loaded.
+preload_app = True
+
+# (2 x CPU) + 1 sync workers is the usual starting point for a database-bound app.
+workers = int(os.getenv("GUNICORN_WORKERS", multiprocessing.cpu_count() * 2 + 1))
+# More than one thread switches the sync worker to gthread.
+threads = int(os.getenv("GUNICORN_THREADS", "1"))
+worker_class = os.getenv("GUNICORN_WORKER_CLASS", "sync")
+
+# Restart each worker after this many requests (plus jitter, so they do not
+# all restart together) to bound memory growth.
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", "1000"))
+max_requests_jitter = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER", "100"))
+
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "30"))
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", "30"))
+keepalive = int(os.getenv("GUNICORN_KEEPALIVE", "5"))
+
+accesslog = os.getenv("GUNICORN_ACCESSLOG", "-")
+errorlog = "-"
+
+
+def on_starting(server):
+    """
+    Refuse to start several workers on caches that live inside each process:
+    a write handled by one worker would only invalidate that worker's copy.
+    """
+    if server.cfg.workers <= 1:
+        return
+
+    from core.cache import get_process_local_caches
+
+    local = get_process_local_caches()
+    if local:
+        raise RuntimeError(
+            f"{', '.join(local)} cannot be shared between {server.cfg.workers} workers. "
+            "Set REDIS_URL, or run a single worker with GUNICORN_WORKERS=1."
+        )
+
+
+def pre_fork(server, worker):
+    """
+    Close any database connection the master opened while loading the app,
+    so no worker inherits (and shares) its socket.
+    """
+    from django.db import connections
+
+    connections.close_all()
@@ -0,0 +1,112 @@
+import asyncio
+import json
+from urllib.parse import urlsplit
+
+
+class HttpError(Exception):
+    """
+    Raised when the server closes the connection or sends a malformed response.
+    """
+
+
+class HttpClient:
+    """
+    Minimal asyncio HTTP/1.1 client holding one keep-alive connection.
+
+    Only what the load harness needs: plain `http://`, JSON bodies,
+    Content-Length or chunked responses. One client serves one virtual user,
+    so requests on it are never concurrent.
+    """
+
+    def __init__(self, base_url: str, timeout: float = 30.0):
+        parts = urlsplit(base_url)
+        if parts.scheme != "http" or not parts.hostname:
+            raise ValueError("Only http:// base URLs are supported.")
+        self.host = parts.hostname
+        self.port = parts.port or 80
+        self.prefix = parts.path.rstrip("/")
+        self.timeout = timeout
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+
+    async def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except OSError:
+                pass
+        self._reader = self._writer = None
+
+    async def request(
+        self, method: str, path: str, json_body: dict | None = None, token: str | None = None
+    ) -> tuple[int, bytes]:
+        """
+        Send a request and read the whole response.
+
+        Returns:
+            tuple[int, bytes]: Status code and body.
+
+        Raises:
+            HttpError, OSError, asyncio.TimeoutError: On transport failures;
+            the connection is dropped and reopened by the next request.
+        """
+        try:
+            return await asyncio.wait_for(self._request(method, path, json_body, token), self.timeout)
+        except BaseException:
+            await self.close()
+            raise
+
+    async def _request(self, method, path, json_body, token):
+        if self._writer is None:
+            self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+
+        body = json.dumps(json_body).encode() if json_body is not None else b""
+        headers = [
+            f"{method} {self.prefix}{path} HTTP/1.1",
+            f"Host: {self.host}:{self.port}",
+            "Accept: application/json",
+            f"Content-Length: {len(body)}",
+        ]
+        if json_body is not None:
+            headers.append("Content-Type: application/json")
+        if token:
+            headers.append(f"Authorization: Bearer {token}")
+        self._writer.write(("\r\n".join(headers) + "\r\n\r\n").encode() + body)
+        await self._writer.drain()
+
+        status_line = await self._reader.readline()
+        if not status_line:
+            raise HttpError("Connection closed by server.")
+        try:
+            status = int(status_line.split()[1])
+        except (IndexError, ValueError):
+            raise HttpError(f"Malformed status line: {status_line!r}")
+
+        response_headers = {}
+        while True:
+            line = await self._reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            response_headers[name.strip().lower()] = value.strip()
+
+        if response_headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int((await self._reader.readline()).split(b";")[0], 16)
+                if size == 0:
+                    await self._reader.readline()
+                    break
+                chunks.append(await self._reader.readexactly(size))
+                await self._reader.readline()
+            payload = b"".join(chunks)
+        elif "content-length" in response_headers:
+            payload = await self._reader.readexactly(int(response_headers["content-length"]))
+        else:
+            payload = await self._reader.read()
+            response_headers["connection"] = "close"
+
+        if response_headers.get("connection", "").lower() == "close":
+            await self.close()
+        return status, payload
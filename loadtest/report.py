@@ -0,0 +1,72 @@
+import math
+import re
+from collections import Counter, defaultdict
+from typing import NamedTuple
+
+_NUMBERS = re.compile(r"\d+")
+
+
+class Sample(NamedTuple):
+    scenario: str
+    status: int | None
+    latency: float
+    error: str | None
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """
+    Nearest-rank percentile of an already sorted list.
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def normalize_error(message: str) -> str:
+    """
+    Replace numbers in an error message so that errors of the same kind
+    (e.g. credit-limit errors with different totals) are counted together.
+    """
+    return _NUMBERS.sub("N", message)[:120]
+
+
+def summarize(samples: list[Sample], elapsed: float) -> dict:
+    """
+    Build the load test report: throughput, latency percentiles per scenario
+    and a breakdown of error codes and messages.
+    """
+    by_scenario: dict[str, list[Sample]] = defaultdict(list)
+    for sample in samples:
+        by_scenario[sample.scenario].append(sample)
+
+    scenarios = {}
+    for scenario, scenario_samples in sorted(by_scenario.items()):
+        latencies = sorted(sample.latency for sample in scenario_samples)
+        scenarios[scenario] = {
+            "requests": len(scenario_samples),
+            "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+            "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+            "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+            "max_ms": round(latencies[-1] * 1000, 2),
+            "status_codes": dict(sorted(
+                Counter(str(sample.status or "connection error") for sample in scenario_samples).items()
+            )),
+        }
+
+    all_latencies = sorted(sample.latency for sample in samples)
+    errors = Counter(
+        f"{sample.scenario} {sample.status or '-'}: {normalize_error(sample.error)}"
+        for sample in samples
+        if sample.error
+    )
+    return {
+        "requests": len(samples),
+        "elapsed_s": round(elapsed, 3),
+        "throughput_rps": round(len(samples) / elapsed, 2) if elapsed else 0.0,
+        "p50_ms": round(percentile(all_latencies, 50) * 1000, 2),
+        "p95_ms": round(percentile(all_latencies, 95) * 1000, 2),
+        "p99_ms": round(percentile(all_latencies, 99) * 1000, 2),
+        "scenarios": scenarios,
+        "errors": dict(errors.most_common()),
+    }
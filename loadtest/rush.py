@@ -0,0 +1,158 @@
+import asyncio
+import json
+import random
+import time
+from typing import NamedTuple
+
+from .http import HttpClient, HttpError
+from .report import Sample
+
+LOGIN_PATH = "/users/login/"
+ENROLLMENT_PATH = "/academics/enrollments/"
+COURSES_PATH = "/academics/courses/"
+TEACHER_COURSES_PATH = "/academics/teacher-courses/"
+# Async (ASGI) versions of the two read endpoints
+ASYNC_COURSES_PATH = "/academics/async/courses/"
+ASYNC_TEACHER_COURSES_PATH = "/academics/async/teacher-courses/"
+
+SCENARIOS = ("enroll", "catalog", "teacher")
+
+
+class Actor(NamedTuple):
+    user_id: int
+    username: str
+    token: str
+
+
+class RushPlan(NamedTuple):
+    """
+    Everything the virtual users need, resolved before the rush starts.
+    """
+    semester_id: int
+    course_ids: list[int]
+    students: list[Actor]
+    teachers: list[Actor]
+    admin: Actor | None
+    mix: dict[str, int]
+    async_reads: bool = False
+
+
+def _error_message(status: int, payload: bytes) -> str:
+    try:
+        body = json.loads(payload)
+    except ValueError:
+        return f"HTTP {status}"
+    if isinstance(body, dict):
+        for key in ("error", "errors", "detail"):
+            if key in body:
+                return str(body[key])
+    return f"HTTP {status}"
+
+
+async def login(
+    base_url: str, users: list[tuple[int, str]], password: str, concurrency: int, timeout: float
+) -> tuple[list[Actor], list[str]]:
+    """
+    Obtain a JWT access token for every (id, username) pair.
+
+    Returns:
+        tuple[list[Actor], list[str]]: Logged in actors and failure messages.
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+    for user in users:
+        queue.put_nowait(user)
+    actors, failures = [], []
+
+    async def worker():
+        client = HttpClient(base_url, timeout)
+        try:
+            while not queue.empty():
+                user_id, username = queue.get_nowait()
+                try:
+                    status, payload = await client.request(
+                        "POST", LOGIN_PATH, {"username": username, "password": password}
+                    )
+                except (HttpError, OSError, asyncio.TimeoutError) as e:
+                    failures.append(f"{username}: {type(e).__name__}")
+                    continue
+                if status != 200:
+                    failures.append(f"{username}: {_error_message(status, payload)}")
+                    continue
+                actors.append(Actor(user_id, username, json.loads(payload)["access"]))
+        finally:
+            await client.close()
+
+    await asyncio.gather(*(worker() for _ in range(max(1, min(concurrency, len(users))))))
+    actors.sort(key=lambda actor: actor.user_id)
+    return actors, failures
+
+
+async def _send(client: HttpClient, scenario: str, plan: RushPlan, rng: random.Random) -> tuple[int, bytes]:
+    if scenario == "enroll":
+        student = rng.choice(plan.students)
+        return await client.request(
+            "POST",
+            ENROLLMENT_PATH,
+            {
+                "student_id": student.user_id,
+                "semester_id": plan.semester_id,
+                "course_id": rng.choice(plan.course_ids),
+            },
+            student.token,
+        )
+    if scenario == "catalog":
+        path = ASYNC_COURSES_PATH if plan.async_reads else COURSES_PATH
+        return await client.request("GET", path, token=plan.admin.token)
+    teacher = rng.choice(plan.teachers)
+    path = ASYNC_TEACHER_COURSES_PATH if plan.async_reads else TEACHER_COURSES_PATH
+    return await client.request("GET", f"{path}?semester_id={plan.semester_id}", token=teacher.token)
+
+
+async def run_rush(
+    base_url: str,
+    plan: RushPlan,
+    concurrency: int,
+    duration: float,
+    max_requests: int | None = None,
+    seed: int = 1,
+    timeout: float = 30.0,
+) -> tuple[list[Sample], float]:
+    """
+    Drive the scenario mix with `concurrency` virtual users until `duration`
+    seconds pass or `max_requests` requests were sent.
+
+    Every virtual user keeps its own connection and its own seeded random
+    generator, so the sequence of requests is reproducible for a given seed.
+
+    Returns:
+        tuple[list[Sample], float]: One sample per request and the elapsed time.
+    """
+    scenarios = [scenario for scenario, weight in plan.mix.items() if weight > 0]
+    weights = [plan.mix[scenario] for scenario in scenarios]
+    samples: list[Sample] = []
+    sent = 0
+    started = time.perf_counter()
+    deadline = started + duration
+
+    async def virtual_user(index: int):
+        nonlocal sent
+        rng = random.Random(seed * 100_003 + index)
+        client = HttpClient(base_url, timeout)
+        try:
+            while time.perf_counter() < deadline and (max_requests is None or sent < max_requests):
+                sent += 1
+                scenario = rng.choices(scenarios, weights)[0]
+                start = time.perf_counter()
+                try:
+                    status, payload = await _send(client, scenario, plan, rng)
+                except (HttpError, OSError, asyncio.TimeoutError) as e:
+                    samples.append(Sample(scenario, None, time.perf_counter() - start, type(e).__name__))
+                    continue
+                latency = time.perf_counter() - start
+                error = _error_message(status, payload) if status >= 400 else None
+                samples.append(Sample(scenario, status, latency, error))
+        finally:
+            await client.close()
+
+    await asyncio.gather(*(virtual_user(index) for index in range(concurrency)))
+    return samples, time.perf_counter() - started
@@ -1,8 +1,16 @@
+from typing import AsyncIterator, Iterator
+
+from django.conf import settings
 from django.db import transaction
+from django.db.models import F
 from django.core.exceptions import ObjectDoesNotExist, ValidationError
 
+from core.cache import ReadThroughCache
+from core.pagination import KeysetPage, apaginate_by_key, paginate_by_key
 from ..models import User, StudentProfile, TeacherProfile
 
+user_cache = ReadThroughCache("user")
+
 @transaction.atomic
 def create_user_student(username: str, email: str, password: str, **profile_data) -> User:
     """
@@ -72,12 +80,32 @@ def get_user_by_id(user_id: int) -> User:
     if not isinstance(user_id, int) or user_id <= 0:
         raise ValidationError("Invalid user ID provided.")
 
-    try:
-        user = User.objects.get(id=user_id)
-    except ObjectDoesNotExist:
-        raise ValidationError(f"User with id={user_id} does not exist.")
+    def load() -> User:
+        try:
+            return User.objects.get(id=user_id)
+        except ObjectDoesNotExist:
+            raise ValidationError(f"User with id={user_id} does not exist.")
 
-    return user
+    return user_cache.get_or_load(user_id, load)
+
+
+async def aget_user_by_id(user_id: int) -> User:
+    """
+    Async counterpart of `get_user_by_id`, sharing its cache.
+
+    Raises:
+        ValidationError: If the user_id is invalid or the user does not exist.
+    """
+    if not isinstance(user_id, int) or user_id <= 0:
+        raise ValidationError("Invalid user ID provided.")
+
+    async def load() -> User:
+        try:
+            return await User.objects.aget(id=user_id)
+        except ObjectDoesNotExist:
+            raise ValidationError(f"User with id={user_id} does not exist.")
+
+    return await user_cache.aget_or_load(user_id, load)
 
 # --- STUDENTS ---
 
@@ -87,10 +115,106 @@ def list_students() -> list[StudentProfile]:
     """
     return list(StudentProfile.objects.select_related("user").all())
 
+
+async def alist_students() -> list[StudentProfile]:
+    """
+    Async counterpart of `list_students`.
+    """
+    return [profile async for profile in StudentProfile.objects.select_related("user").all()]
+
+
+def list_students_page(after_id: int | None = None, page_size: int = 100) -> KeysetPage:
+    """
+    Retrieve one page of student profiles ordered by ID.
+
+    Args:
+        after_id (int | None): ID of the last profile of the previous page.
+        page_size (int): Maximum number of profiles to return.
+
+    Returns:
+        KeysetPage: The profiles and the cursor of the next page, if any.
+    """
+    return paginate_by_key(StudentProfile.objects.select_related("user"), after_id, page_size)
+
+
+async def alist_students_page(after_id: int | None = None, page_size: int = 100) -> KeysetPage:
+    """
+    Async counterpart of `list_students_page`.
+    """
+    return await apaginate_by_key(StudentProfile.objects.select_related("user"), after_id, page_size)
+
+
+def iter_students_values(chunk_size: int | None = None) -> Iterator[dict]:
+    """
+    Stream every student profile as a plain dict, reading `chunk_size` rows per round trip.
+    """
+    return _students_values().iterator(chunk_size=chunk_size or settings.EXPORT_CHUNK_SIZE)
+
+
+def aiter_students_values(chunk_size: int | None = None) -> AsyncIterator[dict]:
+    """
+    Async counterpart of `iter_students_values`.
+    """
+    return _students_values().aiterator(chunk_size=chunk_size or settings.EXPORT_CHUNK_SIZE)
+
+
+def _students_values():
+    return StudentProfile.objects.order_by("id").values(
+        "user_id", "enrollment_number", "program", username=F("user__username"), email=F("user__email")
+    )
+
 # --- TEACHERS ---
 
 def list_teachers() -> list[TeacherProfile]:
     """
     Retrieve all teacher profiles.
     """
-    return list(TeacherProfile.objects.select_related("user").all())
\ No newline at end of file
+    return list(TeacherProfile.objects.select_related("user").all())
+
+
+async def alist_teachers() -> list[TeacherProfile]:
+    """
+    Async counterpart of `list_teachers`.
+    """
+    return [profile async for profile in TeacherProfile.objects.select_related("user").all()]
+
+
+def list_teachers_page(after_id: int | None = None, page_size: int = 100) -> KeysetPage:
+    """
+    Retrieve one page of teacher profiles ordered by ID.
+
+    Args:
+        after_id (int | None): ID of the last profile of the previous page.
+        page_size (int): Maximum number of profiles to return.
+
+    Returns:
+        KeysetPage: The profiles and the cursor of the next page, if any.
+    """
+    return paginate_by_key(TeacherProfile.objects.select_related("user"), after_id, page_size)
+
+
+async def alist_teachers_page(after_id: int | None = None, page_size: int = 100) -> KeysetPage:
+    """
+    Async counterpart of `list_teachers_page`.
+    """
+    return await apaginate_by_key(TeacherProfile.objects.select_related("user"), after_id, page_size)
+
+
+def iter_teachers_values(chunk_size: int | None = None) -> Iterator[dict]:
+    """
+    Stream every teacher profile as a plain dict, reading `chunk_size` rows per round trip.
+    """
+    return _teachers_values().iterator(chunk_size=chunk_size or settings.EXPORT_CHUNK_SIZE)
+
+
+def aiter_teachers_values(chunk_size: int | None = None) -> AsyncIterator[dict]:
+    """
+    Async counterpart of `iter_teachers_values`.
+    """
+    return _teachers_values().aiterator(chunk_size=chunk_size or settings.EXPORT_CHUNK_SIZE)
+
+
+def _teachers_values():
+    return TeacherProfile.objects.order_by("id").values(
+        "user_id", "department", username=F("user__username"), email=F("user__email")
+    )
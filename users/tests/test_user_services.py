@@ -5,6 +5,7 @@ from django.contrib.auth import get_user_model
 
 from users.models import StudentProfile, TeacherProfile  
 from users.services import user_services
+from core.pagination import decode_cursor
 
 User = get_user_model()
 
@@ -103,4 +104,26 @@ class TestCreateUserTeacher:
                 department=None,  
             )
 
-        assert not User.objects.filter(username="broken_teacher").exists()
\ No newline at end of file
+        assert not User.objects.filter(username="broken_teacher").exists()
+
+
+@pytest.mark.django_db
+class TestListStudentsPage:
+    def test_pages_follow_cursor(self):
+        """Should return profiles page by page with a cursor for the next one."""
+        for i in range(3):
+            user_services.create_user_student(
+                username=f"student{i}",
+                email=f"student{i}@example.com",
+                password="password123",
+                enrollment_number=f"A{i}",
+                program="Computer Science",
+            )
+
+        first = user_services.list_students_page(page_size=2)
+        assert [p.user.username for p in first.items] == ["student0", "student1"]
+        assert first.next_cursor is not None
+
+        second = user_services.list_students_page(after_id=decode_cursor(first.next_cursor), page_size=2)
+        assert [p.user.username for p in second.items] == ["student2"]
+        assert second.next_cursor is None
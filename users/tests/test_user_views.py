@@ -3,6 +3,7 @@ from rest_framework.test import APIClient
 from django.urls import reverse
 from unittest.mock import patch
 from users.models import User
+from users.services import user_services
 
 
 @pytest.mark.django_db
@@ -92,3 +93,54 @@ class TestTeacherRegisterView:
         assert response.status_code == 400
         assert response.data["is_ok"] is False
         assert "department" in response.data["errors"]
+
+
+@pytest.mark.django_db
+class TestProfileListViews:
+    """Tests for StudentListView and TeacherListView."""
+
+    @pytest.fixture
+    def client(self):
+        admin = User.objects.create_user(username="admin1", password="pass", role=User.Role.ADMIN)
+        client = APIClient()
+        client.force_authenticate(admin)
+        return client
+
+    @pytest.fixture
+    def students(self):
+        for i in range(3):
+            user_services.create_user_student(
+                username=f"student{i}",
+                email=f"student{i}@example.com",
+                password="password123",
+                enrollment_number=f"ENR{i}",
+                program="Computer Science",
+            )
+
+    def test_student_list_without_page_params_returns_everything(self, client, students):
+        """✅ Without cursor or page_size the full list should be returned, as before pagination."""
+        response = client.get(reverse("list-students"))
+
+        assert response.status_code == 200
+        assert len(response.data["data"]) == 3
+        assert "next_cursor" not in response.data
+
+    def test_student_list_with_page_size_is_paginated(self, client, students):
+        """✅ Sending page_size should return one page and its next_cursor."""
+        response = client.get(reverse("list-students"), {"page_size": 2})
+
+        assert response.status_code == 200
+        assert len(response.data["data"]) == 2
+        assert response.data["next_cursor"] is not None
+
+    def test_teacher_list_without_page_params_returns_everything(self, client):
+        """✅ The teacher list should also only paginate on request."""
+        user_services.create_user_teacher(
+            username="teacher1", email="teacher1@example.com", password="password123", department="CS"
+        )
+
+        response = client.get(reverse("list-teachers"))
+
+        assert response.status_code == 200
+        assert len(response.data["data"]) == 1
+        assert "next_cursor" not in response.data
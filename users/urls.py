@@ -6,7 +6,12 @@ from rest_framework_simplejwt.views import (
 )
 
 from .views.user_register_views import StudentRegisterView, TeacherRegisterView
-from .views.profile_views import StudentListView, TeacherListView
+from .views.profile_views import (
+    AsyncStudentListView,
+    AsyncTeacherListView,
+    StudentListView,
+    TeacherListView,
+)
 
 urlpatterns = [
     path('login/', TokenObtainPairView.as_view(), name='token_obtain_pair'),
@@ -15,4 +20,7 @@ urlpatterns = [
     path("register/teacher/", TeacherRegisterView.as_view(), name="register-teacher"),
     path("students/", StudentListView.as_view(), name="list-students"),
     path("teachers/", TeacherListView.as_view(), name="list-teachers"),
+    # Async versions of the read endpoints, for ASGI deployments
+    path("async/students/", AsyncStudentListView.as_view(), name="list-students-async"),
+    path("async/teachers/", AsyncTeacherListView.as_view(), name="list-teachers-async"),
 ]
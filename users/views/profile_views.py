@@ -2,29 +2,71 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status, permissions
 from drf_yasg.utils import swagger_auto_schema
+from django.core.exceptions import ValidationError
 
+from core.async_views import AsyncAPIView, json_response
+from core.pagination import CURSOR_QUERY_PARAMETERS, get_page_params, wants_pagination
+from core.streaming import EXPORT_QUERY_PARAMETER, get_export_format, streaming_export_response
 from users.serializers.profile_serializers import (
     StudentProfileSerializer,
     TeacherProfileSerializer,
 )
-from users.services import list_students, list_teachers
+from users.services import (
+    alist_students,
+    alist_students_page,
+    alist_teachers,
+    alist_teachers_page,
+    aiter_students_values,
+    aiter_teachers_values,
+    list_students,
+    list_students_page,
+    list_teachers,
+    list_teachers_page,
+    iter_students_values,
+    iter_teachers_values,
+)
 from ..permissions import IsAdmin
 
 
 class StudentListView(APIView):
     """
-    API view to list all students. Only accessible by admin users.
+    API view to list all students, or one page of them. Only accessible by admin users.
     """
     permission_classes = [permissions.IsAuthenticated, IsAdmin]
 
     @swagger_auto_schema(
         responses={200: StudentProfileSerializer(many=True)},
         operation_summary="Listar estudiantes",
-        operation_description="Devuelve una lista de todos los estudiantes registrados en el sistema."
+        operation_description=(
+            "Devuelve todos los estudiantes registrados en el sistema. "
+            "Si se envía `cursor` o `page_size`, se devuelve una página y `next_cursor` "
+            "para pedir la siguiente. "
+            "Con `export=ndjson` o `export=json` se transmiten todos los registros."
+        ),
+        manual_parameters=CURSOR_QUERY_PARAMETERS + [EXPORT_QUERY_PARAMETER],
     )
     def get(self, request):
-        students = list_students()
-        serializer = StudentProfileSerializer(students, many=True)
+        try:
+            after_id, page_size = get_page_params(request.query_params)
+            export_format = get_export_format(request.query_params)
+        except ValidationError as e:
+            return Response(
+                {"is_ok": False, "error": str(e)},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        if export_format:
+            return streaming_export_response(iter_students_values(), export_format, filename="students")
+
+        if wants_pagination(request.query_params):
+            page = list_students_page(after_id=after_id, page_size=page_size)
+            serializer = StudentProfileSerializer(page.items, many=True)
+            return Response(
+                {"is_ok": True, "data": serializer.data, "next_cursor": page.next_cursor},
+                status=status.HTTP_200_OK
+            )
+
+        serializer = StudentProfileSerializer(list_students(), many=True)
         return Response(
             {"is_ok": True, "data": serializer.data},
             status=status.HTTP_200_OK
@@ -33,19 +75,112 @@ class StudentListView(APIView):
 
 class TeacherListView(APIView):
     """
-    API view to list all teachers. Only accessible by admin users.
+    API view to list all teachers, or one page of them. Only accessible by admin users.
     """
     permission_classes = [permissions.IsAuthenticated, IsAdmin]
 
     @swagger_auto_schema(
         responses={200: TeacherProfileSerializer(many=True)},
         operation_summary="Listar profesores",
-        operation_description="Devuelve una lista de todos los profesores registrados en el sistema."
+        operation_description=(
+            "Devuelve todos los profesores registrados en el sistema. "
+            "Si se envía `cursor` o `page_size`, se devuelve una página y `next_cursor` "
+            "para pedir la siguiente. "
+            "Con `export=ndjson` o `export=json` se transmiten todos los registros."
+        ),
+        manual_parameters=CURSOR_QUERY_PARAMETERS + [EXPORT_QUERY_PARAMETER],
     )
     def get(self, request):
-        teachers = list_teachers()
-        serializer = TeacherProfileSerializer(teachers, many=True)
+        try:
+            after_id, page_size = get_page_params(request.query_params)
+            export_format = get_export_format(request.query_params)
+        except ValidationError as e:
+            return Response(
+                {"is_ok": False, "error": str(e)},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        if export_format:
+            return streaming_export_response(iter_teachers_values(), export_format, filename="teachers")
+
+        if wants_pagination(request.query_params):
+            page = list_teachers_page(after_id=after_id, page_size=page_size)
+            serializer = TeacherProfileSerializer(page.items, many=True)
+            return Response(
+                {"is_ok": True, "data": serializer.data, "next_cursor": page.next_cursor},
+                status=status.HTTP_200_OK
+            )
+
+        serializer = TeacherProfileSerializer(list_teachers(), many=True)
         return Response(
             {"is_ok": True, "data": serializer.data},
             status=status.HTTP_200_OK
         )
+
+
+class AsyncStudentListView(AsyncAPIView):
+    """
+    Async version of `StudentListView` for ASGI deployments. Only accessible by admin users.
+    """
+    permission_classes = [permissions.IsAuthenticated, IsAdmin]
+
+    async def get(self, request):
+        try:
+            after_id, page_size = get_page_params(request.query_params)
+            export_format = get_export_format(request.query_params)
+        except ValidationError as e:
+            return json_response(
+                {"is_ok": False, "error": str(e)},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        if export_format:
+            return streaming_export_response(aiter_students_values(), export_format, filename="students")
+
+        if wants_pagination(request.query_params):
+            page = await alist_students_page(after_id=after_id, page_size=page_size)
+            serializer = StudentProfileSerializer(page.items, many=True)
+            return json_response(
+                {"is_ok": True, "data": serializer.data, "next_cursor": page.next_cursor},
+                status=status.HTTP_200_OK
+            )
+
+        serializer = StudentProfileSerializer(await alist_students(), many=True)
+        return json_response(
+            {"is_ok": True, "data": serializer.data},
+            status=status.HTTP_200_OK
+        )
+
+
+class AsyncTeacherListView(AsyncAPIView):
+    """
+    Async version of `TeacherListView` for ASGI deployments. Only accessible by admin users.
+    """
+    permission_classes = [permissions.IsAuthenticated, IsAdmin]
+
+    async def get(self, request):
+        try:
+            after_id, page_size = get_page_params(request.query_params)
+            export_format = get_export_format(request.query_params)
+        except ValidationError as e:
+            return json_response(
+                {"is_ok": False, "error": str(e)},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        if export_format:
+            return streaming_export_response(aiter_teachers_values(), export_format, filename="teachers")
+
+        if wants_pagination(request.query_params):
+            page = await alist_teachers_page(after_id=after_id, page_size=page_size)
+            serializer = TeacherProfileSerializer(page.items, many=True)
+            return json_response(
+                {"is_ok": True, "data": serializer.data, "next_cursor": page.next_cursor},
+                status=status.HTTP_200_OK
+            )
+
+        serializer = TeacherProfileSerializer(await alist_teachers(), many=True)
+        return json_response(
+            {"is_ok": True, "data": serializer.data},
+            status=status.HTTP_200_OK
+        )